@@ -0,0 +1,63 @@
+"""Indexes for job listing, company page and tag queries
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 09:30:00.000000
+
+Each index serves a JobService query:
+
+- ix_jobs_active_created: public listings, search and summaries, filtered on
+  is_active and ordered by (created_at DESC, id DESC), offset or keyset paged.
+- ix_jobs_company_created: a company's jobs, newest first. It leads with
+  company_id, so equality lookups on the foreign key alone (a company's job ids and
+  counts, and the cascade when a company is deleted) use it as they used
+  ix_jobs_company_id, which is dropped. tests/test_query_plans.py checks the plans.
+- ix_jobs_type_level: job_type and job_level filters.
+- ix_job_tags_tag_job: tag filters and facets, which go from tags to jobs; the
+  primary key leads with job_id.
+
+On PostgreSQL the indexes are built concurrently, so writes continue meanwhile.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_jobs_active_created', 'jobs',
+            ['is_active', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_jobs_company_created', 'jobs',
+            ['company_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_jobs_type_level', 'jobs', ['job_type', 'job_level'],
+            postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_job_tags_tag_job', 'job_tags', ['tag_id', 'job_id'],
+            postgresql_concurrently=True
+        )
+        op.drop_index('ix_jobs_company_id', table_name='jobs', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_jobs_company_id', 'jobs', ['company_id'], postgresql_concurrently=True
+        )
+        op.drop_index('ix_job_tags_tag_job', table_name='job_tags', postgresql_concurrently=True)
+        op.drop_index('ix_jobs_type_level', table_name='jobs', postgresql_concurrently=True)
+        op.drop_index('ix_jobs_company_created', table_name='jobs', postgresql_concurrently=True)
+        op.drop_index('ix_jobs_active_created', table_name='jobs', postgresql_concurrently=True)
@@ -0,0 +1,39 @@
+"""Index for salary range filters
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 10:00:00.000000
+
+A job advertises the range coalesce(salary_min, salary_max) to
+coalesce(salary_max, salary_min), and a salary filter matches the ranges
+overlapping the requested one. The index holds both ends, upper end first, so
+a minimum salary filter is a range scan and the lower end is checked from the
+index.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_jobs_active_salary', 'jobs',
+            [
+                'is_active',
+                sa.text('coalesce(salary_max, salary_min)'),
+                sa.text('coalesce(salary_min, salary_max)'),
+            ],
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_jobs_active_salary', table_name='jobs', postgresql_concurrently=True)
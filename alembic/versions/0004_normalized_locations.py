@@ -0,0 +1,143 @@
+"""Normalized locations for indexed location filters
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 11:00:00.000000
+
+Location filters used to be a leading-wildcard ILIKE on jobs.location, which
+scans every job. Each distinct location text is now normalized to a canonical
+place in the locations table (see app.search.places), jobs point at it through
+location_id, and a filter resolves to a few location ids looked up by key,
+city, region or country.
+
+Existing jobs are backfilled through a temporary table mapping each distinct
+location text to its place, so the jobs table is rewritten in a single pass.
+"""
+from typing import NamedTuple, Optional
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+class _Place(NamedTuple):
+    name: str
+    key: str
+    city: str
+    region: Optional[str]
+    country: Optional[str]
+
+
+def _parse_location(location: Optional[str]) -> Optional[_Place]:
+    # Frozen copy of app.search.places.parse_location as of this revision, so later
+    # changes to the application do not change what this migration writes
+    parts = [' '.join(part.split()) for part in (location or '').split(',')]
+    parts = [part for part in parts if part]
+    if not parts:
+        return None
+    name = ', '.join(parts)
+    keys = [part.casefold() for part in parts]
+    return _Place(
+        name=name,
+        key=name.casefold(),
+        city=keys[0],
+        region=', '.join(keys[1:-1]) or None,
+        country=keys[-1] if len(keys) > 1 else None,
+    )
+
+
+def _backfill() -> None:
+    bind = op.get_bind()
+    texts = bind.execute(
+        sa.text('SELECT DISTINCT location FROM jobs WHERE location IS NOT NULL')
+    ).scalars().all()
+    places = {text: _parse_location(text) for text in texts}
+    places = {text: place for text, place in places.items() if place is not None}
+    if not places:
+        return
+
+    locations = sa.table(
+        'locations',
+        sa.column('id', sa.Integer), sa.column('name', sa.String), sa.column('key', sa.String),
+        sa.column('city', sa.String), sa.column('region', sa.String),
+        sa.column('country', sa.String),
+    )
+    # Spellings of one place share a row, named after the first in sort order
+    unique = {}
+    for place in sorted(places.values()):
+        unique.setdefault(place.key, place)
+    op.bulk_insert(locations, [place._asdict() for place in unique.values()])
+    ids = dict(bind.execute(sa.select(locations.c.key, locations.c.id)).all())
+
+    backfill = sa.table(
+        'location_backfill',
+        sa.column('location', sa.String), sa.column('location_id', sa.Integer),
+    )
+    op.create_table(
+        'location_backfill',
+        sa.Column('location', sa.String(length=255), primary_key=True),
+        sa.Column('location_id', sa.Integer(), nullable=False),
+    )
+    op.bulk_insert(backfill, [
+        {'location': text, 'location_id': ids[place.key]} for text, place in places.items()
+    ])
+    op.execute(
+        'UPDATE jobs SET location_id = (SELECT location_id FROM location_backfill '
+        'WHERE location_backfill.location = jobs.location) WHERE location IS NOT NULL'
+    )
+    op.drop_table('location_backfill')
+
+
+def upgrade() -> None:
+    op.create_table('locations',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('key', sa.String(length=255), nullable=False),
+        sa.Column('city', sa.String(length=255), nullable=False),
+        sa.Column('region', sa.String(length=255), nullable=True),
+        sa.Column('country', sa.String(length=255), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(),
+                  nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(),
+                  nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_locations_id'), 'locations', ['id'], unique=False)
+    op.create_index(op.f('ix_locations_key'), 'locations', ['key'], unique=True)
+    op.create_index(op.f('ix_locations_city'), 'locations', ['city'], unique=False)
+    op.create_index(op.f('ix_locations_region'), 'locations', ['region'], unique=False)
+    op.create_index(op.f('ix_locations_country'), 'locations', ['country'], unique=False)
+
+    if op.get_bind().dialect.name == 'sqlite':
+        # SQLite adds a column's REFERENCES clause in place but not a separate constraint,
+        # and batch mode would lose the expression index on jobs
+        op.execute('ALTER TABLE jobs ADD COLUMN location_id INTEGER REFERENCES locations (id)')
+    else:
+        op.add_column('jobs', sa.Column('location_id', sa.Integer(), nullable=True))
+        op.create_foreign_key(
+            'fk_jobs_location_id_locations', 'jobs', 'locations', ['location_id'], ['id']
+        )
+    _backfill()
+    op.create_index(
+        'ix_jobs_location_created', 'jobs',
+        ['location_id', sa.text('created_at DESC'), sa.text('id DESC')]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_location_created', table_name='jobs')
+    if op.get_bind().dialect.name != 'sqlite':
+        op.drop_constraint('fk_jobs_location_id_locations', 'jobs', type_='foreignkey')
+    op.drop_column('jobs', 'location_id')
+    op.drop_index(op.f('ix_locations_country'), table_name='locations')
+    op.drop_index(op.f('ix_locations_region'), table_name='locations')
+    op.drop_index(op.f('ix_locations_city'), table_name='locations')
+    op.drop_index(op.f('ix_locations_key'), table_name='locations')
+    op.drop_index(op.f('ix_locations_id'), table_name='locations')
+    op.drop_table('locations')
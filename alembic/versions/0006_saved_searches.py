@@ -0,0 +1,75 @@
+"""Saved searches and their alerts
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 18:00:00.000000
+
+Users' saved job filters, matched against jobs as they are posted or changed (see
+app.search.percolator), and the alerts recording each match once.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '0006'
+down_revision = '0005'
+branch_labels = None
+depends_on = None
+
+# The enum types already exist for jobs.job_type and jobs.job_level
+JOB_TYPE = postgresql.ENUM('REMOTE', 'HYBRID', 'ONSITE', name='jobtype', create_type=False)
+JOB_LEVEL = postgresql.ENUM(
+    'ENTRY', 'MID', 'SENIOR', 'LEAD', 'EXECUTIVE', name='joblevel', create_type=False
+)
+
+
+def upgrade() -> None:
+    op.create_table('saved_searches',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('tags', sa.JSON(), nullable=False),
+        sa.Column('tag_mode', sa.String(length=10), nullable=False),
+        sa.Column('location', sa.String(length=255), nullable=True),
+        sa.Column('location_match', sa.String(length=10), nullable=False),
+        sa.Column('job_type', JOB_TYPE, nullable=True),
+        sa.Column('job_level', JOB_LEVEL, nullable=True),
+        sa.Column('salary_min', sa.Integer(), nullable=True),
+        sa.Column('salary_max', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(),
+                  nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(),
+                  nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_saved_searches_id'), 'saved_searches', ['id'], unique=False)
+    op.create_index(
+        op.f('ix_saved_searches_user_id'), 'saved_searches', ['user_id'], unique=False
+    )
+    op.create_table('search_alerts',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('saved_search_id', sa.Integer(), nullable=False),
+        sa.Column('job_id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(),
+                  nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(),
+                  nullable=False),
+        sa.ForeignKeyConstraint(['saved_search_id'], ['saved_searches.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('saved_search_id', 'job_id')
+    )
+    op.create_index(op.f('ix_search_alerts_id'), 'search_alerts', ['id'], unique=False)
+    op.create_index('ix_search_alerts_job', 'search_alerts', ['job_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_search_alerts_job', table_name='search_alerts')
+    op.drop_index(op.f('ix_search_alerts_id'), table_name='search_alerts')
+    op.drop_table('search_alerts')
+    op.drop_index(op.f('ix_saved_searches_user_id'), table_name='saved_searches')
+    op.drop_index(op.f('ix_saved_searches_id'), table_name='saved_searches')
+    op.drop_table('saved_searches')
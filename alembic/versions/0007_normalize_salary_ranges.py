@@ -0,0 +1,32 @@
+"""Swap inverted salary ranges
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 20:00:00.000000
+
+Jobs and saved searches could be stored with salary_min above salary_max, which
+the SQL filters and the in-memory read model and percolator treat differently.
+New rows are validated; existing ones get their bounds swapped. Both sides of
+the assignment read the row's values from before the update.
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '0007'
+down_revision = '0006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for table in ('jobs', 'saved_searches'):
+        op.execute(
+            f"UPDATE {table} SET salary_min = salary_max, salary_max = salary_min "
+            f"WHERE salary_min > salary_max"
+        )
+
+
+def downgrade() -> None:
+    # Which ranges were inverted is not recorded; they stay normalized
+    pass
@@ -1,5 +1,10 @@
 from .security import get_password_hash, verify_password, create_access_token, get_current_user, get_current_company
-from .dependencies import get_current_active_user, get_current_active_company
+from .dependencies import (
+    get_current_active_user, get_current_active_company, get_current_company_claims,
+    get_full_export_access, require_admin_token
+)
+from .cache import principal_cache
+from .hashing import password_hasher
 
 __all__ = [
     "get_password_hash",
@@ -8,5 +13,10 @@ __all__ = [
     "get_current_user",
     "get_current_company",
     "get_current_active_user",
-    "get_current_active_company"
+    "get_current_active_company",
+    "get_current_company_claims",
+    "get_full_export_access",
+    "require_admin_token",
+    "principal_cache",
+    "password_hasher"
 ] 
\ No newline at end of file
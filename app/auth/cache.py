@@ -0,0 +1,51 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from app.config import settings
+
+PrincipalKey = Tuple[str, str]
+
+
+class PrincipalCache:
+    """Bounded TTL cache of authenticated principals' column values.
+
+    Keyed by (user_type, email), the token's claims. Values are plain column
+    snapshots, not ORM objects, so each request builds its own session-bound
+    instance from them.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[PrincipalKey, Tuple[float, Dict[str, Any]]] = OrderedDict()
+
+    def get(self, key: PrincipalKey) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, values = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return values
+
+    def put(self, key: PrincipalKey, values: Dict[str, Any]) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, values)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_type: str, email: str) -> None:
+        """Forget a principal, e.g. after its row was updated or deactivated."""
+        self._entries.pop((user_type, email), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+principal_cache = PrincipalCache(
+    settings.principal_cache_max_entries,
+    settings.principal_cache_ttl_seconds,
+)
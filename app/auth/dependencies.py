@@ -1,7 +1,19 @@
-from typing import Union
+import hmac
+from typing import Optional, Union
 from fastapi import Depends, HTTPException, status
+from fastapi.security import APIKeyHeader
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import settings
+from app.db import get_db
 from app.models import User, Company
-from .security import get_current_user, get_current_company
+from app.schemas.auth import TokenData
+from .security import (
+    decode_access_token, get_current_user, get_current_company, oauth2_scheme,
+    optional_oauth2_scheme
+)
+
+export_token_header = APIKeyHeader(name="X-Export-Token", auto_error=False)
+admin_token_header = APIKeyHeader(name="X-Admin-Token", auto_error=False)
 
 
 async def get_current_active_user(
@@ -25,4 +37,71 @@ async def get_current_active_company(
             status_code=status.HTTP_400_BAD_REQUEST, 
             detail="Inactive company"
         )
-    return current_company 
\ No newline at end of file
+    return current_company
+
+
+async def get_current_company_claims(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db)
+) -> Union[Company, TokenData]:
+    """Get the current company for read-only routes that only use its id.
+
+    With `auth_trust_token_claims` on, the token's claims stand in for the company
+    row, so a deactivation only takes effect once the token expires.
+    """
+    token_data = decode_access_token(token)
+    if settings.auth_trust_token_claims and token_data.id is not None:
+        if token_data.user_type != "company":
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Only companies can access this endpoint"
+            )
+        return token_data
+
+    company = await get_current_company(await get_current_user(token, db))
+    return await get_current_active_company(company)
+
+
+async def get_full_export_access(
+    export_token: Optional[str] = Depends(export_token_header),
+    token: Optional[str] = Depends(optional_oauth2_scheme),
+    db: AsyncSession = Depends(get_db)
+) -> bool:
+    """Whether the caller may export every job, or only a limited export of active ones.
+
+    Presenting `export_token` in the X-Export-Token header grants the full export;
+    otherwise the caller has to be signed in as an active user or company.
+    """
+    if export_token is not None:
+        if settings.export_token and hmac.compare_digest(export_token, settings.export_token):
+            return True
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid export token"
+        )
+    if token is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    await get_current_active_user(await get_current_user(token, db))
+    return False
+
+
+async def require_admin_token(admin_token: Optional[str] = Depends(admin_token_header)) -> None:
+    """Guard operational endpoints that expose internals.
+
+    They answer 404 until `admin_token` is configured, and then need it in the
+    X-Admin-Token header.
+    """
+    if not settings.admin_token:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Not Found"
+        )
+    if admin_token is None or not hmac.compare_digest(admin_token, settings.admin_token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid admin token"
+        )
@@ -0,0 +1,150 @@
+import asyncio
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+from app.config import settings
+from app.metrics import Counter, Gauge, Histogram, request_metrics
+from .security import get_password_hash, verify_password
+
+
+def _timed(func: Callable[..., Any], *args: Any) -> Tuple[Any, float, float]:
+    # time.monotonic is system-wide, so it is comparable across worker processes
+    started = time.monotonic()
+    result = func(*args)
+    return result, started, time.monotonic()
+
+
+class PasswordHasher:
+    """Runs bcrypt hashing and verification on a bounded executor.
+
+    bcrypt deliberately takes hundreds of milliseconds, which would stall every
+    request sharing the event loop. Work is handed to a thread or process pool,
+    and once `max_pending` calls are queued or running, further calls are
+    rejected with a 503 instead of piling up.
+    """
+
+    def __init__(self, executor_type: str, workers: int, max_pending: int):
+        self.executor_type = executor_type
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[Executor] = None
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.compute_seconds_total = 0.0
+        self.compute_seconds_max = 0.0
+        self.pending_gauge = Gauge(
+            "password_hash_pending", "Password hashing calls queued or running."
+        )
+        self.rejections = Counter(
+            "password_hash_rejected_total", "Password hashing calls rejected as over the limit."
+        )
+        self.wait_time = Histogram(
+            "password_hash_wait_seconds", "Time password hashing calls waited for a worker."
+        )
+        self.compute_time = Histogram(
+            "password_hash_compute_seconds", "Time password hashing calls took on a worker."
+        )
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hash"
+                )
+        return self._executor
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            self.rejections.inc(())
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many concurrent authentication requests",
+                headers={"Retry-After": "1"},
+            )
+
+        loop = asyncio.get_running_loop()
+        submitted = time.monotonic()
+        future = self._get_executor().submit(_timed, func, *args)
+        self.pending += 1
+        self.pending_gauge.inc(())
+        # The slot is held until the executor is done with the call, not until the caller
+        # stops waiting: a cancelled login's bcrypt work keeps its worker busy regardless
+        future.add_done_callback(partial(self._done, loop, submitted))
+        result, _, _ = await asyncio.wrap_future(future)
+        return result
+
+    def _done(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        submitted: float,
+        future: "Future[Tuple[Any, float, float]]"
+    ) -> None:
+        # Usually runs on an executor thread, while the counters belong to the event loop
+        try:
+            loop.call_soon_threadsafe(self._finished, future, submitted)
+        except RuntimeError:
+            # The loop is closed, so nothing else touches the counters anymore
+            self._finished(future, submitted)
+
+    def _finished(self, future: "Future[Tuple[Any, float, float]]", submitted: float) -> None:
+        self.pending -= 1
+        self.pending_gauge.dec(())
+        if future.cancelled() or future.exception() is not None:
+            return
+        _, started, finished = future.result()
+        wait, compute = max(started - submitted, 0.0), finished - started
+        self.completed += 1
+        self.wait_seconds_total += wait
+        self.wait_seconds_max = max(self.wait_seconds_max, wait)
+        self.compute_seconds_total += compute
+        self.compute_seconds_max = max(self.compute_seconds_max, compute)
+        self.wait_time.observe((), wait)
+        self.compute_time.observe((), compute)
+
+    async def hash(self, password: str) -> str:
+        """Hash a password without blocking the event loop."""
+        return await self._run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        """Verify a password against its hash without blocking the event loop."""
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    def stats(self) -> Dict[str, Any]:
+        completed = self.completed or 1
+        return {
+            "executor": self.executor_type,
+            "workers": self.workers,
+            "pending": self.pending,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "wait_ms_avg": 1000 * self.wait_seconds_total / completed,
+            "wait_ms_max": 1000 * self.wait_seconds_max,
+            "compute_ms_avg": 1000 * self.compute_seconds_total / completed,
+            "compute_ms_max": 1000 * self.compute_seconds_max,
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    settings.password_hash_executor,
+    settings.password_hash_workers,
+    settings.password_hash_max_pending,
+)
+request_metrics.register(
+    password_hasher.pending_gauge, password_hasher.rejections,
+    password_hasher.wait_time, password_hasher.compute_time,
+)
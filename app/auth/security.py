@@ -5,18 +5,22 @@ from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import inspect, select
+from sqlalchemy.orm import make_transient_to_detached
 
 from app.config import settings
 from app.db import get_db
 from app.models import Company, User
 from app.schemas.auth import TokenData
+from .cache import principal_cache
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
+# For routes that also accept other credentials
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login", auto_error=False)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -42,11 +46,8 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db)
-) -> Union[User, Company]:
-    """Get current authenticated user or company."""
+def decode_access_token(token: str) -> TokenData:
+    """Validate a JWT access token and return its claims."""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -61,19 +62,46 @@ async def get_current_user(
         if email is None or user_type is None:
             raise credentials_exception
             
-        token_data = TokenData(email=email, user_type=user_type)
+        return TokenData(email=email, user_type=user_type, id=payload.get("id"))
     except JWTError:
         raise credentials_exception
+
+
+async def load_principal(db: AsyncSession, token_data: TokenData) -> Optional[Union[User, Company]]:
+    """Load the user or company a token was issued to, via the principal cache."""
+    model = Company if token_data.user_type == "company" else User
+    key = (token_data.user_type, token_data.email)
     
-    if token_data.user_type == "company":
-        result = await db.execute(select(Company).where(Company.email == token_data.email))
-        user = result.scalar_one_or_none()
-    else:
-        result = await db.execute(select(User).where(User.email == token_data.email))
-        user = result.scalar_one_or_none()
+    values = principal_cache.get(key)
+    if values is not None:
+        # Rebuild the row from its cached columns and attach it without a query
+        principal = model(**values)
+        make_transient_to_detached(principal)
+        return await db.merge(principal, load=False)
+
+    result = await db.execute(select(model).where(model.email == token_data.email))
+    principal = result.scalar_one_or_none()
+    if principal is not None:
+        principal_cache.put(key, {
+            column.key: getattr(principal, column.key)
+            for column in inspect(model).column_attrs
+        })
+    return principal
+
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db)
+) -> Union[User, Company]:
+    """Get current authenticated user or company."""
+    user = await load_principal(db, decode_access_token(token))
     
     if user is None:
-        raise credentials_exception
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
     return user
 
 
@@ -86,4 +114,5 @@ async def get_current_company(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Only companies can access this endpoint"
         )
-    return current_user 
\ No newline at end of file
+    return current_user
+
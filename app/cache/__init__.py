@@ -0,0 +1,11 @@
+from app.serialization import encode_json
+from .response import (
+    JOB_LISTS, COMPANY_LISTS, TAG_LISTS, ResponseCache, response_cache, cached_json_response,
+    company_dependency, invalidate_after_commit, job_dependency,
+)
+
+__all__ = [
+    "JOB_LISTS", "COMPANY_LISTS", "TAG_LISTS", "ResponseCache", "response_cache",
+    "cached_json_response", "company_dependency", "encode_json", "invalidate_after_commit",
+    "job_dependency",
+]
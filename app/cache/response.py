@@ -0,0 +1,232 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple
+
+from fastapi import Request, Response, status
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.db.routing import is_recent_writer
+
+# Session.info key holding dependencies to invalidate once the transaction commits
+_PENDING_KEY = "response_cache_invalidations"
+
+# Dependencies of list responses, invalidated whenever a row is added, changed or removed
+JOB_LISTS = "jobs"
+COMPANY_LISTS = "companies"
+TAG_LISTS = "tags"
+
+
+def job_dependency(job_id: int) -> str:
+    return f"job:{job_id}"
+
+
+def company_dependency(company_id: int) -> str:
+    """Covers the company row and its job list, which company and job responses embed."""
+    return f"company:{company_id}"
+
+
+class CachedResponse:
+    """Serialized response body with its ETag and the data it was built from."""
+    __slots__ = ("body", "etag", "dependencies", "expires_at")
+
+    def __init__(self, body: bytes, dependencies: Set[str], expires_at: float):
+        self.body = body
+        self.etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        self.dependencies = dependencies
+        self.expires_at = expires_at
+
+    def matches(self, if_none_match: Optional[str]) -> bool:
+        if not if_none_match:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        return "*" in tags or any(tag.replace("W/", "", 1) == self.etag for tag in tags)
+
+    def response(self, request: Request) -> Response:
+        """The cached body, or an empty 304 if the client already holds this version."""
+        headers = {"ETag": self.etag}
+        if self.matches(request.headers.get("if-none-match")):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(content=self.body, media_type="application/json", headers=headers)
+
+
+class ResponseCache:
+    """TTL- and LRU-bounded cache of serialized public responses.
+
+    Every entry records the data it depends on, as strings such as "job:12",
+    "company:3" or "jobs", and writes invalidate exactly the entries depending on
+    what they changed. A response computed while an invalidation happened is
+    returned but not stored, since it may predate the write. Responses read from a
+    replica can predate a write for a while longer, so `put` can also refuse data
+    invalidated within the last `settle_seconds`.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        ttl_seconds: float,
+        settle_seconds: float = 0
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.settle_seconds = settle_seconds
+        self.generation = 0
+        # When each dependency was last invalidated, oldest first, for settle_seconds
+        self._invalidated_at: OrderedDict[str, float] = OrderedDict()
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._keys_by_dependency: Dict[str, Set[str]] = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(
+        self,
+        key: str,
+        body: bytes,
+        dependencies: Iterable[str],
+        generation: int,
+        settling: bool = False
+    ) -> CachedResponse:
+        """Build an entry and store it unless it is stale or too large to keep.
+
+        With `settling`, entries built from data invalidated within the last
+        `settle_seconds` are not stored either.
+        """
+        entry = CachedResponse(body, set(dependencies), time.monotonic() + self.ttl_seconds)
+        if generation != self.generation or len(body) > self.max_bytes:
+            return entry
+        if settling and self._settling(entry.dependencies):
+            return entry
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = entry
+        self._bytes += len(body)
+        for dependency in entry.dependencies:
+            self._keys_by_dependency.setdefault(dependency, set()).add(key)
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+        return entry
+
+    def invalidate(self, *dependencies: str) -> None:
+        """Drop every entry built from any of the given data."""
+        self.generation += 1
+        now = time.monotonic()
+        for dependency in dependencies:
+            self._invalidated_at[dependency] = now
+            self._invalidated_at.move_to_end(dependency)
+        self._forget_settled(now)
+        for dependency in dependencies:
+            for key in self._keys_by_dependency.pop(dependency, set()):
+                if key in self._entries:
+                    self._remove(key)
+                    self.invalidations += 1
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+        self._keys_by_dependency.clear()
+        self._invalidated_at.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+    def _forget_settled(self, now: float) -> None:
+        while self._invalidated_at:
+            oldest, invalidated_at = next(iter(self._invalidated_at.items()))
+            if invalidated_at > now - self.settle_seconds:
+                break
+            del self._invalidated_at[oldest]
+
+    def _settling(self, dependencies: Set[str]) -> bool:
+        self._forget_settled(time.monotonic())
+        return any(dependency in self._invalidated_at for dependency in dependencies)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= len(entry.body)
+        for dependency in entry.dependencies:
+            keys = self._keys_by_dependency.get(dependency)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_dependency[dependency]
+
+
+response_cache = ResponseCache(
+    settings.response_cache_max_entries,
+    settings.response_cache_max_bytes,
+    settings.response_cache_ttl_seconds,
+    settings.read_your_writes_seconds,
+)
+
+
+def invalidate_after_commit(db: AsyncSession, *dependencies: str) -> None:
+    """Invalidate cached responses built from the given data once `db` commits."""
+    db.info.setdefault(_PENDING_KEY, set()).update(dependencies)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed(session: Session) -> None:
+    dependencies = session.info.pop(_PENDING_KEY, None)
+    if dependencies:
+        response_cache.invalidate(*dependencies)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+async def cached_json_response(
+    request: Request,
+    key: str,
+    load: Callable[[], Awaitable[Tuple[bytes, Iterable[str]]]]
+) -> Response:
+    """Answer from the cache, or build the body with `load` and cache it.
+
+    `load` returns the JSON body and the dependencies it was built from. Either way
+    the response carries an ETag, and a matching If-None-Match gets a 304. With a read
+    replica, clients in their read-your-writes window skip cached entries, which may
+    have been built from replica data older than their write, and bodies built from
+    data written within that window are not cached, since the replica may not have
+    caught up with the write yet.
+    """
+    if not settings.response_cache_enabled:
+        body, _ = await load()
+        return CachedResponse(body, set(), 0).response(request)
+    replicated = settings.database_read_url is not None
+    bypass = replicated and is_recent_writer(request)
+    entry = None if bypass else response_cache.get(key)
+    if entry is None:
+        generation = response_cache.generation
+        body, dependencies = await load()
+        entry = response_cache.put(key, body, dependencies, generation, settling=replicated)
+    return entry.response(request)
@@ -9,12 +9,107 @@ class Settings(BaseSettings):
     
     # Database
     database_url: str
+    # Connection pool (ignored for SQLite in-memory databases); recycle -1 keeps
+    # connections indefinitely, and 0 disables asyncpg's prepared statement cache
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30
+    db_pool_recycle: int = -1
+    db_pool_pre_ping: bool = True
+    db_prepared_statement_cache_size: int = 100
+    # Optional read replica for read-only routes; clients that wrote within the
+    # read-your-writes window keep reading from the primary
+    database_read_url: Optional[str] = None
+    read_your_writes_seconds: float = 5
+    # Development aid: count each request's statements, flag statement shapes run at
+    # least query_debug_repeat_threshold times (N+1 patterns), and EXPLAIN slow queries
+    query_debug: bool = False
+    query_debug_repeat_threshold: int = 5
+    # Log statements slower than this, with their parameters (0 disables)
+    slow_query_threshold_ms: int = 0
+    # Operational endpoints exposing internals (GET /internal/db-pool, /health/cache,
+    # /health/password-hashing) need this token in X-Admin-Token; unset, they are disabled
+    admin_token: Optional[str] = None
     
     # JWT
     secret_key: str
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     
+    # bcrypt runs on a "thread" or "process" pool; beyond max_pending queued or running
+    # calls, logins and registrations are rejected with 503
+    password_hash_executor: str = "thread"
+    password_hash_workers: int = 4
+    password_hash_max_pending: int = 64
+
+    # Authenticated principals cached per token subject; 0 entries disables the cache
+    principal_cache_ttl_seconds: int = 60
+    principal_cache_max_entries: int = 10000
+    # Let read-only routes that only need the caller's id take it from the token
+    auth_trust_token_claims: bool = False
+
+    # In-memory read model serving public job listings
+    read_model_enabled: bool = False
+    read_model_refresh_seconds: int = 0
+
+    # Bitmap tag index; larger matches are filtered in SQL instead of as an id list
+    tag_index_enabled: bool = True
+    tag_index_refresh_seconds: int = 0
+    tag_index_max_query_ids: int = 1000
+
+    # Typeahead suggestions for titles, tags, companies and locations
+    suggest_index_enabled: bool = True
+    suggest_index_refresh_seconds: int = 0
+
+    # Saved search percolator matching new and changed jobs against users' saved searches
+    saved_search_percolator_enabled: bool = True
+    saved_search_percolator_refresh_seconds: int = 0
+    saved_searches_per_user_max: int = 50
+
+    # Tag name -> id entries kept in memory to skip lookups for frequently used tags
+    tag_id_cache_size: int = 10000
+
+    # Bulk NDJSON job uploads: rows written per transaction, and the longest line accepted
+    bulk_ingest_batch_size: int = 500
+    bulk_ingest_max_line_bytes: int = 1048576
+    # Uploads creating at least this many jobs queue a refresh of planner statistics
+    bulk_ingest_analyze_threshold: int = 10000
+
+    # Cache of serialized public GET responses, invalidated by writes
+    response_cache_enabled: bool = True
+    response_cache_ttl_seconds: int = 60
+    response_cache_max_entries: int = 10000
+    response_cache_max_bytes: int = 67108864
+
+    # Rows fetched per round trip when exporting jobs
+    export_batch_size: int = 1000
+    # Signed-in users and companies export at most this many active jobs; callers
+    # presenting export_token in X-Export-Token export everything (unset disables it)
+    export_max_rows: int = 10000
+    export_token: Optional[str] = None
+
+    # Characters of the description kept in summary job listings
+    job_summary_description_length: int = 200
+
+    # Salary buckets used by job facets; the last bucket is open-ended
+    salary_bucket_size: int = 50000
+    salary_bucket_count: int = 10
+
+    # Background task queue: run a worker inside the app (otherwise `python run.py worker`),
+    # tasks run at once per worker, and how often idle workers look for due tasks
+    task_worker_enabled: bool = True
+    task_worker_concurrency: int = 4
+    task_poll_interval_seconds: float = 2.0
+    # Running tasks are reclaimed by other workers once their lease lapses; a task that
+    # takes longer is cancelled and retried
+    task_lease_seconds: int = 300
+    # Failed attempts are retried after exponentially growing, jittered delays
+    task_max_attempts: int = 5
+    task_retry_base_seconds: float = 5.0
+    task_retry_max_seconds: float = 3600.0
+    # Completed tasks are deleted after this long; failed ones are kept for inspection
+    task_done_retention_seconds: int = 86400
+
     class Config:
         env_file = ".env"
         case_sensitive = False
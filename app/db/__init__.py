@@ -1,3 +1,10 @@
-from .database import engine, async_session_maker, get_db
+from .database import (
+    engine, read_engine, async_session_maker, read_session_maker, build_engine, get_db,
+    get_read_db
+)
+from .pool import pool_stats
 
-__all__ = ["engine", "async_session_maker", "get_db"] 
\ No newline at end of file
+__all__ = [
+    "engine", "read_engine", "async_session_maker", "read_session_maker", "build_engine",
+    "get_db", "get_read_db", "pool_stats"
+]
@@ -1,15 +1,42 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine, create_async_engine, AsyncSession, async_sessionmaker
+)
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
 from app.config import settings
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
+from fastapi import Request
+from .pool import TimedAsyncQueuePool
+from .routing import READ_ONLY_KEY, REQUEST_STATE_KEY, is_recent_writer
+
+
+def build_engine(database_url: str) -> AsyncEngine:
+    """Create an async engine with the pool configured from settings."""
+    url = make_url(database_url)
+    options: Dict[str, Any] = {"pool_pre_ping": settings.db_pool_pre_ping}
+    # SQLite in-memory databases must share a single connection; everything else gets
+    # the sized queue pool, including SQLite files, which would otherwise not be pooled
+    if not issubclass(url.get_dialect().get_pool_class(url), (StaticPool, SingletonThreadPool)):
+        options.update(
+            poolclass=TimedAsyncQueuePool,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+        )
+    if url.drivername == "postgresql+asyncpg" and "prepared_statement_cache_size" not in url.query:
+        url = url.update_query_dict({
+            "prepared_statement_cache_size": str(settings.db_prepared_statement_cache_size)
+        })
+    return create_async_engine(url, echo=settings.debug, future=True, **options)
+
 
 # Create async engine
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-    future=True,
-    pool_pre_ping=True,
-)
+engine = build_engine(settings.database_url)
+
+# Optional read replica; without one, reads use the primary engine
+read_engine = build_engine(settings.database_read_url) if settings.database_read_url else engine
 
 # Create async session maker
 async_session_maker = async_sessionmaker(
@@ -18,10 +45,34 @@ async_session_maker = async_sessionmaker(
     expire_on_commit=False
 )
 
+read_session_maker = async_sessionmaker(
+    read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False
+)
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency to get database session."""
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Dependency to get a primary database session, for writes and authentication."""
     async with async_session_maker() as session:
+        # Commits open the client's read-your-writes window
+        session.info[REQUEST_STATE_KEY] = request.scope.setdefault("state", {})
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Dependency to get a read-only session, on the replica when one is configured.
+
+    Clients that wrote within the last `read_your_writes_seconds` read from the primary.
+    """
+    session_maker = read_session_maker
+    if is_recent_writer(request):
+        session_maker = async_session_maker
+    async with session_maker() as session:
+        session.info[READ_ONLY_KEY] = True
         try:
             yield session
         finally:
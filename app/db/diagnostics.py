@@ -0,0 +1,194 @@
+import logging
+import os
+import re
+import time
+import traceback
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import greenlet
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Connection.info keys: when the current statement started, and an EXPLAIN in progress
+_STATEMENT_STARTED = "diagnostics_statement_started"
+_EXPLAINING = "diagnostics_explaining"
+
+# Placeholder lists of expanded IN clauses, whose length varies with the values bound
+_PLACEHOLDER = r"\s*(?:\?|\$\d+|%\(\w+\)s|:\w+)\s*"
+_PLACEHOLDER_LIST = re.compile(rf"\((?:{_PLACEHOLDER},)*{_PLACEHOLDER}\)")
+
+
+def _full_scan_pattern(table: str) -> "re.Pattern[str]":
+    # SQLite reports a table scan as a SCAN without an index, PostgreSQL as a Seq Scan
+    return re.compile(
+        rf"\bSCAN (?:TABLE )?{table}(?:_\d+)?\b(?! USING (?:COVERING )?INDEX)"
+        rf"|\bSeq Scan on {table}\b"
+    )
+
+
+def statement_shape(statement: str) -> str:
+    """The statement with whitespace and IN-list lengths normalized."""
+    return _PLACEHOLDER_LIST.sub("(...)", " ".join(statement.split()))
+
+
+def _app_stack() -> List[str]:
+    """The application frames of the current call stack, outermost first."""
+    frames = traceback.extract_stack()
+    # Async sessions run statements in a greenlet; the awaiting coroutines are in its parent
+    parent = greenlet.getcurrent().parent
+    if parent is not None and parent.gr_frame is not None:
+        frames = traceback.extract_stack(parent.gr_frame) + frames
+    return traceback.format_list([
+        frame for frame in frames
+        if frame.filename.startswith(_APP_ROOT) and frame.filename != __file__
+    ])
+
+
+class QueryLog:
+    """Statements executed during one request or test block, grouped by shape.
+
+    A shape executed again and again, typically once per row of an earlier result, is
+    the signature of an N+1 pattern; the stack of its second execution is kept so the
+    report points at the code issuing it.
+    """
+
+    def __init__(self, explain: bool = False) -> None:
+        self.explain = explain
+        self.statements: List[str] = []
+        self.shape_counts: Dict[str, int] = {}
+        self.repeat_stacks: Dict[str, List[str]] = {}
+        # (statement, plan) of each query, when explaining
+        self.plans: List[Tuple[str, str]] = []
+
+    def record(self, statement: str) -> None:
+        shape = statement_shape(statement)
+        self.statements.append(statement)
+        count = self.shape_counts[shape] = self.shape_counts.get(shape, 0) + 1
+        if count == 2:
+            self.repeat_stacks[shape] = _app_stack()
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Shapes executed at least `threshold` times, most frequent first."""
+        shapes = [
+            (shape, count) for shape, count in self.shape_counts.items() if count >= threshold
+        ]
+        return sorted(shapes, key=lambda item: -item[1])
+
+    def report(self, threshold: int = 2) -> str:
+        lines = [f"{len(self.statements)} statements"]
+        for shape, count in self.repeated(threshold):
+            lines.append(f"{count}x {shape}")
+            lines.extend("    " + line for line in "".join(self.repeat_stacks[shape]).splitlines())
+        return "\n".join(lines)
+
+    def assert_budget(self, max_statements: int, max_repeats: Optional[int] = None) -> None:
+        """Fail unless at most `max_statements` ran and no shape ran over `max_repeats` times."""
+        over_budget = len(self.statements) > max_statements
+        if max_repeats is not None and self.repeated(max_repeats + 1):
+            over_budget = True
+        if over_budget:
+            raise AssertionError(
+                f"Query budget of {max_statements} exceeded: {self.report()}\n"
+                + "\n".join(self.statements)
+            )
+
+    def full_scans(self, table: str) -> List[Tuple[str, str]]:
+        """(statement, plan) of each explained query reading all of `table`."""
+        pattern = _full_scan_pattern(table)
+        return [(statement, plan) for statement, plan in self.plans if pattern.search(plan)]
+
+    def assert_no_full_scans(self, table: str) -> None:
+        scans = self.full_scans(table)
+        if scans:
+            raise AssertionError(f"{len(scans)} queries scan all of {table}:\n" + "\n\n".join(
+                f"{statement}\nPlan:\n{plan}" for statement, plan in scans
+            ))
+
+
+_request_log: ContextVar[Optional[QueryLog]] = ContextVar("request_query_log", default=None)
+# Logs capturing every statement, whichever context executes it (for tests)
+_captures: List[QueryLog] = []
+
+
+def start_request_log() -> QueryLog:
+    """Begin logging the statements of the request running in the current context."""
+    log = QueryLog()
+    _request_log.set(log)
+    return log
+
+
+@contextmanager
+def capture_queries(explain: bool = False) -> Iterator[QueryLog]:
+    """Log every statement executed inside the block, e.g. to assert a query budget.
+
+    With `explain`, the plan of every query is captured too, by running EXPLAIN on
+    the same connection right after it.
+    """
+    log = QueryLog(explain)
+    _captures.append(log)
+    try:
+        yield log
+    finally:
+        _captures.remove(log)
+
+
+def _explain(conn: Connection, statement: str, parameters: Any) -> Optional[str]:
+    prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    conn.info[_EXPLAINING] = True
+    try:
+        rows = conn.exec_driver_sql(prefix + statement, parameters).fetchall()
+    except Exception:
+        logger.debug("Could not explain %s", statement, exc_info=True)
+        return None
+    finally:
+        del conn.info[_EXPLAINING]
+    return "\n".join(" ".join(str(value) for value in row) for row in rows)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _statement_started(conn: Connection, cursor: Any, statement: str, *args: Any) -> None:
+    conn.info[_STATEMENT_STARTED] = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _statement_finished(
+    conn: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool
+) -> None:
+    if conn.info.get(_EXPLAINING):
+        return
+    started = conn.info.pop(_STATEMENT_STARTED, None)
+    finished = time.perf_counter()
+    is_query = statement.split(None, 1)[0].upper() in ("SELECT", "WITH")
+    request_log = _request_log.get()
+    if request_log is not None:
+        request_log.record(statement)
+    for log in _captures:
+        log.record(statement)
+        if log.explain and is_query and not executemany:
+            log.plans.append((statement, _explain(conn, statement, parameters) or ""))
+
+    if not settings.slow_query_threshold_ms or started is None:
+        return
+    elapsed_ms = 1000 * (finished - started)
+    if elapsed_ms < settings.slow_query_threshold_ms:
+        return
+    plan = None
+    if settings.query_debug and is_query and not executemany:
+        plan = _explain(conn, statement, parameters)
+    logger.warning(
+        "Slow query (%.1f ms): %s\nParameters: %r%s",
+        elapsed_ms, statement, parameters, f"\nPlan:\n{plan}" if plan else ""
+    )
@@ -0,0 +1,72 @@
+import time
+from typing import Any, Dict
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from app.metrics import current_request
+
+
+class PoolMetrics:
+    """Checkout counts and the time callers waited for a connection."""
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, wait: float) -> None:
+        self.checkouts += 1
+        self.wait_seconds_total += wait
+        self.wait_seconds_max = max(self.wait_seconds_max, wait)
+        request = current_request()
+        if request is not None:
+            request.pool_wait += wait
+
+    def stats(self) -> Dict[str, Any]:
+        checkouts = self.checkouts or 1
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_ms_avg": 1000 * self.wait_seconds_total / checkouts,
+            "wait_ms_max": 1000 * self.wait_seconds_max,
+        }
+
+
+class TimedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Async queue pool that records how long each checkout waited.
+
+    The wait covers queueing for a free connection and opening a new one when the
+    pool may still grow; checkouts that exceed `pool_timeout` are counted too.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self) -> Any:
+        started = time.monotonic()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.metrics.timeouts += 1
+            raise
+        self.metrics.record(time.monotonic() - started)
+        return connection
+
+
+def pool_stats(pool: Pool) -> Dict[str, Any]:
+    """Live connection counts of a pool, plus wait metrics for a timed pool."""
+    stats: Dict[str, Any] = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update({
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "idle": pool.checkedin(),
+            # Negative while the pool has not yet opened `size` connections
+            "overflow": max(pool.overflow(), 0),
+        })
+    if isinstance(pool, TimedAsyncQueuePool):
+        stats.update(pool.metrics.stats())
+    return stats
@@ -0,0 +1,77 @@
+import hashlib
+import hmac
+import math
+import time
+from typing import Optional
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config import settings
+
+# Session.info keys: the scope state of the request a primary session writes for, and
+# the read-only marker
+REQUEST_STATE_KEY = "request_state"
+READ_ONLY_KEY = "read_only"
+
+# Where the time of a request's last committed write is kept while it is handled, and
+# the cookie and header carrying it back to the client, signed
+LAST_WRITE_STATE = "last_write"
+LAST_WRITE_COOKIE = "last_write"
+LAST_WRITE_HEADER = "X-Last-Write"
+
+
+def _signature(timestamp: str) -> str:
+    message = f"{LAST_WRITE_COOKIE}:{timestamp}".encode()
+    return hmac.new(settings.secret_key.encode(), message, hashlib.sha256).hexdigest()
+
+
+def sign_last_write(written_at: float) -> str:
+    """Marker of a write committed at `written_at`, for the client to send back."""
+    timestamp = f"{written_at:.3f}"
+    return f"{timestamp}:{_signature(timestamp)}"
+
+
+def last_write_of(marker: Optional[str]) -> Optional[float]:
+    """Time of the write a marker records, or None if it is missing or forged."""
+    timestamp, _, signature = (marker or "").partition(":")
+    if not signature or not hmac.compare_digest(signature, _signature(timestamp)):
+        return None
+    try:
+        return float(timestamp)
+    except ValueError:
+        return None
+
+
+def last_write_cookie(marker: str) -> str:
+    """Set-Cookie value holding a write marker for the read-your-writes window."""
+    max_age = math.ceil(settings.read_your_writes_seconds)
+    return f"{LAST_WRITE_COOKIE}={marker}; Max-Age={max_age}; Path=/; HttpOnly; SameSite=Lax"
+
+
+def is_recent_writer(request: Request) -> bool:
+    """Whether the client behind this request wrote within the read-your-writes window.
+
+    Responses to requests that commit carry a signed marker of the time, as a cookie
+    and an X-Last-Write header (see ReadYourWritesMiddleware). Clients send it back as
+    either, so every worker process recognizes them without sharing any state, and
+    nothing about the client is kept on the server.
+    """
+    last_write = last_write_of(
+        request.cookies.get(LAST_WRITE_COOKIE) or request.headers.get(LAST_WRITE_HEADER)
+    )
+    return last_write is not None and time.time() - last_write < settings.read_your_writes_seconds
+
+
+@event.listens_for(Session, "after_commit")
+def _mark_writer(session: Session) -> None:
+    state = session.info.get(REQUEST_STATE_KEY)
+    if state is not None:
+        state[LAST_WRITE_STATE] = time.time()
+
+
+@event.listens_for(Session, "before_flush")
+def _refuse_read_only_writes(session: Session, flush_context, instances) -> None:
+    if session.info.get(READ_ONLY_KEY):
+        raise RuntimeError("Writes must use get_db; this session may be bound to a read replica")
@@ -0,0 +1,323 @@
+import logging
+import random
+from datetime import datetime, timedelta, timezone
+from itertools import accumulate
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Table, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.auth.security import get_password_hash
+from app.models import Base, Company, Job, Location, Tag, User, job_tags_table
+from app.models.job import JobLevel, JobType
+from app.search.places import parse_location
+
+logger = logging.getLogger(__name__)
+
+# Every seeded account, demo or synthetic, logs in with this password
+SEED_PASSWORD = "password123"
+
+DEMO_COMPANIES = [
+    ("tech@google.com", "Google", "https://google.com", "Nairobi, Kenya",
+     "Technology company focused on search, advertising, and cloud computing."),
+    ("jobs@microsoft.com", "Microsoft", "https://microsoft.com", "Nairobi, Kenya",
+     "Software and cloud services company with a strong presence in East Africa."),
+    ("careers@safaricom.co.ke", "Safaricom", "https://safaricom.co.ke", "Nairobi, Kenya",
+     "Leading mobile network operator and technology company in Kenya."),
+    ("jobs@andela.com", "Andela", "https://andela.com", "Nairobi, Kenya",
+     "Global talent network that connects companies with vetted, remote engineers."),
+    ("careers@twiga.com", "Twiga Foods", "https://twiga.com", "Nairobi, Kenya",
+     "Technology-driven company revolutionizing the fresh food supply chain in Kenya."),
+    ("jobs@sendy.co.ke", "Sendy", "https://sendy.co.ke", "Mombasa, Kenya",
+     "Logistics platform that moves goods for businesses and individuals across Africa."),
+]
+
+DEMO_USERS = [
+    ("john.doe@example.com", "John Kamau"),
+    ("jane.smith@example.com", "Jane Wanjiku"),
+    ("alex.johnson@example.com", "Alex Omondi"),
+]
+
+# (title, weight, skills most commonly asked for first)
+ROLES = [
+    ("Backend Developer", 18, ["python", "postgresql", "backend", "django", "fastapi", "redis",
+                               "docker", "rest-api", "go", "java"]),
+    ("Frontend Developer", 14, ["javascript", "react", "typescript", "frontend", "css", "html",
+                                "vue", "nextjs", "tailwind"]),
+    ("Full Stack Developer", 14, ["javascript", "react", "nodejs", "fullstack", "postgresql",
+                                  "typescript", "python", "mongodb"]),
+    ("Mobile Developer", 8, ["mobile", "android", "kotlin", "flutter", "ios", "swift",
+                             "react-native"]),
+    ("DevOps Engineer", 7, ["devops", "docker", "kubernetes", "aws", "ci-cd", "terraform",
+                            "linux", "gcp", "azure"]),
+    ("Data Scientist", 6, ["python", "data-science", "machine-learning", "pandas", "statistics",
+                           "sql", "r"]),
+    ("Data Engineer", 5, ["python", "sql", "data-engineering", "spark", "airflow", "aws",
+                          "kafka"]),
+    ("Machine Learning Engineer", 4, ["python", "machine-learning", "pytorch", "tensorflow",
+                                      "mlops", "nlp"]),
+    ("QA Engineer", 5, ["qa", "testing", "selenium", "cypress", "automation", "python"]),
+    ("UI/UX Designer", 6, ["ui-design", "ux-design", "figma", "adobe-xd", "prototyping"]),
+    ("Product Manager", 6, ["product-management", "agile", "scrum", "fintech", "leadership"]),
+    ("Security Engineer", 3, ["security", "linux", "networking", "aws", "penetration-testing"]),
+    ("Support Engineer", 4, ["customer-support", "sql", "linux", "troubleshooting"]),
+]
+
+# Skills asked for regardless of the role
+GENERAL_SKILLS = ["git", "communication", "english", "swahili", "remote", "agile", "mentoring"]
+
+TAG_NAMES = sorted({skill for _, _, skills in ROLES for skill in skills} | set(GENERAL_SKILLS))
+
+LOCATIONS = [
+    ("Nairobi, Kenya", 40), ("Remote", 15), ("Mombasa, Kenya", 10), ("Kisumu, Kenya", 6),
+    ("Nakuru, Kenya", 5), ("Eldoret, Kenya", 3), ("Kampala, Uganda", 8), ("Kigali, Rwanda", 6),
+    ("Dar es Salaam, Tanzania", 5), ("Addis Ababa, Ethiopia", 2),
+]
+
+JOB_TYPES = [(JobType.ONSITE, 45), (JobType.HYBRID, 30), (JobType.REMOTE, 25)]
+
+# Level weight and typical monthly salary floor (KES)
+JOB_LEVELS = [
+    (JobLevel.ENTRY, 20, 80_000), (JobLevel.MID, 40, 150_000), (JobLevel.SENIOR, 28, 250_000),
+    (JobLevel.LEAD, 9, 380_000), (JobLevel.EXECUTIVE, 3, 600_000),
+]
+
+# Number of tags on a job
+TAGS_PER_JOB = [(1, 4), (2, 10), (3, 20), (4, 25), (5, 20), (6, 11), (7, 6), (8, 4)]
+
+SENTENCES = [
+    "You will work closely with product, design and engineering to ship features customers love.",
+    "Our team values ownership, clear writing and thoughtful code review.",
+    "We run our services in the cloud and deploy many times a day.",
+    "You will mentor colleagues and help shape our engineering practices.",
+    "The role involves both greenfield projects and improving existing systems.",
+    "We offer medical cover, a learning budget and flexible working hours.",
+    "Experience working with distributed teams across African time zones is a plus.",
+    "You will own features end to end, from design discussions to production monitoring.",
+    "We serve millions of customers across East Africa, so reliability matters.",
+    "Candidates should be comfortable with ambiguity and fast-moving priorities.",
+]
+
+# Seeded timestamps count back from this instant rather than the time of the run, so
+# that cursors and recency compare equal between runs
+SEED_EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+ACTIVE_SHARE = 0.9
+NO_SALARY_SHARE = 0.1
+HISTORY_DAYS = 365
+# Exponent of the Zipf-like distribution of jobs over companies: a few companies post
+# most jobs, most companies post one or two
+COMPANY_SIZE_SKEW = 1.1
+
+
+def company_email(company_id: int) -> str:
+    """Login email of a seeded company."""
+    if company_id <= len(DEMO_COMPANIES):
+        return DEMO_COMPANIES[company_id - 1][0]
+    return f"careers@company{company_id}.example.com"
+
+
+def user_email(user_id: int) -> str:
+    """Login email of a seeded user."""
+    if user_id <= len(DEMO_USERS):
+        return DEMO_USERS[user_id - 1][0]
+    return f"user{user_id}@example.com"
+
+
+def _weighted(pairs: Sequence[Tuple[Any, ...]]) -> Tuple[List[Any], List[float]]:
+    """Split (value, weight, ...) rows into values and cumulative weights."""
+    return [pair[0] for pair in pairs], list(accumulate(pair[1] for pair in pairs))
+
+
+def _company_rows(count: int, hashed: str, epoch: datetime, rng: random.Random) -> List[dict]:
+    locations, location_weights = _weighted(LOCATIONS)
+    rows = []
+    for company_id in range(1, count + 1):
+        if company_id <= len(DEMO_COMPANIES):
+            _, name, website, location, description = DEMO_COMPANIES[company_id - 1]
+        else:
+            name = f"Company {company_id}"
+            website = f"https://company{company_id}.example.com"
+            location = rng.choices(locations, cum_weights=location_weights)[0]
+            description = " ".join(rng.sample(SENTENCES, 2))
+        rows.append({
+            "id": company_id, "email": company_email(company_id), "company_name": name,
+            "description": description, "website": website, "location": location,
+            "hashed_password": hashed, "is_active": True, "is_verified": rng.random() < 0.3,
+            "created_at": epoch - timedelta(days=HISTORY_DAYS + 30), "updated_at": epoch,
+        })
+    return rows
+
+
+def _user_rows(count: int, hashed: str, epoch: datetime) -> List[dict]:
+    rows = []
+    for user_id in range(1, count + 1):
+        full_name = DEMO_USERS[user_id - 1][1] if user_id <= len(DEMO_USERS) else f"User {user_id}"
+        rows.append({
+            "id": user_id, "email": user_email(user_id), "full_name": full_name,
+            "hashed_password": hashed, "is_active": True, "created_at": epoch, "updated_at": epoch,
+        })
+    return rows
+
+
+class _JobGenerator:
+    """Deterministic stream of job rows and their tag links."""
+
+    def __init__(self, jobs: int, companies: int, epoch: datetime, rng: random.Random):
+        self.jobs = jobs
+        self.rng = rng
+        self.start = epoch - timedelta(days=HISTORY_DAYS)
+        self.tag_ids = {name: tag_id for tag_id, name in enumerate(TAG_NAMES, start=1)}
+        self.roles, self.role_weights = _weighted(ROLES)
+        self.skills = {title: skills for title, _, skills in ROLES}
+        self.locations, self.location_weights = _weighted(LOCATIONS)
+        self.location_ids = {
+            name: location_id for location_id, name in enumerate(self.locations, start=1)
+        }
+        self.types, self.type_weights = _weighted(JOB_TYPES)
+        self.levels, self.level_weights = _weighted(JOB_LEVELS)
+        self.salary_floor = {level: floor for level, _, floor in JOB_LEVELS}
+        self.tag_counts, self.tag_count_weights = _weighted(TAGS_PER_JOB)
+        self.company_ids = list(range(1, companies + 1))
+        self.company_weights = list(accumulate(
+            1 / rank ** COMPANY_SIZE_SKEW for rank in self.company_ids
+        ))
+
+    def _skills(self, role: str, count: int) -> List[str]:
+        # Earlier skills of a role are asked for more often
+        pool = self.skills[role]
+        weights = [1 / (rank + 1) for rank in range(len(pool))]
+        chosen = set()
+        while len(chosen) < min(count, len(pool)):
+            chosen.add(self.rng.choices(pool, weights)[0])
+        if self.rng.random() < 0.3:
+            chosen.add(self.rng.choice(GENERAL_SKILLS))
+        return sorted(chosen)
+
+    def _salary(self, level: JobLevel) -> Tuple[Optional[int], Optional[int]]:
+        if self.rng.random() < NO_SALARY_SHARE:
+            return None, None
+        salary_min = self.salary_floor[level] * self.rng.lognormvariate(0, 0.25)
+        salary_max = salary_min * self.rng.uniform(1.2, 1.8)
+        return int(round(salary_min, -4)), int(round(salary_max, -4))
+
+    def batch(self, first_id: int, count: int) -> Tuple[List[dict], List[dict]]:
+        rng = self.rng
+        company_ids = rng.choices(self.company_ids, cum_weights=self.company_weights, k=count)
+        jobs, job_tags = [], []
+        for offset in range(count):
+            job_id = first_id + offset
+            role = rng.choices(self.roles, cum_weights=self.role_weights)[0]
+            level = rng.choices(self.levels, cum_weights=self.level_weights)[0]
+            job_type = rng.choices(self.types, cum_weights=self.type_weights)[0]
+            if job_type is JobType.REMOTE and rng.random() < 0.7:
+                location = "Remote"
+            else:
+                location = rng.choices(self.locations, cum_weights=self.location_weights)[0]
+            salary_min, salary_max = self._salary(level)
+            # Ids increase with posting time, as they would on a live board
+            created_at = self.start + timedelta(days=HISTORY_DAYS * job_id / self.jobs)
+            created_at = created_at.replace(microsecond=0)
+            jobs.append({
+                "id": job_id, "title": f"{level.value.title()} {role}",
+                "description": " ".join(rng.sample(SENTENCES, rng.randint(2, 6))),
+                "location": location, "location_id": self.location_ids[location],
+                "job_type": job_type, "job_level": level,
+                "salary_min": salary_min, "salary_max": salary_max,
+                "is_active": rng.random() < ACTIVE_SHARE, "company_id": company_ids[offset],
+                "created_at": created_at, "updated_at": created_at,
+            })
+            tag_count = rng.choices(self.tag_counts, cum_weights=self.tag_count_weights)[0]
+            job_tags.extend(
+                {"job_id": job_id, "tag_id": self.tag_ids[name]}
+                for name in self._skills(role, tag_count)
+            )
+        return jobs, job_tags
+
+
+def _copy_value(value: Any) -> Any:
+    # Enum columns are stored by member name
+    return value.name if isinstance(value, (JobType, JobLevel)) else value
+
+
+async def _write(conn: AsyncConnection, table: Table, rows: List[dict]) -> None:
+    """Bulk insert rows: COPY on PostgreSQL, a single executemany elsewhere."""
+    if not rows:
+        return
+    if conn.dialect.name == "postgresql":
+        # COPY goes through the asyncpg connection, but still runs inside the transaction
+        # SQLAlchemy began on it, so it commits or rolls back with the rest of the batch
+        raw = await conn.get_raw_connection()
+        columns = list(rows[0])
+        await raw.driver_connection.copy_records_to_table(
+            table.name,
+            records=[tuple(_copy_value(row[column]) for column in columns) for row in rows],
+            columns=columns,
+        )
+    else:
+        await conn.execute(insert(table), rows)
+
+
+async def seed_database(
+    engine: AsyncEngine,
+    jobs: int,
+    companies: Optional[int] = None,
+    users: Optional[int] = None,
+    seed: int = 0,
+    batch_size: int = 10_000,
+    epoch: datetime = SEED_EPOCH
+) -> Dict[str, int]:
+    """Fill an empty database with demo accounts and `jobs` synthetic job listings.
+
+    The same arguments always produce the same rows; jobs are posted over the year
+    before `epoch`. Every account shares one password hash, and rows are written in
+    bulk, so a million jobs take minutes rather than the days that going through the
+    services would. Returns the number of rows per table.
+    """
+    companies = max(companies or jobs // 20, len(DEMO_COMPANIES))
+    users = max(users or jobs // 10, len(DEMO_USERS))
+    rng = random.Random(seed)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        if (await conn.execute(select(func.count(Company.id)))).scalar_one():
+            raise RuntimeError("The database already has data; seed an empty database")
+
+    hashed = get_password_hash(SEED_PASSWORD)
+    async with engine.begin() as conn:
+        await _write(conn, Tag.__table__, [
+            {"id": tag_id, "name": name, "created_at": epoch, "updated_at": epoch}
+            for tag_id, name in enumerate(TAG_NAMES, start=1)
+        ])
+        await _write(conn, Location.__table__, [
+            {**parse_location(name)._asdict(), "id": location_id,
+             "created_at": epoch, "updated_at": epoch}
+            for location_id, (name, _) in enumerate(LOCATIONS, start=1)
+        ])
+        company_rows = _company_rows(companies, hashed, epoch, rng)
+        for first in range(0, companies, batch_size):
+            await _write(conn, Company.__table__, company_rows[first:first + batch_size])
+        await _write(conn, User.__table__, _user_rows(users, hashed, epoch))
+
+    generator = _JobGenerator(jobs, companies, epoch, rng)
+    for first in range(1, jobs + 1, batch_size):
+        job_rows, tag_rows = generator.batch(first, min(batch_size, jobs + 1 - first))
+        async with engine.begin() as conn:
+            await _write(conn, Job.__table__, job_rows)
+            await _write(conn, job_tags_table, tag_rows)
+        logger.info("Seeded %d/%d jobs", first + len(job_rows) - 1, jobs)
+
+    if engine.dialect.name == "postgresql":
+        # Explicit ids leave the id sequences behind the data
+        async with engine.begin() as conn:
+            for table in ("companies", "users", "tags", "locations", "jobs"):
+                await conn.exec_driver_sql(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                    f"(SELECT MAX(id) FROM {table}))"
+                )
+            await conn.exec_driver_sql("ANALYZE")
+
+    return {
+        "companies": companies, "users": users, "tags": len(TAG_NAMES),
+        "locations": len(LOCATIONS), "jobs": jobs,
+    }
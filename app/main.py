@@ -1,14 +1,53 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.auth import password_hasher, require_admin_token
+from app.cache import response_cache
 from app.config import settings
-from app.routers import auth_router, companies_router, users_router, jobs_router, tags_router
+from app.db import async_session_maker, engine, pool_stats, read_engine
+from app.metrics import request_metrics
+from app.middleware import MetricsMiddleware, QueryDebugMiddleware, ReadYourWritesMiddleware
+from app.routers import (
+    auth_router, companies_router, users_router, jobs_router, tags_router, suggest_router,
+    saved_searches_router
+)
+from app.search import job_read_model, saved_search_percolator, suggest_index, tag_index
+from app.tasks import task_worker
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start and stop in-process background components."""
+    if settings.tag_index_enabled:
+        tag_index.start(async_session_maker, settings.tag_index_refresh_seconds)
+    if settings.read_model_enabled:
+        job_read_model.start(async_session_maker, settings.read_model_refresh_seconds)
+    if settings.suggest_index_enabled:
+        suggest_index.start(async_session_maker, settings.suggest_index_refresh_seconds)
+    if settings.saved_search_percolator_enabled:
+        saved_search_percolator.start(
+            async_session_maker, settings.saved_search_percolator_refresh_seconds
+        )
+    if settings.task_worker_enabled:
+        task_worker.start(async_session_maker)
+    yield
+    await task_worker.stop(async_session_maker)
+    await saved_search_percolator.stop()
+    await suggest_index.stop()
+    await job_read_model.stop()
+    await tag_index.stop()
+    password_hasher.shutdown()
+
 
 app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description="A production-ready backend for managing and filtering job listings",
-    debug=settings.debug
+    debug=settings.debug,
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -19,6 +58,10 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+app.add_middleware(ReadYourWritesMiddleware)
+app.add_middleware(MetricsMiddleware)
+if settings.query_debug:
+    app.add_middleware(QueryDebugMiddleware)
 
 # Include routers
 app.include_router(auth_router)
@@ -26,6 +69,8 @@ app.include_router(companies_router)
 app.include_router(users_router)
 app.include_router(jobs_router)
 app.include_router(tags_router)
+app.include_router(suggest_router)
+app.include_router(saved_searches_router)
 
 @app.get("/")
 async def root():
@@ -33,4 +78,26 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"} 
\ No newline at end of file
+    return {"status": "healthy"}
+
+@app.get("/health/cache", dependencies=[Depends(require_admin_token)])
+async def cache_stats():
+    return response_cache.stats()
+
+@app.get("/health/password-hashing", dependencies=[Depends(require_admin_token)])
+async def password_hashing_stats():
+    return password_hasher.stats()
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Request and database metrics in the Prometheus text exposition format."""
+    return PlainTextResponse(
+        request_metrics.render(), media_type="text/plain; version=0.0.4"
+    )
+
+@app.get("/internal/db-pool", dependencies=[Depends(require_admin_token)])
+async def db_pool_stats():
+    stats = pool_stats(engine.pool)
+    if read_engine is not engine:
+        stats["replica"] = pool_stats(read_engine.pool)
+    return stats
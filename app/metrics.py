@@ -0,0 +1,176 @@
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Upper bounds, in seconds, of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class RequestStats:
+    """Time and statements one request spent outside its own code."""
+    __slots__ = ("pool_wait", "db_seconds", "db_statements", "serialize_seconds")
+
+    def __init__(self) -> None:
+        self.pool_wait = 0.0
+        self.db_seconds = 0.0
+        self.db_statements = 0
+        self.serialize_seconds = 0.0
+
+
+_current_request: ContextVar[Optional[RequestStats]] = ContextVar(
+    "current_request", default=None
+)
+
+
+def start_request() -> RequestStats:
+    """Begin collecting stats for the request running in the current context."""
+    stats = RequestStats()
+    _current_request.set(stats)
+    return stats
+
+
+def current_request() -> Optional[RequestStats]:
+    return _current_request.get()
+
+
+def _format_labels(labels: Labels, extra: str = "") -> str:
+    parts = [f'{name}="{value}"' for name, value in labels]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class Counter:
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self.values: Dict[Labels, float] = {}
+
+    def inc(self, labels: Labels, amount: float = 1.0) -> None:
+        self.values[labels] = self.values.get(labels, 0.0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for labels, value in sorted(self.values.items()):
+            lines.append(f"{self.name}{_format_labels(labels)} {value}")
+        return lines
+
+
+class Gauge(Counter):
+    def dec(self, labels: Labels, amount: float = 1.0) -> None:
+        self.inc(labels, -amount)
+
+    def render(self) -> List[str]:
+        lines = super().render()
+        lines[1] = f"# TYPE {self.name} gauge"
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(buckets)
+        # Per label set: a count per bucket (non-cumulative, the last one is +Inf) and the sum
+        self.values: Dict[Labels, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, labels: Labels, value: float) -> None:
+        entry = self.values.get(labels)
+        if entry is None:
+            entry = self.values[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+        entry[0][bisect_left(self.buckets, value)] += 1
+        entry[1][0] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        for labels, (counts, total) in sorted(self.values.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = 'le="%s"' % ("+Inf" if bound == float("inf") else repr(bound))
+                lines.append(f"{self.name}_bucket{_format_labels(labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {total[0]}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+class RequestMetrics:
+    """Per-route request counters and latency histograms, rendered for Prometheus."""
+
+    def __init__(self) -> None:
+        self.requests = Counter("http_requests_total", "Requests by route and status code.")
+        self.in_flight = Gauge("http_requests_in_flight", "Requests currently being served.")
+        self.duration = Histogram(
+            "http_request_duration_seconds", "Request latency, until the response is sent."
+        )
+        self.db_time = Histogram(
+            "http_request_db_seconds", "Time per request spent executing SQL statements."
+        )
+        self.db_statements = Counter(
+            "http_request_db_statements_total", "SQL statements executed by requests."
+        )
+        self.pool_wait = Counter(
+            "http_request_db_pool_wait_seconds_total",
+            "Time requests spent waiting for a pooled database connection."
+        )
+        self.serialization = Counter(
+            "http_request_serialization_seconds_total",
+            "Time requests spent encoding response bodies to JSON."
+        )
+        # Metrics of other components, rendered after the request metrics
+        self.registered: List[Any] = []
+
+    def register(self, *metrics: Any) -> None:
+        """Add metrics kept by another component to the /metrics output."""
+        self.registered.extend(metrics)
+
+    def observe(
+        self,
+        method: str,
+        route: str,
+        status: int,
+        duration: float,
+        stats: RequestStats
+    ) -> None:
+        labels = (("method", method), ("route", route))
+        self.requests.inc(labels + (("status", str(status)),))
+        self.duration.observe(labels, duration)
+        self.db_time.observe(labels, stats.db_seconds)
+        self.db_statements.inc(labels, stats.db_statements)
+        self.pool_wait.inc(labels, stats.pool_wait)
+        self.serialization.inc(labels, stats.serialize_seconds)
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in (
+            self.requests, self.in_flight, self.duration, self.db_time, self.db_statements,
+            self.pool_wait, self.serialization, *self.registered,
+        ):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+request_metrics = RequestMetrics()
+
+# Connection.info key holding when the statement being executed started
+_STATEMENT_STARTED = "metrics_statement_started"
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _statement_started(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    conn.info[_STATEMENT_STARTED] = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _statement_finished(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    stats = _current_request.get()
+    started = conn.info.pop(_STATEMENT_STARTED, None)
+    if stats is not None and started is not None:
+        stats.db_statements += 1
+        stats.db_seconds += time.perf_counter() - started
@@ -0,0 +1,130 @@
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+from app.db.diagnostics import start_request_log
+from app.db.routing import (
+    LAST_WRITE_HEADER, LAST_WRITE_STATE, last_write_cookie, sign_last_write
+)
+from app.metrics import request_metrics, start_request
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsMiddleware:
+    """Record per-route latency, status and database metrics for every request.
+
+    Each response also gets a Server-Timing header splitting the time until it started
+    into `db-pool` (waiting for a pooled connection), `db` (executing SQL), `serialize`
+    (encoding JSON bodies) and `app` (everything else).
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.monotonic()
+        stats = start_request()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed = time.monotonic() - started
+                own = elapsed - stats.pool_wait - stats.db_seconds - stats.serialize_seconds
+                MutableHeaders(scope=message).append(
+                    "Server-Timing",
+                    f"db-pool;dur={1000 * stats.pool_wait:.2f}, "
+                    f"db;dur={1000 * stats.db_seconds:.2f}, "
+                    f"serialize;dur={1000 * stats.serialize_seconds:.2f}, "
+                    f"app;dur={1000 * max(own, 0.0):.2f}"
+                )
+            await send(message)
+
+        request_metrics.in_flight.inc(())
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            request_metrics.in_flight.dec(())
+            # The router records the matched route; label by its template, not the raw path
+            route = scope.get("route")
+            request_metrics.observe(
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                status_code,
+                time.monotonic() - started,
+                stats
+            )
+
+
+class ReadYourWritesMiddleware:
+    """Hand clients whose request committed a write a signed marker of its time.
+
+    With a read replica configured, the response gets the marker as a cookie and an
+    X-Last-Write header; clients sending either back within `read_your_writes_seconds`
+    read from the primary (see app.db.routing.is_recent_writer).
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # get_db records commits here; requests see it as request.state
+        state = scope.setdefault("state", {})
+
+        async def send_with_marker(message: Message) -> None:
+            last_write = state.get(LAST_WRITE_STATE)
+            if message["type"] == "http.response.start" and last_write is not None \
+                    and settings.database_read_url is not None:
+                marker = sign_last_write(last_write)
+                headers = MutableHeaders(scope=message)
+                headers.append(LAST_WRITE_HEADER, marker)
+                headers.append("Set-Cookie", last_write_cookie(marker))
+            await send(message)
+
+        await self.app(scope, receive, send_with_marker)
+
+
+class QueryDebugMiddleware:
+    """Development aid logging each request's SQL statements and N+1 patterns.
+
+    The statement count is sent as an X-Query-Count header, and statement shapes run at
+    least `query_debug_repeat_threshold` times are logged with the stack issuing them.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        log = start_request_log()
+
+        async def send_with_count(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append("X-Query-Count", str(len(log.statements)))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_count)
+        finally:
+            request = f"{scope['method']} {scope['path']}"
+            threshold = settings.query_debug_repeat_threshold
+            if log.repeated(threshold):
+                logger.warning("Possible N+1 queries in %s: %s", request, log.report(threshold))
+            else:
+                logger.debug("%s ran %d statements", request, len(log.statements))
@@ -1,8 +1,14 @@
 from .base import Base
 from .company import Company
 from .job import Job
+from .location import Location
+from .saved_search import SavedSearch, SearchAlert
 from .tag import Tag
+from .task import Task
 from .user import User
 from .associations import job_tags_table
 
-__all__ = ["Base", "Company", "Job", "Tag", "User", "job_tags_table"] 
\ No newline at end of file
+__all__ = [
+    "Base", "Company", "Job", "Location", "SavedSearch", "SearchAlert", "Tag", "Task", "User",
+    "job_tags_table",
+]
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Table, Column, Integer, ForeignKey
+from sqlalchemy import Table, Column, Integer, ForeignKey, Index
 from .base import Base
 
 job_tags_table = Table(
@@ -6,4 +6,6 @@ job_tags_table = Table(
     Base.metadata,
     Column("job_id", Integer, ForeignKey("jobs.id"), primary_key=True),
     Column("tag_id", Integer, ForeignKey("tags.id"), primary_key=True),
-) 
\ No newline at end of file
+    # The primary key leads with job_id; tag filters and facets go from tag to jobs
+    Index("ix_job_tags_tag_job", "tag_id", "job_id"),
+)
@@ -1,10 +1,21 @@
 from sqlalchemy import Column, Integer, DateTime, func
+from sqlalchemy.dialects import sqlite
 from sqlalchemy.ext.declarative import declarative_base
 
 Base = declarative_base()
 
+# For created_at columns that keyset cursors compare for equality (jobs and companies).
+# SQLite's CURRENT_TIMESTAMP has no fractional seconds; bind timestamps in the same format
+# so that cursor tie-breaks match stored values. Other timestamps keep the default format.
+KeysetTimestamp = DateTime(timezone=True).with_variant(
+    sqlite.DATETIME(
+        storage_format="%(year)04d-%(month)02d-%(day)02d %(hour)02d:%(minute)02d:%(second)02d"
+    ),
+    "sqlite",
+)
+
 
 class TimestampMixin:
     """Mixin for adding created_at and updated_at timestamps to models."""
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False) 
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
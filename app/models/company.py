@@ -1,6 +1,6 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean
+from sqlalchemy import Column, Integer, String, Text, Boolean, func
 from sqlalchemy.orm import relationship
-from .base import Base, TimestampMixin
+from .base import Base, KeysetTimestamp, TimestampMixin
 
 
 class Company(Base, TimestampMixin):
@@ -15,6 +15,11 @@ class Company(Base, TimestampMixin):
     hashed_password = Column(String(255), nullable=False)
     is_active = Column(Boolean, default=True)
     is_verified = Column(Boolean, default=False)
+    # Keyset cursors order by (created_at, id)
+    created_at = Column(KeysetTimestamp, server_default=func.now(), nullable=False)
 
     # Relationships
-    jobs = relationship("Job", back_populates="company", cascade="all, delete-orphan") 
\ No newline at end of file
+    # Ordered explicitly: the row order otherwise depends on which index the plan uses
+    jobs = relationship(
+        "Job", back_populates="company", cascade="all, delete-orphan", order_by="Job.id"
+    )
\ No newline at end of file
@@ -1,7 +1,7 @@
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, Enum, Index, func
 from sqlalchemy.orm import relationship
 from enum import Enum as PyEnum
-from .base import Base, TimestampMixin
+from .base import Base, KeysetTimestamp, TimestampMixin
 from .associations import job_tags_table
 
 
@@ -31,10 +31,33 @@ class Job(Base, TimestampMixin):
     salary_min = Column(Integer)
     salary_max = Column(Integer)
     is_active = Column(Boolean, default=True)
+    # Keyset cursors order by (created_at, id)
+    created_at = Column(KeysetTimestamp, server_default=func.now(), nullable=False)
     
     # Foreign keys
     company_id = Column(Integer, ForeignKey("companies.id"), nullable=False)
+    # Canonical form of `location`, which keeps the text as posted
+    location_id = Column(Integer, ForeignKey("locations.id"))
     
     # Relationships
     company = relationship("Company", back_populates="jobs")
-    tags = relationship("Tag", secondary=job_tags_table, back_populates="jobs") 
\ No newline at end of file
+    tags = relationship("Tag", secondary=job_tags_table, back_populates="jobs")
+
+
+# Indexes serving JobService queries; see alembic/versions/0002_job_query_indexes.py,
+# 0003_salary_range_index.py and 0004_normalized_locations.py
+# Newest-first pages of active jobs, the public listing and search order
+Index("ix_jobs_active_created", Job.is_active, Job.created_at.desc(), Job.id.desc())
+# A company's jobs newest first; also serves lookups and counts by company
+Index("ix_jobs_company_created", Job.company_id, Job.created_at.desc(), Job.id.desc())
+# Location filters, which resolve to a few location ids
+Index("ix_jobs_location_created", Job.location_id, Job.created_at.desc(), Job.id.desc())
+# Type and level filters and facets
+Index("ix_jobs_type_level", Job.job_type, Job.job_level)
+# Salary range filters, on the advertised range's upper and lower end
+Index(
+    "ix_jobs_active_salary",
+    Job.is_active,
+    func.coalesce(Job.salary_max, Job.salary_min),
+    func.coalesce(Job.salary_min, Job.salary_max),
+)
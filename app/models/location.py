@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, String
+from .base import Base, TimestampMixin
+
+
+class Location(Base, TimestampMixin):
+    """Canonical place a job is located in; see app.search.places for the normal form."""
+    __tablename__ = "locations"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(255), nullable=False)
+    key = Column(String(255), unique=True, index=True, nullable=False)
+    city = Column(String(255), nullable=False, index=True)
+    region = Column(String(255), index=True)
+    country = Column(String(255), index=True)
@@ -0,0 +1,41 @@
+from sqlalchemy import (
+    Column, Integer, String, Enum, JSON, ForeignKey, Index, UniqueConstraint
+)
+from .base import Base, TimestampMixin
+from .job import JobType, JobLevel
+
+
+class SavedSearch(Base, TimestampMixin):
+    """A user's job filter, matched against jobs as they are posted or changed."""
+    __tablename__ = "saved_searches"
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(
+        Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    name = Column(String(255), nullable=False)
+    # Normalized tag names, and the TagMode and LocationMatch values they are matched with
+    tags = Column(JSON, nullable=False, default=list)
+    tag_mode = Column(String(10), nullable=False, default="any")
+    location = Column(String(255))
+    location_match = Column(String(10), nullable=False, default="place")
+    job_type = Column(Enum(JobType))
+    job_level = Column(Enum(JobLevel))
+    salary_min = Column(Integer)
+    salary_max = Column(Integer)
+
+
+class SearchAlert(Base, TimestampMixin):
+    """A job that matched a saved search when it was posted or changed."""
+    __tablename__ = "search_alerts"
+    __table_args__ = (UniqueConstraint("saved_search_id", "job_id"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    saved_search_id = Column(
+        Integer, ForeignKey("saved_searches.id", ondelete="CASCADE"), nullable=False
+    )
+    job_id = Column(Integer, ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False)
+
+
+# A job's alerts, removed with the job; see 0006_saved_searches.py
+Index("ix_search_alerts_job", SearchAlert.job_id)
@@ -0,0 +1,32 @@
+from sqlalchemy import Column, Integer, String, Text, Enum, DateTime, JSON, Index
+from enum import Enum as PyEnum
+from .base import Base, TimestampMixin
+
+
+class TaskStatus(PyEnum):
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class Task(Base, TimestampMixin):
+    """Deferred work queued by a request and run by a task worker; see app.tasks."""
+    __tablename__ = "tasks"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(100), nullable=False)
+    payload = Column(JSON, nullable=False)
+    status = Column(Enum(TaskStatus), nullable=False, default=TaskStatus.PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False)
+    # Earliest time the next attempt may start
+    run_at = Column(DateTime(timezone=True), nullable=False)
+    # Worker running the task, and when its claim lapses if that worker has gone away
+    locked_by = Column(String(255))
+    locked_until = Column(DateTime(timezone=True))
+    last_error = Column(Text)
+
+
+# Workers claim due tasks of the names they run, oldest first; see 0005_task_queue.py
+Index("ix_tasks_claim", Task.name, Task.status, Task.run_at)
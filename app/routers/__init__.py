@@ -3,5 +3,10 @@ from .companies import router as companies_router
 from .users import router as users_router
 from .jobs import router as jobs_router
 from .tags import router as tags_router
+from .suggest import router as suggest_router
+from .saved_searches import router as saved_searches_router
 
-__all__ = ["auth_router", "companies_router", "users_router", "jobs_router", "tags_router"] 
\ No newline at end of file
+__all__ = [
+    "auth_router", "companies_router", "users_router", "jobs_router", "tags_router",
+    "suggest_router", "saved_searches_router",
+]
\ No newline at end of file
@@ -37,7 +37,7 @@ async def login_company(
     
     access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
     access_token = create_access_token(
-        data={"sub": company.email, "user_type": "company"},
+        data={"sub": company.email, "user_type": "company", "id": company.id},
         expires_delta=access_token_expires
     )
     return {"access_token": access_token, "token_type": "bearer"}
@@ -67,7 +67,7 @@ async def login_user(
     
     access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
     access_token = create_access_token(
-        data={"sub": user.email, "user_type": "user"},
+        data={"sub": user.email, "user_type": "user", "id": user.id},
         expires_delta=access_token_expires
     )
     return {"access_token": access_token, "token_type": "bearer"} 
\ No newline at end of file
@@ -1,9 +1,14 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+import json
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import get_db
-from app.schemas import CompanyCreate, CompanyUpdate, CompanyOut
+from app.cache import COMPANY_LISTS, cached_json_response, company_dependency, encode_json
+from app.db import get_db, get_read_db
+from app.serialization import ModelResponse
+from app.schemas import (
+    CompanyCreate, CompanyUpdate, CompanyOut, CompanyListOut, CompanyPage, CompanyDetailOut
+)
 from app.services import CompanyService
 from app.auth.dependencies import get_current_active_company
 from app.models import Company
@@ -11,12 +16,37 @@ from app.models import Company
 router = APIRouter(prefix="/companies", tags=["Companies"])
 
 
-@router.get("/", response_model=List[CompanyOut])
+@router.get("/", response_model=Union[List[CompanyListOut], CompanyPage])
 async def list_companies(
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    name: Optional[str] = Query(None, description="Company name prefix, case-insensitive"),
+    skip: int = Query(0, ge=0, description="Number of companies to skip"),
+    limit: int = Query(100, ge=1, le=100, description="Maximum number of companies to return"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor from a previous page's next_cursor; pass an empty value to "
+                    "start cursor pagination. When present, skip is ignored and a page "
+                    "envelope is returned."
+    ),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """List all companies (public endpoint)."""
-    return await CompanyService.get_all_companies(db)
+    """List companies, newest first, with their active job counts (public endpoint).
+
+    Jobs themselves are listed only by GET /companies/{company_id}.
+    """
+    skip = 0 if cursor is not None else skip
+
+    async def load():
+        companies, next_cursor = await CompanyService.get_companies(db, name, skip, limit, cursor)
+        if cursor is not None:
+            body = encode_json(CompanyPage, {"items": companies, "next_cursor": next_cursor})
+        else:
+            body = encode_json(List[CompanyListOut], companies)
+        # Job writes invalidate company lists too, which keeps the job aggregates current
+        return body, {COMPANY_LISTS}
+
+    key = f"companies?{json.dumps([name, skip, limit, cursor])}"
+    return await cached_json_response(request, key, load)
 
 
 @router.post("/register", response_model=CompanyOut, status_code=status.HTTP_201_CREATED)
@@ -25,15 +55,18 @@ async def register_company(
     db: AsyncSession = Depends(get_db)
 ):
     """Register a new company."""
-    return await CompanyService.create_company(db, company_data)
+    company = await CompanyService.create_company(db, company_data)
+    return ModelResponse(CompanyOut, company, status_code=status.HTTP_201_CREATED)
 
 
 @router.get("/me", response_model=CompanyOut)
 async def get_current_company_info(
-    current_company: Company = Depends(get_current_active_company)
+    current_company: Company = Depends(get_current_active_company),
+    db: AsyncSession = Depends(get_db)
 ):
     """Get current company information."""
-    return current_company
+    # The authenticated company comes without its jobs, which CompanyOut lists
+    return ModelResponse(CompanyOut, await CompanyService.get_company_by_id(db, current_company.id))
 
 
 @router.put("/me", response_model=CompanyOut)
@@ -43,19 +76,35 @@ async def update_current_company(
     db: AsyncSession = Depends(get_db)
 ):
     """Update current company information."""
-    return await CompanyService.update_company(db, current_company, company_data)
+    company = await CompanyService.update_company(db, current_company, company_data)
+    return ModelResponse(CompanyOut, company)
 
 
-@router.get("/{company_id}", response_model=CompanyOut)
+@router.get("/{company_id}", response_model=CompanyDetailOut)
 async def get_company_by_id(
     company_id: int,
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    jobs_limit: int = Query(100, ge=1, le=100, description="Maximum number of jobs to return"),
+    jobs_cursor: Optional[str] = Query(
+        None, description="Cursor from a previous response's jobs_next_cursor"
+    ),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get company by ID (public endpoint)."""
-    company = await CompanyService.get_company_by_id(db, company_id)
-    if not company:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Company not found"
+    """Get company by ID with a page of its jobs, newest first (public endpoint)."""
+    async def load():
+        found = await CompanyService.get_company_with_jobs_page(
+            db, company_id, jobs_cursor, jobs_limit
         )
-    return company
\ No newline at end of file
+        if not found:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Company not found"
+            )
+        company, jobs_next_cursor = found
+        detail = CompanyDetailOut.model_validate(company).model_copy(
+            update={"jobs_next_cursor": jobs_next_cursor}
+        )
+        return encode_json(CompanyDetailOut, detail), {company_dependency(company.id)}
+
+    key = f"company:{company_id}?{json.dumps([jobs_cursor, jobs_limit])}"
+    return await cached_json_response(request, key, load)
@@ -1,58 +1,308 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import csv
+import io
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.types import Receive, Scope, Send
 
-from app.db import get_db
-from app.schemas import JobCreate, JobUpdate, JobOut, JobFilter
+from app.cache import (
+    JOB_LISTS, COMPANY_LISTS, cached_json_response, company_dependency, encode_json,
+    job_dependency
+)
+from app.config import settings
+from app.db import get_db, get_read_db
+from app.serialization import ModelResponse, share_nested
+from app.schemas import (
+    JobCreate, JobUpdate, JobOut, JobPage, JobSummaryOut, JobSummaryPage, JobView, JobFilter,
+    JobFacets, SalaryHistogram, TagMode, LocationMatch, ExportFormat
+)
 from app.models.job import JobType, JobLevel
 from app.services import JobService
-from app.auth.dependencies import get_current_active_company, get_current_active_user
+from app.auth.dependencies import (
+    get_current_active_company, get_current_active_user, get_current_company_claims,
+    get_full_export_access
+)
 from app.models import Company
+from app.schemas.auth import TokenData
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
 
-@router.get("/", response_model=List[JobOut])
-async def get_jobs(
+class DuplexStreamingResponse(StreamingResponse):
+    """Streaming response that may be sent while the request body is still being read.
+
+    StreamingResponse consumes `receive` to watch for a disconnect, which would take
+    request body chunks away from a body iterator that reads the request itself.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+async def ndjson_lines(
+    chunks: AsyncIterable[bytes],
+    max_line_bytes: int
+) -> AsyncIterator[Optional[bytes]]:
+    """Split a byte stream into lines, yielding None in place of over-long lines."""
+    buffer = b""
+    skipping = False
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if skipping:
+                skipping = False
+                yield None
+            elif len(line) > max_line_bytes:
+                yield None
+            else:
+                yield line
+        if len(buffer) > max_line_bytes:
+            # Drop the rest of this line as it arrives instead of buffering it
+            buffer = b""
+            skipping = True
+    if skipping:
+        yield None
+    elif buffer:
+        yield buffer
+
+
+EXPORT_FIELDS = [
+    "id", "title", "description", "location", "job_type", "job_level", "salary_min",
+    "salary_max", "is_active", "company_id", "company_name", "tags", "created_at", "updated_at",
+]
+
+# Encoded rows are sent in groups of this many rather than one chunk per row
+EXPORT_ROWS_PER_CHUNK = 200
+
+
+async def encode_csv(rows: AsyncIterable[Dict[str, Any]]) -> AsyncIterator[str]:
+    """Encode export rows as CSV, header first; tags are joined with commas."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+    writer.writeheader()
+    count = 0
+    async for row in rows:
+        writer.writerow({**row, "tags": ",".join(row["tags"])})
+        count += 1
+        if count % EXPORT_ROWS_PER_CHUNK == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+async def encode_ndjson(rows: AsyncIterable[Dict[str, Any]]) -> AsyncIterator[str]:
+    """Encode export rows as newline-delimited JSON objects."""
+    lines = []
+    async for row in rows:
+        lines.append(json.dumps(row) + "\n")
+        if len(lines) == EXPORT_ROWS_PER_CHUNK:
+            yield "".join(lines)
+            lines = []
+    yield "".join(lines)
+
+
+def export_response(rows: AsyncIterable[Dict[str, Any]], format: ExportFormat) -> StreamingResponse:
+    """Stream export rows as a CSV or NDJSON download."""
+    if format == ExportFormat.CSV:
+        content, media_type = encode_csv(rows), "text/csv"
+    else:
+        content, media_type = encode_ndjson(rows), "application/x-ndjson"
+    return StreamingResponse(
+        content,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="jobs.{format.value}"'}
+    )
+
+
+def job_filters(
     tags: Optional[str] = Query(None, description="Comma-separated list of tags"),
-    location: Optional[str] = Query(None, description="Location filter"),
+    tag_mode: TagMode = Query(
+        TagMode.ANY, description="Match jobs with any of the tags, or only those with all of them"
+    ),
+    location: Optional[str] = Query(
+        None, description="Place the job is in, such as a city, region or country"
+    ),
+    location_match: LocationMatch = Query(
+        LocationMatch.PLACE,
+        description="Match jobs in the place, or whose location text contains the filter"
+    ),
     job_type: Optional[JobType] = Query(None, description="Job type filter"),
     job_level: Optional[JobLevel] = Query(None, description="Job level filter"),
     salary_min: Optional[int] = Query(None, ge=0, description="Minimum salary"),
     salary_max: Optional[int] = Query(None, ge=0, description="Maximum salary"),
-    is_active: bool = Query(True, description="Show active jobs only"),
-    skip: int = Query(0, ge=0, description="Number of jobs to skip"),
-    limit: int = Query(100, ge=1, le=100, description="Maximum number of jobs to return"),
-    db: AsyncSession = Depends(get_db)
-):
-    """Get jobs with filtering options."""
-    filters = JobFilter(
+    is_active: bool = Query(True, description="Show active jobs only")
+) -> JobFilter:
+    """Job search filters shared by the listing and facet endpoints.
+
+    A location filter matches jobs in that place or within it, so "Kenya" matches
+    "Nairobi, Kenya"; `location_match=contains` falls back to unindexed substring matching.
+    A salary filter matches jobs whose advertised range overlaps the requested one.
+    """
+    if salary_min is not None and salary_max is not None and salary_min > salary_max:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="salary_min cannot be greater than salary_max"
+        )
+    return JobFilter(
         tags=tags,
+        tag_mode=tag_mode,
         location=location,
+        location_match=location_match,
         job_type=job_type,
         job_level=job_level,
         salary_min=salary_min,
         salary_max=salary_max,
-        is_active=is_active,
-        skip=skip,
-        limit=limit
+        is_active=is_active
     )
-    return await JobService.get_jobs_with_filters(db, filters)
+
+
+def summary_fields(
+    view: JobView = Query(
+        JobView.FULL, description="Return full JobOut objects or compact JobSummaryOut ones"
+    ),
+    fields: Optional[str] = Query(
+        None, description="Comma-separated JobSummaryOut fields to return; implies view=summary"
+    )
+) -> Optional[List[str]]:
+    """The JobSummaryOut fields to return, in schema order, or None for full jobs."""
+    if fields is None:
+        return list(JobSummaryOut.model_fields) if view == JobView.SUMMARY else None
+
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - JobSummaryOut.model_fields.keys()
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    return [name for name in JobSummaryOut.model_fields if not requested or name in requested]
+
+
+@router.get(
+    "/", response_model=Union[List[JobOut], JobPage, List[JobSummaryOut], JobSummaryPage]
+)
+async def get_jobs(
+    request: Request,
+    filters: JobFilter = Depends(job_filters),
+    fields: Optional[List[str]] = Depends(summary_fields),
+    skip: int = Query(0, ge=0, description="Number of jobs to skip"),
+    limit: int = Query(100, ge=1, le=100, description="Maximum number of jobs to return"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor from a previous page's next_cursor; pass an empty value to "
+                    "start cursor pagination. When present, skip is ignored and a page "
+                    "envelope is returned."
+    ),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Get jobs with filtering options.
+
+    With view=summary or a fields list, each job is a JobSummaryOut, or the requested
+    subset of its fields, and only those columns are loaded.
+    """
+    filters = filters.model_copy(update={
+        "tags": ",".join(filters.tag_names()) or None,
+        "skip": 0 if cursor is not None else skip,
+        "limit": limit,
+        "cursor": cursor,
+    })
+    key = f"jobs?{filters.model_dump_json()}"
+
+    async def load_summaries():
+        rows, next_cursor = await JobService.get_job_summaries(db, filters, fields)
+        if cursor is not None:
+            body = encode_json(Dict[str, Any], {"items": rows, "next_cursor": next_cursor})
+        else:
+            body = encode_json(List[Dict[str, Any]], rows)
+        return body, {JOB_LISTS, COMPANY_LISTS} if "company" in fields else {JOB_LISTS}
+
+    if fields is not None:
+        key = f"{key}&fields={','.join(fields)}"
+        return await cached_json_response(request, key, load_summaries)
+
+    async def load():
+        if cursor is not None:
+            jobs, next_cursor = await JobService.get_jobs_page(db, filters)
+            items = share_nested(jobs, JobOut, "company")
+            body = encode_json(JobPage, {"items": items, "next_cursor": next_cursor})
+        else:
+            jobs = await JobService.get_jobs_with_filters(db, filters)
+            body = encode_json(List[JobOut], share_nested(jobs, JobOut, "company"))
+        companies = {company_dependency(job.company_id) for job in jobs}
+        return body, {JOB_LISTS, *companies}
+
+    return await cached_json_response(request, key, load)
+
+
+@router.get("/facets", response_model=JobFacets)
+async def get_job_facets(
+    filters: JobFilter = Depends(job_filters),
+    top: int = Query(10, ge=1, le=50, description="Number of tags and locations to return"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Get match counts per job type, level, tag, location and salary range.
+
+    Each facet is counted with every filter applied except its own, so the counts
+    show how many jobs selecting that value instead would return.
+    """
+    return ModelResponse(JobFacets, await JobService.get_job_facets(db, filters, top))
+
+
+@router.get("/salary-histogram", response_model=SalaryHistogram)
+async def get_salary_histogram(
+    filters: JobFilter = Depends(job_filters),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Get the number of matching jobs per salary bucket.
+
+    Every filter applies, the salary range included. A job counts in each bucket its
+    advertised range overlaps; `with_salary` counts the matches advertising a salary.
+    """
+    return ModelResponse(SalaryHistogram, await JobService.get_salary_histogram(db, filters))
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_jobs(
+    filters: JobFilter = Depends(job_filters),
+    format: ExportFormat = Query(ExportFormat.CSV, description="Export file format"),
+    full_access: bool = Depends(get_full_export_access),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Export jobs matching the filters, newest first, as CSV or NDJSON.
+
+    Signed-in users and companies get active jobs only, at most `export_max_rows` of
+    them; callers presenting the export token get every matching job.
+    """
+    limit = None
+    if not full_access:
+        filters = filters.model_copy(update={"is_active": True})
+        limit = settings.export_max_rows
+    return export_response(JobService.export_jobs(db, filters, limit=limit), format)
 
 
 @router.get("/{job_id}", response_model=JobOut)
 async def get_job_by_id(
     job_id: int,
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get job by ID."""
-    job = await JobService.get_job_by_id(db, job_id)
-    if not job:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job not found"
-        )
-    return job
+    async def load():
+        job = await JobService.get_job_by_id(db, job_id)
+        if not job:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Job not found"
+            )
+        return encode_json(JobOut, job), {job_dependency(job.id), company_dependency(job.company_id)}
+
+    return await cached_json_response(request, f"job:{job_id}", load)
 
 
 @router.post("/", response_model=JobOut, status_code=status.HTTP_201_CREATED)
@@ -62,7 +312,27 @@ async def create_job(
     db: AsyncSession = Depends(get_db)
 ):
     """Create a new job posting (companies only)."""
-    return await JobService.create_job(db, job_data, current_company.id)
+    job = await JobService.create_job(db, job_data, current_company.id)
+    return ModelResponse(JobOut, job, status_code=status.HTTP_201_CREATED)
+
+
+@router.post("/bulk", response_class=DuplexStreamingResponse)
+async def create_jobs_bulk(
+    request: Request,
+    current_company: Company = Depends(get_current_active_company),
+    db: AsyncSession = Depends(get_db)
+):
+    """Create job postings from an NDJSON body, one JobCreate object per line (companies only).
+
+    Returns an NDJSON stream with one JobIngestResult per non-blank line, written as
+    each batch of rows is saved.
+    """
+    lines = ndjson_lines(request.stream(), settings.bulk_ingest_max_line_bytes)
+    results = JobService.ingest_jobs(db, lines, current_company.id)
+    return DuplexStreamingResponse(
+        (result.model_dump_json(exclude_none=True) + "\n" async for result in results),
+        media_type="application/x-ndjson"
+    )
 
 
 @router.put("/{job_id}", response_model=JobOut)
@@ -80,7 +350,7 @@ async def update_job(
             detail="Job not found"
         )
     
-    return await JobService.update_job(db, job, job_data, current_company.id)
+    return ModelResponse(JobOut, await JobService.update_job(db, job, job_data, current_company.id))
 
 
 @router.delete("/{job_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -100,12 +370,35 @@ async def delete_job(
     await JobService.delete_job(db, job, current_company.id)
 
 
-@router.get("/company/my-jobs", response_model=List[JobOut])
+@router.get("/company/my-jobs", response_model=Union[List[JobOut], JobPage])
 async def get_company_jobs(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100),
-    current_company: Company = Depends(get_current_active_company),
-    db: AsyncSession = Depends(get_db)
+    cursor: Optional[str] = Query(
+        None,
+        description="Cursor from a previous page's next_cursor; pass an empty value to "
+                    "start cursor pagination."
+    ),
+    current_company: Union[Company, TokenData] = Depends(get_current_company_claims),
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get all jobs for the current company."""
-    return await JobService.get_company_jobs(db, current_company.id, skip, limit) 
\ No newline at end of file
+    if cursor is not None:
+        jobs, next_cursor = await JobService.get_company_jobs_page(
+            db, current_company.id, cursor, limit
+        )
+        items = share_nested(jobs, JobOut, "company")
+        return ModelResponse(JobPage, {"items": items, "next_cursor": next_cursor})
+    jobs = await JobService.get_company_jobs(db, current_company.id, skip, limit)
+    return ModelResponse(List[JobOut], share_nested(jobs, JobOut, "company"))
+
+
+@router.get("/company/my-jobs/export", response_class=StreamingResponse)
+async def export_company_jobs(
+    filters: JobFilter = Depends(job_filters),
+    format: ExportFormat = Query(ExportFormat.CSV, description="Export file format"),
+    current_company: Union[Company, TokenData] = Depends(get_current_company_claims),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """Export the current company's jobs matching the filters as CSV or NDJSON."""
+    return export_response(JobService.export_jobs(db, filters, current_company.id), format)
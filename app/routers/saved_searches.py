@@ -0,0 +1,67 @@
+from typing import List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import get_db
+from app.schemas import SavedSearchCreate, SavedSearchOut, SearchAlertOut
+from app.services import SavedSearchService
+from app.auth.dependencies import get_current_active_user
+from app.models import User, Company
+
+router = APIRouter(prefix="/saved-searches", tags=["Saved Searches"])
+
+
+async def get_current_job_seeker(
+    current_user: Union[User, Company] = Depends(get_current_active_user)
+) -> User:
+    """Get the current user, refusing companies."""
+    if isinstance(current_user, Company):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="This endpoint is for users only"
+        )
+    return current_user
+
+
+@router.post("", response_model=SavedSearchOut, status_code=status.HTTP_201_CREATED)
+async def create_saved_search(
+    search_data: SavedSearchCreate,
+    current_user: User = Depends(get_current_job_seeker),
+    db: AsyncSession = Depends(get_db)
+):
+    """Save a job filter; jobs matching it when posted or changed are recorded as alerts."""
+    return await SavedSearchService.create_saved_search(db, current_user, search_data)
+
+
+@router.get("", response_model=List[SavedSearchOut])
+async def get_saved_searches(
+    current_user: User = Depends(get_current_job_seeker),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get the current user's saved searches."""
+    return await SavedSearchService.get_user_saved_searches(db, current_user)
+
+
+@router.get("/alerts", response_model=List[SearchAlertOut])
+async def get_search_alerts(
+    saved_search_id: Optional[int] = Query(None, description="Only this saved search's alerts"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=100),
+    current_user: User = Depends(get_current_job_seeker),
+    db: AsyncSession = Depends(get_db)
+):
+    """Get jobs that matched the current user's saved searches, newest first."""
+    return await SavedSearchService.get_user_alerts(
+        db, current_user, saved_search_id, skip, limit
+    )
+
+
+@router.delete("/{saved_search_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_saved_search(
+    saved_search_id: int,
+    current_user: User = Depends(get_current_job_seeker),
+    db: AsyncSession = Depends(get_db)
+):
+    """Delete one of the current user's saved searches."""
+    search = await SavedSearchService.get_saved_search(db, saved_search_id, current_user)
+    await SavedSearchService.delete_saved_search(db, search)
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, HTTPException, Query, status
+
+from app.schemas import Suggestions
+from app.search import suggest_index
+from app.search.suggest import MAX_SUGGESTIONS
+
+router = APIRouter(prefix="/suggest", tags=["Search"])
+
+
+@router.get("", response_model=Suggestions)
+async def suggest(
+    q: str = Query(..., min_length=1, max_length=100, description="Text typed so far"),
+    limit: int = Query(5, ge=1, le=MAX_SUGGESTIONS, description="Suggestions per kind")
+):
+    """Suggest job titles, tags, companies and locations as a search is typed.
+
+    Any word of a name matches by prefix; suggestions are ranked by active job count.
+    Answered from memory without touching the database.
+    """
+    suggestions = suggest_index.suggest(q, limit)
+    if suggestions is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Suggestions are still loading",
+            headers={"Retry-After": "1"},
+        )
+    return suggestions
@@ -1,8 +1,9 @@
 from typing import List
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import get_db
+from app.cache import TAG_LISTS, cached_json_response, encode_json
+from app.db import get_read_db
 from app.schemas import TagOut
 from app.services import TagService
 
@@ -10,6 +11,9 @@ router = APIRouter(prefix="/tags", tags=["Tags"])
 
 
 @router.get("/", response_model=List[TagOut])
-async def get_all_tags(db: AsyncSession = Depends(get_db)):
+async def get_all_tags(request: Request, db: AsyncSession = Depends(get_read_db)):
     """Get all available tags."""
-    return await TagService.get_all_tags(db) 
\ No newline at end of file
+    async def load():
+        return encode_json(List[TagOut], await TagService.get_all_tags(db)), {TAG_LISTS}
+
+    return await cached_json_response(request, "tags", load)
@@ -1,13 +1,26 @@
-from .company import CompanyCreate, CompanyUpdate, CompanyOut, CompanyLogin
+from .company import (
+    CompanyCreate, CompanyUpdate, CompanyOut, CompanyListOut, CompanyPage, CompanyDetailOut,
+    CompanyLogin, JobCompanyOut
+)
 from .user import UserCreate, UserUpdate, UserOut, UserLogin
-from .job import JobCreate, JobUpdate, JobOut, JobFilter
+from .job import (
+    JobCreate, JobUpdate, JobOut, JobPage, JobSummaryOut, JobSummaryPage, JobView, JobFilter,
+    JobFacets, SalaryHistogram, JobIngestResult, TagMode, LocationMatch, ExportFormat
+)
 from .tag import TagCreate, TagOut
+from .saved_search import SavedSearchCreate, SavedSearchOut, SearchAlertOut
+from .suggest import Suggestion, CompanySuggestion, Suggestions
 from .auth import Token, TokenData
 
 __all__ = [
-    "CompanyCreate", "CompanyUpdate", "CompanyOut", "CompanyLogin",
+    "CompanyCreate", "CompanyUpdate", "CompanyOut", "CompanyListOut", "CompanyPage",
+    "CompanyDetailOut", "CompanyLogin", "JobCompanyOut",
     "UserCreate", "UserUpdate", "UserOut", "UserLogin",
-    "JobCreate", "JobUpdate", "JobOut", "JobFilter",
+    "JobCreate", "JobUpdate", "JobOut", "JobPage", "JobSummaryOut", "JobSummaryPage", "JobView",
+    "JobFilter", "JobFacets", "SalaryHistogram",
+    "JobIngestResult", "TagMode", "LocationMatch", "ExportFormat",
     "TagCreate", "TagOut",
+    "SavedSearchCreate", "SavedSearchOut", "SearchAlertOut",
+    "Suggestion", "CompanySuggestion", "Suggestions",
     "Token", "TokenData"
 ] 
\ No newline at end of file
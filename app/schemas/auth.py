@@ -9,4 +9,5 @@ class Token(BaseModel):
 
 class TokenData(BaseModel):
     email: Optional[str] = None
-    user_type: Optional[str] = None  # "company" or "user" 
\ No newline at end of file
+    user_type: Optional[str] = None  # "company" or "user"
+    id: Optional[int] = None
\ No newline at end of file
@@ -42,13 +42,41 @@ class CompanyLogin(BaseModel):
     password: str
 
 
-class CompanyOut(CompanyBase):
+class JobCompanyOut(CompanyBase):
+    """The company nested in a job, without the company's own job list."""
     id: int
     is_active: bool
     is_verified: bool
     created_at: datetime
     updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class CompanyOut(JobCompanyOut):
     jobs: List[SimpleJobOut] = []
     
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True
+
+
+class CompanyListOut(CompanyBase):
+    """Company directory entry: the company without its jobs, plus job aggregates."""
+    id: int
+    is_active: bool
+    is_verified: bool
+    created_at: datetime
+    updated_at: datetime
+    active_job_count: int = 0
+    latest_job_at: Optional[datetime] = None
+
+
+class CompanyPage(BaseModel):
+    items: List[CompanyListOut]
+    next_cursor: Optional[str] = None
+
+
+class CompanyDetailOut(CompanyOut):
+    """A company with one page of its jobs, newest first."""
+    jobs_next_cursor: Optional[str] = None
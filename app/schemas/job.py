@@ -1,9 +1,16 @@
-from pydantic import BaseModel, Field
-from typing import Optional, List
+from pydantic import BaseModel, Field, model_validator
+from typing import Any, Dict, Optional, List
 from datetime import datetime
+from enum import Enum
 from app.models.job import JobType, JobLevel
 from .tag import TagOut
-from .company import CompanyOut
+from .company import JobCompanyOut
+
+
+def check_salary_range(salary_min: Optional[int], salary_max: Optional[int]) -> None:
+    """Reject a range whose lower bound is above its upper bound."""
+    if salary_min is not None and salary_max is not None and salary_min > salary_max:
+        raise ValueError("salary_min cannot be greater than salary_max")
 
 
 class JobBase(BaseModel):
@@ -19,6 +26,11 @@ class JobBase(BaseModel):
 class JobCreate(JobBase):
     tag_names: List[str] = Field(default_factory=list)
 
+    @model_validator(mode="after")
+    def validate_salary_range(self) -> "JobCreate":
+        check_salary_range(self.salary_min, self.salary_max)
+        return self
+
 
 class JobUpdate(BaseModel):
     title: Optional[str] = Field(None, min_length=1, max_length=255)
@@ -31,6 +43,12 @@ class JobUpdate(BaseModel):
     tag_names: Optional[List[str]] = None
     is_active: Optional[bool] = None
 
+    @model_validator(mode="after")
+    def validate_salary_range(self) -> "JobUpdate":
+        """Check the bounds given together; JobService checks one against the stored other."""
+        check_salary_range(self.salary_min, self.salary_max)
+        return self
+
 
 class JobOut(JobBase):
     id: int
@@ -39,19 +57,122 @@ class JobOut(JobBase):
     created_at: datetime
     updated_at: datetime
     tags: List[TagOut] = []
-    company: Optional[CompanyOut] = None
+    company: Optional[JobCompanyOut] = None
     
     class Config:
         from_attributes = True
 
 
+class JobPage(BaseModel):
+    items: List[JobOut]
+    next_cursor: Optional[str] = None
+
+
+class JobView(str, Enum):
+    FULL = "full"
+    SUMMARY = "summary"
+
+
+class CompanySummaryOut(BaseModel):
+    id: int
+    company_name: str
+
+
+class JobSummaryOut(BaseModel):
+    """Compact list representation of a job; `description` is truncated."""
+    id: int
+    title: str
+    description: str
+    location: Optional[str] = None
+    job_type: JobType
+    job_level: JobLevel
+    salary_min: Optional[int] = None
+    salary_max: Optional[int] = None
+    is_active: bool
+    company_id: int
+    created_at: datetime
+    tags: List[str] = []
+    company: Optional[CompanySummaryOut] = None
+
+
+class JobSummaryPage(BaseModel):
+    items: List[JobSummaryOut]
+    next_cursor: Optional[str] = None
+
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+
+class SalaryBucketCount(BaseModel):
+    min: int
+    max: Optional[int] = None
+    count: int
+
+
+class SalaryHistogram(BaseModel):
+    """Matching jobs per salary bucket; a job counts in every bucket its range overlaps."""
+    total: int
+    with_salary: int
+    bucket_size: int
+    buckets: List[SalaryBucketCount]
+
+
+class JobFacets(BaseModel):
+    total: int
+    job_type: List[FacetCount]
+    job_level: List[FacetCount]
+    tags: List[FacetCount]
+    locations: List[FacetCount]
+    salary: List[SalaryBucketCount]
+
+
+class JobIngestStatus(str, Enum):
+    CREATED = "created"
+    ERROR = "error"
+
+
+class JobIngestResult(BaseModel):
+    """Outcome of one line of a bulk NDJSON upload."""
+    line: int
+    status: JobIngestStatus
+    id: Optional[int] = None
+    errors: Optional[List[Dict[str, Any]]] = None
+
+
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+
+class TagMode(str, Enum):
+    ANY = "any"
+    ALL = "all"
+
+
+class LocationMatch(str, Enum):
+    PLACE = "place"
+    CONTAINS = "contains"
+
+
 class JobFilter(BaseModel):
     tags: Optional[str] = Field(None, description="Comma-separated list of tags")
+    tag_mode: TagMode = TagMode.ANY
     location: Optional[str] = None
+    location_match: LocationMatch = LocationMatch.PLACE
     job_type: Optional[JobType] = None
     job_level: Optional[JobLevel] = None
     salary_min: Optional[int] = Field(None, ge=0)
     salary_max: Optional[int] = Field(None, ge=0)
     is_active: bool = True
     skip: int = Field(0, ge=0)
-    limit: int = Field(100, ge=1, le=100) 
\ No newline at end of file
+    limit: int = Field(100, ge=1, le=100)
+    cursor: Optional[str] = None
+
+    def tag_names(self) -> List[str]:
+        """Normalized, de-duplicated tag names from the comma-separated `tags` filter."""
+        if not self.tags:
+            return []
+        names = (tag.strip().lower() for tag in self.tags.split(","))
+        return list(dict.fromkeys(name for name in names if name))
\ No newline at end of file
@@ -0,0 +1,43 @@
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Optional
+from datetime import datetime
+from app.models.job import JobType, JobLevel
+from .job import TagMode, LocationMatch, check_salary_range
+
+
+class SavedSearchCreate(BaseModel):
+    """A job filter to be alerted about; the fields mean what they do on GET /jobs."""
+    name: str = Field(..., min_length=1, max_length=255)
+    tags: List[str] = Field(default_factory=list, max_length=20)
+    tag_mode: TagMode = TagMode.ANY
+    location: Optional[str] = Field(None, max_length=255)
+    location_match: LocationMatch = LocationMatch.PLACE
+    job_type: Optional[JobType] = None
+    job_level: Optional[JobLevel] = None
+    salary_min: Optional[int] = Field(None, ge=0)
+    salary_max: Optional[int] = Field(None, ge=0)
+
+    @model_validator(mode="after")
+    def validate_salary_range(self) -> "SavedSearchCreate":
+        check_salary_range(self.salary_min, self.salary_max)
+        return self
+
+
+class SavedSearchOut(SavedSearchCreate):
+    id: int
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class SearchAlertOut(BaseModel):
+    """A job that matched one of the user's saved searches when posted or changed."""
+    id: int
+    saved_search_id: int
+    job_id: int
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
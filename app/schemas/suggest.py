@@ -0,0 +1,19 @@
+from pydantic import BaseModel
+from typing import List
+
+
+class Suggestion(BaseModel):
+    value: str
+    count: int
+
+
+class CompanySuggestion(Suggestion):
+    id: int
+
+
+class Suggestions(BaseModel):
+    """Names matching a typed prefix, most active jobs first, per kind."""
+    titles: List[Suggestion]
+    tags: List[Suggestion]
+    companies: List[CompanySuggestion]
+    locations: List[Suggestion]
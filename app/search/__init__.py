@@ -0,0 +1,10 @@
+from .bitmap import Bitmap
+from .percolator import SavedSearchPercolator, saved_search_percolator
+from .read_model import JobReadModel, job_read_model
+from .suggest import SuggestIndex, suggest_index
+from .tag_index import TagIndex, tag_index
+
+__all__ = [
+    "Bitmap", "SavedSearchPercolator", "saved_search_percolator", "JobReadModel",
+    "job_read_model", "SuggestIndex", "suggest_index", "TagIndex", "tag_index",
+]
@@ -0,0 +1,211 @@
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, Iterator, List, Union
+
+# Values are split into chunks of 2**16 by their high bits. A chunk holding up to
+# _ARRAY_MAX values is a sorted array of 16-bit offsets; a denser chunk is a
+# 65536-bit integer. Both layouts top out at 8 KiB per chunk.
+_CHUNK_BITS = 16
+_LOW_MASK = (1 << _CHUNK_BITS) - 1
+_ARRAY_MAX = 4096
+# Above this many values between two array chunks, intersecting their bit forms beats
+# hashing one of them
+_SET_MAX = 1024
+
+Container = Union["array[int]", int]
+
+try:
+    _popcount = int.bit_count  # type: ignore[attr-defined]
+except AttributeError:  # Python < 3.10
+    def _popcount(value: int) -> int:
+        return bin(value).count("1")
+
+
+def _to_bits(values: Iterable[int]) -> int:
+    buffer = bytearray(1 << (_CHUNK_BITS - 3))
+    for value in values:
+        buffer[value >> 3] |= 1 << (value & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def _bits_to_array(bits: int) -> "array[int]":
+    values = array("H")
+    digits = bin(bits)[:1:-1]  # least significant bit first
+    position = digits.find("1")
+    while position != -1:
+        values.append(position)
+        position = digits.find("1", position + 1)
+    return values
+
+
+def _length(container: Container) -> int:
+    return _popcount(container) if isinstance(container, int) else len(container)
+
+
+def _compact(container: Container) -> Container:
+    """Pick the layout that suits the container's cardinality."""
+    if isinstance(container, int):
+        return _bits_to_array(container) if _popcount(container) <= _ARRAY_MAX else container
+    return _to_bits(container) if len(container) > _ARRAY_MAX else container
+
+
+def _and(left: Container, right: Container) -> Container:
+    if isinstance(left, int) and isinstance(right, int):
+        return _compact(left & right)
+    return array("H", sorted(set(left).intersection(right)))
+
+
+class Bitmap:
+    """Compressed set of non-negative integers, used as a posting list of job ids."""
+
+    __slots__ = ("_chunks",)
+
+    def __init__(self, values: Iterable[int] = ()) -> None:
+        self._chunks: Dict[int, Container] = {}
+        for value in sorted(values):
+            self.add(value)
+
+    @classmethod
+    def _from_chunks(cls, chunks: Dict[int, Container]) -> "Bitmap":
+        bitmap = cls()
+        bitmap._chunks = {key: chunk for key, chunk in chunks.items() if _length(chunk)}
+        return bitmap
+
+    def _bits_of(self, key: int) -> int:
+        # Testing an array's values one by one against a 65536-bit int costs a full
+        # shift per value, so mixed operations pack the array and use a single AND.
+        # The packed form is not kept: it would cost up to 8 KiB per chunk for as
+        # long as the bitmap lives, however sparse the chunk.
+        chunk = self._chunks[key]
+        return chunk if isinstance(chunk, int) else _to_bits(chunk)
+
+    def _use_bits(self, other: "Bitmap", key: int) -> bool:
+        left, right = self._chunks[key], other._chunks[key]
+        if isinstance(left, int) or isinstance(right, int):
+            return True
+        return len(left) + len(right) > _SET_MAX
+
+    def _and_chunk(self, other: "Bitmap", key: int) -> Container:
+        # Results stay in bit form even when sparse: they are usually short-lived query
+        # intermediates, and unpacking them only to pack them again is wasted work.
+        if self._use_bits(other, key):
+            return self._bits_of(key) & other._bits_of(key)
+        return _and(self._chunks[key], other._chunks[key])
+
+    def add(self, value: int) -> None:
+        key, low = value >> _CHUNK_BITS, value & _LOW_MASK
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            self._chunks[key] = array("H", [low])
+        elif isinstance(chunk, int):
+            self._chunks[key] = chunk | (1 << low)
+        else:
+            position = bisect_left(chunk, low)
+            if position < len(chunk) and chunk[position] == low:
+                return
+            chunk.insert(position, low)
+            if len(chunk) > _ARRAY_MAX:
+                self._chunks[key] = _to_bits(chunk)
+
+    def discard(self, value: int) -> None:
+        key, low = value >> _CHUNK_BITS, value & _LOW_MASK
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            return
+        if isinstance(chunk, int):
+            chunk = _compact(chunk & ~(1 << low))
+        else:
+            position = bisect_left(chunk, low)
+            if position < len(chunk) and chunk[position] == low:
+                del chunk[position]
+        if _length(chunk):
+            self._chunks[key] = chunk
+        else:
+            del self._chunks[key]
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, int):
+            return False
+        chunk = self._chunks.get(value >> _CHUNK_BITS)
+        if chunk is None:
+            return False
+        low = value & _LOW_MASK
+        if isinstance(chunk, int):
+            return bool(chunk >> low & 1)
+        position = bisect_left(chunk, low)
+        return position < len(chunk) and chunk[position] == low
+
+    def __len__(self) -> int:
+        return sum(_length(chunk) for chunk in self._chunks.values())
+
+    def __bool__(self) -> bool:
+        return bool(self._chunks)
+
+    def __iter__(self) -> Iterator[int]:
+        for key in sorted(self._chunks):
+            chunk = self._chunks[key]
+            base = key << _CHUNK_BITS
+            if isinstance(chunk, int):
+                chunk = _bits_to_array(chunk)
+            for low in chunk:
+                yield base | low
+
+    def __and__(self, other: "Bitmap") -> "Bitmap":
+        return Bitmap._from_chunks({
+            key: self._and_chunk(other, key) for key in self._chunks if key in other._chunks
+        })
+
+    def __or__(self, other: "Bitmap") -> "Bitmap":
+        return Bitmap.union([self, other])
+
+    def intersection_len(self, other: "Bitmap") -> int:
+        """Cardinality of self & other without materializing it."""
+        total = 0
+        for key, chunk in self._chunks.items():
+            if key not in other._chunks:
+                continue
+            if self._use_bits(other, key):
+                total += _popcount(self._bits_of(key) & other._bits_of(key))
+            else:
+                total += len(set(chunk).intersection(other._chunks[key]))
+        return total
+
+    def copy(self) -> "Bitmap":
+        return Bitmap._from_chunks({
+            key: chunk if isinstance(chunk, int) else array("H", chunk)
+            for key, chunk in self._chunks.items()
+        })
+
+    @staticmethod
+    def union(bitmaps: Iterable["Bitmap"]) -> "Bitmap":
+        sources: Dict[int, List[Bitmap]] = {}
+        for bitmap in bitmaps:
+            for key in bitmap._chunks:
+                sources.setdefault(key, []).append(bitmap)
+        chunks: Dict[int, Container] = {}
+        for key, group in sources.items():
+            containers = [bitmap._chunks[key] for bitmap in group]
+            if len(group) == 1:
+                chunk = containers[0]
+                chunks[key] = chunk if isinstance(chunk, int) else array("H", chunk)
+            elif any(isinstance(chunk, int) for chunk in containers) or \
+                    sum(map(len, containers)) > _SET_MAX:
+                bits = 0
+                for bitmap in group:
+                    bits |= bitmap._bits_of(key)
+                chunks[key] = bits
+            else:
+                chunks[key] = _compact(array("H", sorted(set().union(*containers))))
+        return Bitmap._from_chunks(chunks)
+
+    @staticmethod
+    def intersection(bitmaps: List["Bitmap"]) -> "Bitmap":
+        if not bitmaps:
+            return Bitmap()
+        ordered = sorted(bitmaps, key=len)
+        result = ordered[0].copy()
+        for bitmap in ordered[1:]:
+            if not result:
+                break
+            result = result & bitmap
+        return result
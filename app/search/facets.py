@@ -0,0 +1,47 @@
+from collections import Counter
+from typing import Callable, Dict, Hashable, Iterable, List, Mapping, Tuple
+
+from .bitmap import Bitmap
+
+# Below this many matching jobs it is cheaper to count values document by document
+# than to intersect the match with every value's posting list.
+SCAN_THRESHOLD = 20000
+
+
+def _ranking(item: Tuple[Hashable, int]) -> Tuple[int, str]:
+    return -item[1], str(item[0])
+
+
+def top_values(
+    base: Bitmap,
+    postings: Mapping[Hashable, Bitmap],
+    upper_bounds: Mapping[Hashable, int],
+    values_of: Callable[[int], Iterable[Hashable]],
+    limit: int
+) -> List[Tuple[Hashable, int]]:
+    """The `limit` most frequent values among the jobs in `base`, with their counts.
+
+    Small bases are counted directly. For large ones, values are visited in order of
+    their overall frequency, which bounds what they can contribute, and the scan stops
+    once no remaining value could displace the current top `limit`.
+    """
+    if len(base) <= SCAN_THRESHOLD:
+        counts: Counter = Counter()
+        for job_id in base:
+            counts.update(values_of(job_id))
+        return sorted(counts.items(), key=_ranking)[:limit]
+
+    top: List[Tuple[Hashable, int]] = []
+    for value, bound in sorted(upper_bounds.items(), key=lambda item: -item[1]):
+        if len(top) == limit and bound < top[-1][1]:
+            break
+        posting = postings.get(value)
+        count = base.intersection_len(posting) if posting is not None else 0
+        if count:
+            top = sorted(top + [(value, count)], key=_ranking)[:limit]
+    return top
+
+
+def value_counts(base: Bitmap, postings: Mapping[Hashable, Bitmap]) -> Dict[Hashable, int]:
+    """Counts for a low-cardinality dimension, one intersection per value."""
+    return {value: base.intersection_len(posting) for value, posting in postings.items()}
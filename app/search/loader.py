@@ -0,0 +1,88 @@
+import asyncio
+import logging
+from typing import Callable, Generic, List, Optional, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+State = TypeVar("State")
+
+
+class BackgroundLoaded(Generic[State]):
+    """Base for in-memory structures built from the database and kept current by writes.
+
+    Subclasses implement `build`, which should do its CPU-bound work in a worker thread
+    (asyncio.to_thread) so that requests are served while it runs. Changes arriving while
+    a build is in flight are queued and replayed onto the new state before it is swapped
+    in, so no write is lost.
+    """
+
+    name = "index"
+
+    def __init__(self) -> None:
+        self._state: Optional[State] = None
+        self._loading = False
+        self._pending: List[Callable[[State], None]] = []
+        self._task: Optional[asyncio.Task[None]] = None
+
+    @property
+    def ready(self) -> bool:
+        return self._state is not None
+
+    @property
+    def active(self) -> bool:
+        """Whether writes are being tracked, i.e. the state is loaded or loading."""
+        return self._loading or self._state is not None
+
+    def reset(self) -> None:
+        """Drop all state; nothing is answered until loaded again."""
+        self._state = None
+        self._loading = False
+        self._pending = []
+
+    async def build(self, db: AsyncSession) -> State:
+        raise NotImplementedError
+
+    async def load(self, session_maker: Callable[[], AsyncSession]) -> None:
+        """Build fresh state from the database and swap it in."""
+        self._loading = True
+        try:
+            async with session_maker() as db:
+                state = await self.build(db)
+            for change in self._pending:
+                change(state)
+            self._state = state
+            logger.info("Loaded %s", self.name)
+        finally:
+            self._pending = []
+            self._loading = False
+
+    async def _run(self, session_maker: Callable[[], AsyncSession], refresh_seconds: int) -> None:
+        while True:
+            try:
+                await self.load(session_maker)
+            except Exception:
+                logger.exception("Failed to load %s", self.name)
+            if refresh_seconds <= 0 and self.ready:
+                return
+            await asyncio.sleep(refresh_seconds if refresh_seconds > 0 else 5)
+
+    def start(self, session_maker: Callable[[], AsyncSession], refresh_seconds: int = 0) -> None:
+        """Load in the background, optionally reloading every refresh_seconds."""
+        self._task = asyncio.create_task(self._run(session_maker, refresh_seconds))
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def _apply(self, change: Callable[[State], None]) -> None:
+        if self._loading:
+            self._pending.append(change)
+        if self._state is not None:
+            change(self._state)
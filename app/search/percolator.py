@@ -0,0 +1,303 @@
+import asyncio
+from collections import Counter
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import SavedSearch
+from app.models.job import JobLevel, JobType
+from app.schemas.job import LocationMatch, TagMode
+from .loader import BackgroundLoaded
+from .places import Place, parse_location
+from .salary import salary_bucket, salary_overlaps
+
+# A posting key: tag, job type and job level, each None where a search leaves it open
+PostingKey = Tuple[Optional[str], Optional[JobType], Optional[JobLevel]]
+# Searches under one posting key are filed again by the most selective of their other
+# conditions: ("place", key) of the place searched for, else ("salary_min", bucket) or
+# ("salary_max", bucket) of a salary bound, else None
+SecondaryKey = Optional[Tuple[str, Hashable]]
+
+
+class JobFields(NamedTuple):
+    """What saved searches are matched against in an active job."""
+    tags: FrozenSet[str]
+    job_type: JobType
+    job_level: JobLevel
+    location: Optional[str]
+    salary_min: Optional[int]
+    salary_max: Optional[int]
+
+
+def job_fields(job: Any) -> Optional[JobFields]:
+    """Matched fields of a job with its tags loaded, or None unless it is active."""
+    if not job.is_active:
+        return None
+    return JobFields(
+        frozenset(tag.name for tag in job.tags), job.job_type, job.job_level,
+        job.location, job.salary_min, job.salary_max,
+    )
+
+
+class _Conditions(NamedTuple):
+    """What a saved search requires of a job beyond its posting key.
+
+    Searches filed under the same key with equal conditions are checked once per job:
+    the remaining tags of an all-tags search, the location and the salary range.
+    """
+    all_tags: Optional[FrozenSet[str]] = None
+    place: Optional[Place] = None
+    contains: Optional[str] = None
+    salary_min: Optional[int] = None
+    salary_max: Optional[int] = None
+
+    def accepts(self, fields: JobFields, place: Optional[Place]) -> bool:
+        """Check a job, given its parsed `place`."""
+        if self.all_tags is not None and not self.all_tags <= fields.tags:
+            return False
+        if self.place is not None and (place is None or not place.matches(self.place)):
+            return False
+        if self.contains is not None and (
+            not fields.location or self.contains not in fields.location.lower()
+        ):
+            return False
+        if self.salary_min is None and self.salary_max is None:
+            return True
+        return salary_overlaps(
+            fields.salary_min, fields.salary_max, self.salary_min, self.salary_max
+        )
+
+    def secondary_key(self) -> SecondaryKey:
+        if self.place is not None:
+            return ("place", self.place.key)
+        if self.salary_min is not None:
+            return ("salary_min", salary_bucket(self.salary_min))
+        if self.salary_max is not None:
+            return ("salary_max", salary_bucket(self.salary_max))
+        return None
+
+
+_NO_CONDITIONS = _Conditions()
+
+
+def _secondary_keys(fields: JobFields, place: Optional[Place]) -> List[SecondaryKey]:
+    """Every secondary key that searches matching a job can be filed under.
+
+    A searched place matches the job's by key, by any one part, or by city or region
+    within its country (see Place.matches). A search overlapping the job's salary range
+    has its lower bound at most the job's upper end, or only an upper bound at least
+    the job's lower end. Keys that turn out not to match are weeded out by the checks.
+    """
+    keys: List[SecondaryKey] = [None]
+    if place is not None:
+        terms = {place.key, place.city, place.region, place.country}
+        if place.country is not None:
+            terms.update(f"{part}, {place.country}" for part in (place.city, place.region) if part)
+        keys += [("place", term) for term in terms if term is not None]
+    low = fields.salary_min if fields.salary_min is not None else fields.salary_max
+    high = fields.salary_max if fields.salary_max is not None else fields.salary_min
+    if low is not None and high is not None:
+        keys += [("salary_min", bucket) for bucket in range(salary_bucket(high) + 1)]
+        keys += [
+            ("salary_max", bucket)
+            for bucket in range(salary_bucket(low), settings.salary_bucket_count)
+        ]
+    return keys
+
+
+class _Query:
+    """A saved search compiled into the posting keys it is filed under and its conditions."""
+    __slots__ = ("id", "keys", "conditions", "secondary")
+
+    def __init__(self, search: Any):
+        self.id: int = search.id
+        tags: List[str] = list(dict.fromkeys(search.tags or []))
+        all_tags = search.tag_mode == TagMode.ALL.value
+        type_and_level = (search.job_type, search.job_level)
+        # An all-tags search is filed under just one of these keys when it is added
+        self.keys: List[PostingKey] = [(tag, *type_and_level) for tag in tags or [None]]
+
+        place = contains = None
+        if search.location:
+            if search.location_match == LocationMatch.CONTAINS.value:
+                contains = search.location.lower()
+            else:
+                place = parse_location(search.location)
+        conditions = _Conditions(
+            frozenset(tags) if all_tags and len(tags) > 1 else None,
+            place, contains, search.salary_min, search.salary_max,
+        )
+        self.conditions = _NO_CONDITIONS if conditions == _NO_CONDITIONS else conditions
+        self.secondary = self.conditions.secondary_key()
+
+    def matches(self, fields: JobFields, place: Optional[Place]) -> bool:
+        """Check every condition, for matching without the postings."""
+        if not any(
+            (tag is None or tag in fields.tags)
+            and job_type in (None, fields.job_type)
+            and job_level in (None, fields.job_level)
+            for tag, job_type, job_level in self.keys
+        ):
+            return False
+        return self.conditions.accepts(fields, place)
+
+
+# Ids of the searches filed under one key, grouped by secondary key, then by conditions
+_Posting = Dict[SecondaryKey, Dict[_Conditions, Set[int]]]
+
+
+class _Postings:
+    def __init__(self) -> None:
+        self.queries: Dict[int, _Query] = {}
+        self.postings: Dict[PostingKey, _Posting] = {}
+        self.sizes: Counter = Counter()
+
+    def add(self, query: _Query) -> None:
+        self.remove(query.id)
+        self.queries[query.id] = query
+        if query.conditions.all_tags is not None:
+            # Filed under its least used tag, so fewer jobs reach it only to fail the others
+            query.keys = [min(query.keys, key=self.sizes.__getitem__)]
+        for key in query.keys:
+            self.sizes[key] += 1
+            group = self.postings.setdefault(key, {}).setdefault(query.secondary, {})
+            group.setdefault(query.conditions, set()).add(query.id)
+
+    def remove(self, search_id: int) -> None:
+        query = self.queries.pop(search_id, None)
+        if query is None:
+            return
+        for key in query.keys:
+            self.sizes[key] -= 1
+            posting = self.postings[key]
+            group = posting[query.secondary]
+            ids = group[query.conditions]
+            ids.discard(search_id)
+            if not ids:
+                del group[query.conditions]
+            if not group:
+                del posting[query.secondary]
+            if not posting:
+                del self.postings[key]
+                del self.sizes[key]
+
+    def match(self, fields: JobFields) -> Set[int]:
+        """Ids of the searches matching a job.
+
+        A job is looked up under every combination of one of its tags (or none) with
+        its type (or none) and its level (or none), and within those under the
+        secondary keys of its place and salary. Each distinct set of conditions found
+        there is checked once, so the work done grows with the number of matching
+        searches and of the distinct conditions among those agreeing on tags, type,
+        level and roughly on place or salary, not with the number of saved searches.
+        """
+        matched: Set[int] = set()
+        place = parse_location(fields.location)
+        secondary_keys = _secondary_keys(fields, place)
+        for tag in (*fields.tags, None):
+            for job_type in (fields.job_type, None):
+                for job_level in (fields.job_level, None):
+                    posting = self.postings.get((tag, job_type, job_level))
+                    if posting is None:
+                        continue
+                    for secondary in secondary_keys:
+                        group = posting.get(secondary)
+                        if group is None:
+                            continue
+                        for conditions, ids in group.items():
+                            if conditions is _NO_CONDITIONS or conditions.accepts(fields, place):
+                                matched.update(ids)
+        return matched
+
+
+# Columns a saved search is compiled from
+_QUERY_COLUMNS = (
+    SavedSearch.id, SavedSearch.tags, SavedSearch.tag_mode, SavedSearch.location,
+    SavedSearch.location_match, SavedSearch.job_type, SavedSearch.job_level,
+    SavedSearch.salary_min, SavedSearch.salary_max,
+)
+
+
+class SavedSearchPercolator(BackgroundLoaded[_Postings]):
+    """Saved searches filed by tag, job type, job level, place and salary, to match jobs.
+
+    Matching a job costs time in proportion to the searches agreeing with it on those
+    fields rather than to the number of saved searches. Built at startup and kept
+    current by the SavedSearchService write paths.
+    """
+
+    name = "saved search percolator"
+
+    async def build(self, db: AsyncSession) -> _Postings:
+        state = _Postings()
+        rows = await db.stream(select(*_QUERY_COLUMNS).execution_options(yield_per=10000))
+
+        def index(partition: List[Any]) -> None:
+            for row in partition:
+                state.add(_Query(row))
+
+        # Filing searches is CPU-bound, so each batch is filed off the event loop
+        async for partition in rows.partitions():
+            await asyncio.to_thread(index, partition)
+        return state
+
+    def upsert_search(self, search: SavedSearch) -> None:
+        query = _Query(search)
+        self._apply(lambda state: state.add(query))
+
+    def remove_search(self, search_id: int) -> None:
+        self._apply(lambda state: state.remove(search_id))
+
+    def match(self, fields: JobFields) -> Optional[Set[int]]:
+        """Ids of the saved searches matching a job, or None until loaded."""
+        state = self._state
+        if state is None:
+            return None
+        return state.match(fields)
+
+    def new_matches(
+        self,
+        before: Optional[JobFields],
+        after: Optional[JobFields]
+    ) -> Optional[Set[int]]:
+        """Searches a job matches after a write but did not match before it."""
+        if after is None or before == after:
+            return set()
+        matched = self.match(after)
+        if matched is None or before is None:
+            return matched
+        return matched - self.match(before)
+
+
+async def match_saved_searches(db: AsyncSession, jobs: Iterable[JobFields]) -> List[Set[int]]:
+    """Match jobs against saved searches read from the database, without the postings.
+
+    Reads every search that agrees with some job on type and level, so it is only meant
+    for jobs written while the percolator was still loading.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return []
+    places = [parse_location(fields.location) for fields in jobs]
+    job_types = {fields.job_type for fields in jobs}
+    job_levels = {fields.job_level for fields in jobs}
+    rows = await db.stream(
+        select(*_QUERY_COLUMNS)
+        .where(
+            or_(SavedSearch.job_type.is_(None), SavedSearch.job_type.in_(job_types)),
+            or_(SavedSearch.job_level.is_(None), SavedSearch.job_level.in_(job_levels)),
+        )
+        .execution_options(yield_per=10000)
+    )
+    matched: List[Set[int]] = [set() for _ in jobs]
+    async for row in rows:
+        query = _Query(row)
+        for fields, place, ids in zip(jobs, places, matched):
+            if query.matches(fields, place):
+                ids.add(query.id)
+    return matched
+
+
+saved_search_percolator = SavedSearchPercolator()
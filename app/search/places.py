@@ -0,0 +1,61 @@
+from functools import lru_cache
+from typing import List, NamedTuple, Optional
+
+
+class Place(NamedTuple):
+    """A location normalized to canonical form.
+
+    `name` is the display form, with parts separated by ", " and whitespace collapsed;
+    `key` and the components are its case-folded form. The first part of a name is the
+    city, the last the country and any in between the region, so "Nakuru, Rift Valley,
+    Kenya" is in Kenya and in the Rift Valley. A single-part name such as "Remote" or
+    "Kenya" has only a city.
+    """
+    name: str
+    key: str
+    city: str
+    region: Optional[str]
+    country: Optional[str]
+
+    def matches(self, term: "Place") -> bool:
+        """Whether this place is, or lies within, the place searched for.
+
+        A one-part term matches any component, so "Kenya" matches "Nairobi, Kenya" and
+        "Nairobi" matches "Nairobi, Kenya"; a two-part term also matches by city or region
+        within the country; longer terms only match the same place.
+        """
+        if term.key == self.key:
+            return True
+        if term.country is None:
+            return term.city in (self.city, self.region, self.country)
+        if term.region is None:
+            return term.country == self.country and term.city in (self.city, self.region)
+        return False
+
+    def enclosing_names(self) -> List[str]:
+        """This place's name, then the region and country names that also match it.
+
+        "Nakuru, Rift Valley, Kenya" gives itself, "Rift Valley, Kenya" and "Kenya".
+        """
+        parts = self.name.split(", ")
+        return [self.name] + [
+            ", ".join(parts[start:]) for start in range(max(1, len(parts) - 2), len(parts))
+        ]
+
+
+@lru_cache(maxsize=65536)
+def parse_location(location: Optional[str]) -> Optional[Place]:
+    """Normalize free-text location, or None when it is blank."""
+    parts = [" ".join(part.split()) for part in (location or "").split(",")]
+    parts = [part for part in parts if part]
+    if not parts:
+        return None
+    name = ", ".join(parts)
+    keys = [part.casefold() for part in parts]
+    return Place(
+        name=name,
+        key=name.casefold(),
+        city=keys[0],
+        region=", ".join(keys[1:-1]) or None,
+        country=keys[-1] if len(keys) > 1 else None,
+    )
@@ -0,0 +1,409 @@
+import asyncio
+from bisect import bisect_left, insort
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.pagination import decode_cursor, encode_cursor
+from app.models import Company, Job, Location, Tag, job_tags_table
+from app.schemas import JobFilter, LocationMatch
+from .bitmap import Bitmap
+from .facets import top_values, value_counts
+from .loader import BackgroundLoaded
+from .places import Place, parse_location
+from .salary import salary_bucket_range, salary_buckets_within, salary_overlaps
+from .tag_index import tag_index
+
+SortKey = Tuple[datetime, int]
+
+
+class TagDocument:
+    """Read-only tag row shared by every job that carries the tag."""
+    __slots__ = ("id", "name", "created_at", "updated_at")
+
+    def __init__(self, id: int, name: str, created_at: datetime, updated_at: datetime):
+        self.id = id
+        self.name = name
+        self.created_at = created_at
+        self.updated_at = updated_at
+
+
+class CompanyDocument:
+    """Public company columns, shaped like JobCompanyOut."""
+    __slots__ = (
+        "id", "email", "company_name", "description", "website", "location",
+        "is_active", "is_verified", "created_at", "updated_at",
+    )
+
+    def __init__(self, row: Any):
+        self.update(row)
+
+    def update(self, row: Any) -> None:
+        for field in self.__slots__:
+            setattr(self, field, getattr(row, field))
+
+
+class JobDocument:
+    """Compact job row shaped like JobOut, referencing shared tag and company documents."""
+    __slots__ = (
+        "id", "title", "description", "location", "job_type", "job_level",
+        "salary_min", "salary_max", "is_active", "company_id", "location_id", "created_at",
+        "updated_at", "tags", "company",
+    )
+
+    def __init__(self, row: Any, tags: List[TagDocument], company: CompanyDocument):
+        for field in self.__slots__[:-2]:
+            setattr(self, field, getattr(row, field))
+        self.tags = tags
+        self.company = company
+
+    @property
+    def sort_key(self) -> SortKey:
+        return (self.created_at, self.id)
+
+
+class _Snapshot:
+    """One consistent generation of documents and secondary indexes."""
+
+    def __init__(self) -> None:
+        self.jobs: Dict[int, JobDocument] = {}
+        self.companies: Dict[int, CompanyDocument] = {}
+        self.tags: Dict[int, TagDocument] = {}
+        self.locations: Dict[int, Place] = {}
+        self.location_names: Dict[str, str] = {}
+        # Active jobs only, ascending by (created_at, id); walked backwards for newest first
+        self.order: List[SortKey] = []
+        self.active = Bitmap()
+        self.by_type: Dict[Any, Bitmap] = {}
+        self.by_level: Dict[Any, Bitmap] = {}
+        self.by_company: Dict[int, Bitmap] = {}
+        # Keyed by canonical location name, as faceted, and by its case-folded parts
+        # for place matches; the text as posted is kept for substring matches
+        self.by_location: Dict[str, Bitmap] = {}
+        self.by_city: Dict[str, Bitmap] = {}
+        self.by_region: Dict[str, Bitmap] = {}
+        self.by_country: Dict[str, Bitmap] = {}
+        self.by_location_text: Dict[str, Bitmap] = {}
+        self.by_salary: Dict[int, Bitmap] = {}
+        # Active jobs advertising any salary
+        self.salaried = Bitmap()
+        self.tag_counts: Counter = Counter()
+
+    def tag(self, tag: Any) -> TagDocument:
+        document = self.tags.get(tag.id)
+        if document is None:
+            document = TagDocument(tag.id, tag.name, tag.created_at, tag.updated_at)
+            self.tags[tag.id] = document
+        return document
+
+    def company(self, company: Any) -> CompanyDocument:
+        document = self.companies.get(company.id)
+        if document is None:
+            document = CompanyDocument(company)
+            self.companies[company.id] = document
+        else:
+            document.update(company)
+        return document
+
+    def location(self, location_id: int, place: Place) -> None:
+        if location_id not in self.locations:
+            self.locations[location_id] = place
+            self.location_names[place.key] = place.name
+
+    def _postings_of(self, document: JobDocument) -> Iterator[Bitmap]:
+        yield self.active
+        yield self.by_type.setdefault(document.job_type, Bitmap())
+        yield self.by_level.setdefault(document.job_level, Bitmap())
+        yield self.by_company.setdefault(document.company_id, Bitmap())
+        if document.location_id is not None:
+            place = self.locations[document.location_id]
+            yield self.by_location.setdefault(place.name, Bitmap())
+            yield self.by_city.setdefault(place.city, Bitmap())
+            if place.region is not None:
+                yield self.by_region.setdefault(place.region, Bitmap())
+            if place.country is not None:
+                yield self.by_country.setdefault(place.country, Bitmap())
+        if document.location:
+            yield self.by_location_text.setdefault(document.location.strip(), Bitmap())
+        buckets = salary_bucket_range(document.salary_min, document.salary_max)
+        if buckets:
+            yield self.salaried
+        for bucket in buckets:
+            yield self.by_salary.setdefault(bucket, Bitmap())
+
+    def add(self, document: JobDocument) -> None:
+        self.remove(document.id)
+        self.jobs[document.id] = document
+        if not document.is_active:
+            return
+        insort(self.order, document.sort_key)
+        self._index(document)
+
+    def extend(self, documents: Iterable[JobDocument]) -> None:
+        """Add documents of jobs not in the snapshot yet; `order` is sorted afterwards."""
+        for document in documents:
+            self.jobs[document.id] = document
+            if document.is_active:
+                self.order.append(document.sort_key)
+                self._index(document)
+
+    def _index(self, document: JobDocument) -> None:
+        for posting in self._postings_of(document):
+            posting.add(document.id)
+        self.tag_counts.update(tag.name for tag in document.tags)
+
+    def remove(self, job_id: int) -> None:
+        document = self.jobs.pop(job_id, None)
+        if document is None:
+            return
+        if not document.is_active:
+            return
+        position = bisect_left(self.order, document.sort_key)
+        del self.order[position]
+        for posting in self._postings_of(document):
+            posting.discard(job_id)
+        self.tag_counts.subtract(tag.name for tag in document.tags)
+
+    def salary_matches(self, low: Optional[int], high: Optional[int]) -> Bitmap:
+        """Active jobs whose advertised salary range overlaps [low, high]."""
+        overlapping, inner = salary_buckets_within(low, high)
+        matches = Bitmap.union(self.by_salary.get(bucket, Bitmap()) for bucket in inner)
+        for bucket in overlapping:
+            if bucket in inner:
+                continue
+            for job_id in self.by_salary.get(bucket, Bitmap()):
+                document = self.jobs[job_id]
+                if salary_overlaps(document.salary_min, document.salary_max, low, high):
+                    matches.add(job_id)
+        return matches
+
+    def location_matches(self, location: str, match: LocationMatch) -> Bitmap:
+        """Active jobs in or within the place, or whose location contains the text."""
+        if match == LocationMatch.CONTAINS:
+            needle = location.lower()
+            return Bitmap.union(
+                posting for text, posting in self.by_location_text.items()
+                if needle in text.lower()
+            )
+        term = parse_location(location)
+        if term is None:
+            return self.active
+        # The postings of each way a place can match the term; see Place.matches
+        empty = Bitmap()
+        postings = [self.by_location.get(self.location_names.get(term.key, ""), empty)]
+        if term.country is None:
+            postings += [
+                index.get(term.city, empty)
+                for index in (self.by_city, self.by_region, self.by_country)
+            ]
+        elif term.region is None:
+            within = Bitmap.union([
+                self.by_city.get(term.city, empty), self.by_region.get(term.city, empty)
+            ])
+            postings.append(within & self.by_country.get(term.country, empty))
+        return Bitmap.union(postings)
+
+
+class JobReadModel(BackgroundLoaded[_Snapshot]):
+    """Process-local copy of the job board answering public job queries from memory.
+
+    The model is loaded in the background at startup and kept current by the JobService
+    and CompanyService write paths. Until it is ready, and for any filter it cannot
+    answer exactly like the SQL query would, callers get None and fall back to SQL.
+    """
+
+    name = "job read model"
+
+    async def build(self, db: AsyncSession) -> _Snapshot:
+        snapshot = _Snapshot()
+        for company in (await db.execute(select(Company))).scalars():
+            snapshot.company(company)
+        for tag in (await db.execute(select(Tag))).scalars():
+            snapshot.tag(tag)
+        for location in (await db.execute(select(Location))).scalars():
+            snapshot.location(location.id, Place(
+                location.name, location.key, location.city, location.region, location.country
+            ))
+        job_tags: Dict[int, List[TagDocument]] = {}
+        rows = await db.stream(
+            select(job_tags_table.c.job_id, job_tags_table.c.tag_id)
+            .execution_options(yield_per=10000)
+        )
+        async for job_id, tag_id in rows:
+            job_tags.setdefault(job_id, []).append(snapshot.tags[tag_id])
+        columns = [getattr(Job, field) for field in JobDocument.__slots__[:-2]]
+        rows = await db.stream(
+            select(*columns).order_by(Job.id).execution_options(yield_per=5000)
+        )
+
+        def index(partition: List[Any]) -> None:
+            snapshot.extend(
+                JobDocument(row, job_tags.get(row.id, []), snapshot.companies[row.company_id])
+                for row in partition
+            )
+
+        # Indexing is CPU-bound, so each batch of rows is indexed off the event loop
+        async for partition in rows.partitions():
+            await asyncio.to_thread(index, partition)
+        await asyncio.to_thread(snapshot.order.sort)
+        return snapshot
+
+    def upsert_job(self, job: Job) -> None:
+        """Mirror a committed job, with its tags and company loaded."""
+        def change(snapshot: _Snapshot) -> None:
+            tags = [snapshot.tag(tag) for tag in job.tags]
+            if job.location_id is not None:
+                snapshot.location(job.location_id, parse_location(job.location))
+            snapshot.add(JobDocument(job, tags, snapshot.company(job.company)))
+        self._apply(change)
+
+    def remove_job(self, job_id: int) -> None:
+        self._apply(lambda snapshot: snapshot.remove(job_id))
+
+    def upsert_company(self, company: Company) -> None:
+        self._apply(lambda snapshot: snapshot.company(company))
+
+    @staticmethod
+    def _filter_postings(snapshot: _Snapshot, filters: JobFilter) -> Dict[str, Bitmap]:
+        """Posting list each filtered dimension restricts matches to."""
+        postings: Dict[str, Bitmap] = {}
+        tag_names = filters.tag_names()
+        if tag_names:
+            postings["tags"] = tag_index.match(tag_names, filters.tag_mode)
+        if filters.location:
+            postings["location"] = snapshot.location_matches(
+                filters.location, filters.location_match
+            )
+        if filters.job_type:
+            postings["job_type"] = snapshot.by_type.get(filters.job_type, Bitmap())
+        if filters.job_level:
+            postings["job_level"] = snapshot.by_level.get(filters.job_level, Bitmap())
+        if filters.salary_min is not None or filters.salary_max is not None:
+            postings["salary"] = snapshot.salary_matches(filters.salary_min, filters.salary_max)
+        return postings
+
+    @staticmethod
+    def _supports(filters: JobFilter) -> bool:
+        # Inactive listings are not indexed, tag filters need the tag index, and LIKE
+        # wildcards in a contains match would not mean the same as a substring match.
+        if not filters.is_active:
+            return False
+        if filters.tag_names() and not tag_index.ready:
+            return False
+        if filters.location_match != LocationMatch.CONTAINS or not filters.location:
+            return True
+        return "%" not in filters.location and "_" not in filters.location
+
+    def _scan(
+        self,
+        snapshot: _Snapshot,
+        filters: JobFilter,
+        before: Optional[SortKey],
+        count: int
+    ) -> List[JobDocument]:
+        """Return up to count matching documents, newest first, strictly before `before`."""
+        postings = sorted(self._filter_postings(snapshot, filters).values(), key=len)
+
+        keys: Iterable[SortKey]
+        if postings and len(postings[0]) * 8 < len(snapshot.order):
+            # Selective filter: sort the few candidates instead of walking every active job
+            smallest, postings = postings[0], postings[1:]
+            documents = (snapshot.jobs.get(job_id) for job_id in smallest)
+            keys = sorted(
+                (document.sort_key for document in documents if document and document.is_active),
+                reverse=True
+            )
+            if before is not None:
+                keys = [key for key in keys if key < before]
+        else:
+            end = bisect_left(snapshot.order, before) if before is not None else len(snapshot.order)
+            keys = (snapshot.order[i] for i in range(end - 1, -1, -1))
+
+        page: List[JobDocument] = []
+        for key in keys:
+            job_id = key[1]
+            if any(job_id not in posting for posting in postings):
+                continue
+            page.append(snapshot.jobs[job_id])
+            if len(page) == count:
+                break
+        return page
+
+    def query(self, filters: JobFilter) -> Optional[List[JobDocument]]:
+        """Answer an offset-paginated JobFilter, or None to fall back to SQL."""
+        snapshot = self._state
+        if snapshot is None or not self._supports(filters):
+            return None
+        page = self._scan(snapshot, filters, None, filters.skip + filters.limit)
+        return page[filters.skip:]
+
+    def query_page(
+        self,
+        filters: JobFilter
+    ) -> Optional[Tuple[List[JobDocument], Optional[str]]]:
+        """Answer a cursor-paginated JobFilter, or None to fall back to SQL."""
+        snapshot = self._state
+        if snapshot is None or not self._supports(filters):
+            return None
+        before = decode_cursor(filters.cursor) if filters.cursor else None
+        page = self._scan(snapshot, filters, before, filters.limit + 1)
+        next_cursor = None
+        if len(page) > filters.limit:
+            last = page[filters.limit - 1]
+            next_cursor = encode_cursor(last.created_at, last.id)
+        return page[:filters.limit], next_cursor
+
+    def facets(self, filters: JobFilter, limit: int) -> Optional[Dict[str, Any]]:
+        """Per-dimension counts, each ignoring that dimension's own filter, or None for SQL."""
+        snapshot = self._state
+        if snapshot is None or not tag_index.ready or not self._supports(filters):
+            return None
+        postings = self._filter_postings(snapshot, filters)
+
+        def matching(excluded: Optional[str] = None) -> Bitmap:
+            others = [posting for name, posting in postings.items() if name != excluded]
+            return Bitmap.intersection([snapshot.active] + others)
+
+        def tag_names_of(job_id: int) -> List[str]:
+            return [tag.name for tag in snapshot.jobs[job_id].tags]
+
+        def location_of(job_id: int) -> List[str]:
+            location_id = snapshot.jobs[job_id].location_id
+            return [] if location_id is None else [snapshot.locations[location_id].name]
+
+        tag_postings = tag_index.postings()
+        return {
+            "total": len(matching()),
+            "job_type": value_counts(matching("job_type"), snapshot.by_type),
+            "job_level": value_counts(matching("job_level"), snapshot.by_level),
+            "tags": top_values(
+                matching("tags"), tag_postings,
+                {name: count for name, count in snapshot.tag_counts.items() if count > 0},
+                tag_names_of, limit
+            ),
+            "locations": top_values(
+                matching("location"), snapshot.by_location,
+                {name: len(posting) for name, posting in snapshot.by_location.items()},
+                location_of, limit
+            ),
+            "salary": value_counts(matching("salary"), snapshot.by_salary),
+        }
+
+    def salary_histogram(self, filters: JobFilter) -> Optional[Dict[str, Any]]:
+        """Matching jobs per salary bucket, with every filter applied, or None for SQL."""
+        snapshot = self._state
+        if snapshot is None or not self._supports(filters):
+            return None
+        postings = list(self._filter_postings(snapshot, filters).values())
+        matching = Bitmap.intersection([snapshot.active] + postings)
+        return {
+            "total": len(matching),
+            "with_salary": matching.intersection_len(snapshot.salaried),
+            "buckets": value_counts(matching, snapshot.by_salary),
+        }
+
+
+job_read_model = JobReadModel()
@@ -0,0 +1,68 @@
+from typing import List, Optional, Tuple
+
+from app.config import settings
+
+
+def salary_bucket(amount: int) -> int:
+    """Index of the salary bucket holding an amount."""
+    return min(amount // settings.salary_bucket_size, settings.salary_bucket_count - 1)
+
+
+def salary_bucket_range(salary_min: Optional[int], salary_max: Optional[int]) -> range:
+    """Indexes of the salary buckets a job's advertised range overlaps.
+
+    A job with only one bound is treated as paying exactly that amount; the last
+    bucket is open-ended.
+    """
+    low = salary_min if salary_min is not None else salary_max
+    high = salary_max if salary_max is not None else salary_min
+    if low is None or high is None:
+        return range(0)
+    return range(salary_bucket(low), salary_bucket(high) + 1)
+
+
+def salary_bucket_bounds(bucket: int) -> Tuple[int, Optional[int]]:
+    """Inclusive lower and exclusive upper bound of a bucket; None for the open last one."""
+    size = settings.salary_bucket_size
+    upper = None if bucket == settings.salary_bucket_count - 1 else (bucket + 1) * size
+    return bucket * size, upper
+
+
+def salary_overlaps(
+    salary_min: Optional[int],
+    salary_max: Optional[int],
+    low: Optional[int],
+    high: Optional[int]
+) -> bool:
+    """Whether a job's advertised range overlaps the requested [low, high] range.
+
+    Either requested bound may be None for an open range. Jobs without any salary
+    never match; a job with only one bound is treated as paying exactly that amount.
+    """
+    job_low = salary_min if salary_min is not None else salary_max
+    job_high = salary_max if salary_max is not None else salary_min
+    if job_low is None or job_high is None:
+        return False
+    return (low is None or job_high >= low) and (high is None or job_low <= high)
+
+
+def salary_buckets_within(low: Optional[int], high: Optional[int]) -> Tuple[List[int], List[int]]:
+    """Buckets a requested range overlaps, and the subset lying entirely inside it.
+
+    Every job in an inner bucket overlaps the range; jobs in the other overlapping
+    buckets have to be checked one by one.
+    """
+    overlapping, inner = [], []
+    for bucket in range(settings.salary_bucket_count):
+        lower, upper = salary_bucket_bounds(bucket)
+        last_salary = None if upper is None else upper - 1
+        if (high is not None and lower > high) or (
+            low is not None and last_salary is not None and last_salary < low
+        ):
+            continue
+        overlapping.append(bucket)
+        if (low is None or lower >= low) and (
+            high is None or (last_salary is not None and last_salary <= high)
+        ):
+            inner.append(bucket)
+    return overlapping, inner
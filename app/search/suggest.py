@@ -0,0 +1,340 @@
+import asyncio
+import heapq
+import re
+from bisect import bisect_left, insort
+from typing import Any, Dict, Hashable, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Company, Job, Tag, job_tags_table
+from .loader import BackgroundLoaded
+from .places import parse_location
+
+# Most suggestions returned per kind
+MAX_SUGGESTIONS = 20
+# Names kept in a cached ranking: beyond the ones returned, so that ranked names can
+# lose jobs without the prefix's range being walked again
+CACHED_RANKING = 2 * MAX_SUGGESTIONS
+# Prefixes matching at least this many words have their ranking cached, and those up to
+# WARM_PREFIX_LENGTH long are ranked when the index is built
+CACHE_MIN_MATCHES = 256
+WARM_PREFIX_LENGTH = 2
+
+_WORD_START = re.compile(r"\b\w")
+
+# Orders names by active job count, most first, then alphabetically
+RankKey = Tuple[int, str]
+
+
+def normalize_suggestion_text(text: str) -> str:
+    """Case-fold and collapse whitespace, as names are indexed and queries matched."""
+    return " ".join(text.split()).casefold()
+
+
+class JobTerms(NamedTuple):
+    """What an active job contributes to suggestion popularity."""
+    title: str
+    company_id: int
+    location: Optional[str]
+    tags: Tuple[str, ...]
+
+
+def job_terms(job: Any) -> Optional[JobTerms]:
+    """Suggestion terms of a job with its tags loaded, or None unless it is active."""
+    if not job.is_active:
+        return None
+    return JobTerms(job.title, job.company_id, job.location, tuple(tag.name for tag in job.tags))
+
+
+class _PrefixIndex:
+    """Names matched by the prefix of any of their words, ranked by active job count.
+
+    Every word start of a name's normalized form is kept in one sorted array, so a
+    prefix is a bisect plus a walk over the matching range. Rankings of prefixes with
+    long ranges are cached and adjusted in place as counts change. A cached ranking
+    also remembers the best rank of the names left out of it, and only the names
+    ranked ahead of that are answered from it; a fresh walk is needed only once
+    demotions leave fewer of those than asked for.
+    """
+
+    def __init__(self) -> None:
+        self.counts: Dict[Hashable, int] = {}
+        self.names: Dict[Hashable, str] = {}
+        self._words: List[Tuple[str, Hashable]] = []
+        self._ranked: Dict[str, List[Hashable]] = {}
+        # Per cached prefix, the best rank key of a matching name not in its ranking,
+        # as of when it was left out (names only re-enter by gaining jobs)
+        self._left_out: Dict[str, Optional[RankKey]] = {}
+
+    def load(self, totals: Dict[Hashable, Tuple[str, int]]) -> None:
+        """Fill an empty index with (name, count) per key, sorting the word starts once."""
+        words: List[Tuple[str, Hashable]] = []
+        for key, (name, count) in totals.items():
+            if count > 0:
+                self.names[key] = name
+                self.counts[key] = count
+                words.extend((start, key) for start in self._word_starts(name))
+        words.sort()
+        self._words = words
+
+    @staticmethod
+    def _word_starts(name: str) -> List[str]:
+        text = normalize_suggestion_text(name)
+        return [text[match.start():] for match in _WORD_START.finditer(text)]
+
+    def _rank_key(self, key: Hashable) -> RankKey:
+        return (-self.counts[key], self.names[key].casefold())
+
+    def _cached_prefixes(self, key: Hashable) -> Set[str]:
+        return {
+            words[:length]
+            for words in self._word_starts(self.names[key])
+            for length in range(1, len(words) + 1)
+            if words[:length] in self._ranked
+        }
+
+    def _leave_out(self, prefix: str, key: Hashable) -> None:
+        best = self._left_out[prefix]
+        rank_key = self._rank_key(key)
+        if best is None or rank_key < best:
+            self._left_out[prefix] = rank_key
+
+    def _promote(self, key: Hashable) -> None:
+        """Re-rank cached prefixes matching a name that gained jobs."""
+        for prefix in self._cached_prefixes(key):
+            ranked = self._ranked[prefix]
+            if key not in ranked:
+                ranked.append(key)
+            ranked.sort(key=self._rank_key)
+            for dropped in ranked[CACHED_RANKING:]:
+                self._leave_out(prefix, dropped)
+            del ranked[CACHED_RANKING:]
+
+    def _demote(self, key: Hashable, removed: bool = False) -> None:
+        """Re-rank cached prefixes matching a name that lost jobs or is going away.
+
+        Names left out only rank lower than remembered after losing jobs, so the
+        rankings stay exact ahead of the remembered rank.
+        """
+        for prefix in self._cached_prefixes(key):
+            ranked = self._ranked[prefix]
+            if key not in ranked:
+                continue
+            if removed:
+                ranked.remove(key)
+            else:
+                ranked.sort(key=self._rank_key)
+
+    def _index(self, key: Hashable, name: str) -> None:
+        self.names[key] = name
+        for words in self._word_starts(name):
+            insort(self._words, (words, key))
+
+    def _unindex(self, key: Hashable) -> None:
+        self._demote(key, removed=True)
+        for words in self._word_starts(self.names.pop(key)):
+            del self._words[bisect_left(self._words, (words, key))]
+
+    def add(self, key: Hashable, name: str, delta: int) -> None:
+        """Change the number of active jobs counted for a name, keeping names above zero."""
+        count = self.counts.get(key, 0) + delta
+        if key in self.counts and count <= 0:
+            self._unindex(key)
+            del self.counts[key]
+        elif count > 0:
+            if key not in self.counts:
+                self._index(key, name)
+            self.counts[key] = count
+            if delta > 0:
+                self._promote(key)
+            else:
+                self._demote(key)
+
+    def rename(self, key: Hashable, name: str) -> None:
+        if key not in self.counts or self.names[key] == name:
+            return
+        self._unindex(key)
+        self._index(key, name)
+        self._promote(key)
+
+    def _rank(self, prefix: str) -> Tuple[List[Hashable], Optional[RankKey], int]:
+        """Best names for a prefix, the rank key of the best left out, and words matched."""
+        start = bisect_left(self._words, (prefix,))
+        end = bisect_left(self._words, (prefix + "\U0010ffff",), lo=start)
+        keys = {key for _, key in self._words[start:end]}
+        ranked = heapq.nsmallest(CACHED_RANKING + 1, keys, key=self._rank_key)
+        left_out = self._rank_key(ranked.pop()) if len(ranked) > CACHED_RANKING else None
+        return ranked, left_out, end - start
+
+    def _answers(self, prefix: str, limit: int) -> bool:
+        """Whether the cached ranking of a prefix holds its best `limit` names."""
+        ranked, left_out = self._ranked[prefix], self._left_out[prefix]
+        if left_out is None or limit == 0:
+            return True
+        return len(ranked) >= limit and self._rank_key(ranked[limit - 1]) < left_out
+
+    def top(self, prefix: str, limit: int) -> List[Tuple[Hashable, str, int]]:
+        """(key, name, count) of the most popular names matching a normalized prefix."""
+        if prefix in self._ranked and self._answers(prefix, limit):
+            ranked = self._ranked[prefix]
+        else:
+            ranked, left_out, matches = self._rank(prefix)
+            if matches >= CACHE_MIN_MATCHES:
+                self._ranked[prefix] = ranked
+                self._left_out[prefix] = left_out
+        return [(key, self.names[key], self.counts[key]) for key in ranked[:limit]]
+
+    def warm(self, length: int) -> None:
+        """Cache the rankings of the prefixes up to `length` long that qualify."""
+        for prefix in {words[:size] for words, _ in self._words for size in range(1, length + 1)}:
+            self.top(prefix, 0)
+
+
+class _Suggestions:
+    def __init__(self) -> None:
+        self.titles = _PrefixIndex()
+        self.tags = _PrefixIndex()
+        self.companies = _PrefixIndex()
+        self.locations = _PrefixIndex()
+        self.company_names: Dict[int, str] = {}
+
+    def count_title(self, title: str, delta: int) -> None:
+        self.titles.add(normalize_suggestion_text(title), title, delta)
+
+    def count_location(self, location: Optional[str], delta: int) -> None:
+        place = parse_location(location)
+        if place is None:
+            return
+        for name in place.enclosing_names():
+            self.locations.add(name.casefold(), name, delta)
+
+    def count_job(self, terms: JobTerms, delta: int) -> None:
+        self.count_title(terms.title, delta)
+        for tag in terms.tags:
+            self.tags.add(tag, tag, delta)
+        name = self.company_names.get(terms.company_id, "")
+        self.companies.add(terms.company_id, name, delta)
+        self.count_location(terms.location, delta)
+
+    def company(self, company_id: int, name: str) -> None:
+        self.company_names[company_id] = name
+        self.companies.rename(company_id, name)
+
+    @classmethod
+    def from_counts(
+        cls,
+        company_names: Dict[int, str],
+        titles: Iterable[Tuple[str, int]],
+        locations: Iterable[Tuple[Optional[str], int]],
+        companies: Iterable[Tuple[int, int]],
+        tags: Iterable[Tuple[str, int]]
+    ) -> "_Suggestions":
+        """Index active job counts per title, location, company and tag in bulk."""
+        state = cls()
+        state.company_names = company_names
+        totals: Dict[_PrefixIndex, Dict[Hashable, Tuple[str, int]]] = {
+            index: {} for index in (state.titles, state.tags, state.companies, state.locations)
+        }
+
+        def count(index: _PrefixIndex, key: Hashable, name: str, jobs: int) -> None:
+            # The first name counted under a key is the one shown, as with add()
+            first, counted = totals[index].get(key, (name, 0))
+            totals[index][key] = (first, counted + jobs)
+
+        for title, jobs in titles:
+            count(state.titles, normalize_suggestion_text(title), title, jobs)
+        for location, jobs in locations:
+            place = parse_location(location)
+            for name in place.enclosing_names() if place is not None else ():
+                count(state.locations, name.casefold(), name, jobs)
+        for company_id, jobs in companies:
+            count(state.companies, company_id, company_names[company_id], jobs)
+        for name, jobs in tags:
+            count(state.tags, name, name, jobs)
+        for index, index_totals in totals.items():
+            index.load(index_totals)
+            index.warm(WARM_PREFIX_LENGTH)
+        return state
+
+
+class SuggestIndex(BackgroundLoaded[_Suggestions]):
+    """Typeahead over job titles, tags, company names and locations.
+
+    Built from per-name active job counts at startup and kept current by the JobService
+    and CompanyService write paths, which pass a job's terms before and after a change.
+    """
+
+    name = "suggest index"
+
+    async def build(self, db: AsyncSession) -> _Suggestions:
+        active = Job.is_active.is_(True)
+        company_names = dict((await db.execute(select(Company.id, Company.company_name))).all())
+        count = func.count(Job.id)
+        titles = (await db.execute(
+            select(Job.title, count).where(active).group_by(Job.title)
+        )).all()
+        locations = (await db.execute(
+            select(Job.location, count).where(active).group_by(Job.location)
+        )).all()
+        companies = (await db.execute(
+            select(Job.company_id, count).where(active).group_by(Job.company_id)
+        )).all()
+        tags = (await db.execute(
+            select(Tag.name, count)
+            .join(job_tags_table, job_tags_table.c.tag_id == Tag.id)
+            .join(Job, Job.id == job_tags_table.c.job_id)
+            .where(active)
+            .group_by(Tag.name)
+        )).all()
+        # Indexing and ranking are CPU-bound; keep them off the event loop
+        return await asyncio.to_thread(
+            _Suggestions.from_counts, company_names, titles, locations, companies, tags
+        )
+
+    def change_job(self, before: Optional[JobTerms], after: Optional[JobTerms]) -> None:
+        """Move a job's counts from its terms before a committed write to those after."""
+        if before == after:
+            return
+
+        def change(state: _Suggestions) -> None:
+            if before is not None:
+                state.count_job(before, -1)
+            if after is not None:
+                state.count_job(after, 1)
+        self._apply(change)
+
+    def upsert_company(self, company: Company) -> None:
+        company_id, name = company.id, company.company_name
+        self._apply(lambda state: state.company(company_id, name))
+
+    def suggest(self, query: str, limit: int) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+        """Most popular titles, tags, companies and locations matching a query as typed.
+
+        Every word of a name is matched by prefix, so "dev" suggests "Backend Developer".
+        Returns None until the index is loaded.
+        """
+        state = self._state
+        if state is None:
+            return None
+        prefix = normalize_suggestion_text(query)
+        if not prefix:
+            return {"titles": [], "tags": [], "companies": [], "locations": []}
+
+        def values(index: _PrefixIndex) -> List[Dict[str, Any]]:
+            return [
+                {"value": name, "count": count} for _, name, count in index.top(prefix, limit)
+            ]
+
+        return {
+            "titles": values(state.titles),
+            "tags": values(state.tags),
+            "companies": [
+                {"id": key, "value": name, "count": count}
+                for key, name, count in state.companies.top(prefix, limit)
+            ],
+            "locations": values(state.locations),
+        }
+
+
+suggest_index = SuggestIndex()
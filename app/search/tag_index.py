@@ -0,0 +1,78 @@
+import asyncio
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Tag, job_tags_table
+from app.schemas.job import TagMode
+from .bitmap import Bitmap
+from .loader import BackgroundLoaded
+
+
+class _Postings:
+    def __init__(self) -> None:
+        self.by_tag: Dict[str, Bitmap] = {}
+        self.job_tags: Dict[int, Tuple[str, ...]] = {}
+
+    def remove(self, job_id: int) -> None:
+        for name in self.job_tags.pop(job_id, ()):
+            self.by_tag[name].discard(job_id)
+
+    def add(self, job_id: int, names: Iterable[str]) -> None:
+        self.remove(job_id)
+        names = tuple(names)
+        if names:
+            self.job_tags[job_id] = names
+        for name in names:
+            self.by_tag.setdefault(name, Bitmap()).add(job_id)
+
+
+class TagIndex(BackgroundLoaded[_Postings]):
+    """Tag name -> job id posting lists, for any/all tag matching without joins."""
+
+    name = "tag index"
+
+    async def build(self, db: AsyncSession) -> _Postings:
+        names = dict((await db.execute(select(Tag.id, Tag.name))).all())
+        job_tags: Dict[int, List[str]] = {}
+        rows = await db.stream(
+            select(job_tags_table.c.job_id, job_tags_table.c.tag_id)
+            .execution_options(yield_per=10000)
+        )
+        async for job_id, tag_id in rows:
+            job_tags.setdefault(job_id, []).append(names[tag_id])
+        # Building the bitmaps is CPU-bound; keep it off the event loop
+        return await asyncio.to_thread(self._assemble, job_tags)
+
+    @staticmethod
+    def _assemble(job_tags: Dict[int, List[str]]) -> _Postings:
+        postings = _Postings()
+        for job_id in sorted(job_tags):
+            postings.add(job_id, job_tags[job_id])
+        return postings
+
+    def index_job(self, job_id: int, tag_names: Iterable[str]) -> None:
+        names = tuple(tag_names)
+        self._apply(lambda postings: postings.add(job_id, names))
+
+    def remove_job(self, job_id: int) -> None:
+        self._apply(lambda postings: postings.remove(job_id))
+
+    def postings(self) -> Dict[str, Bitmap]:
+        """Every tag's posting list; empty while the index is cold."""
+        return self._state.by_tag if self._state is not None else {}
+
+    def match(self, tag_names: List[str], mode: TagMode) -> Optional[Bitmap]:
+        """Ids of jobs carrying any/all of the tags, or None while the index is cold."""
+        postings = self._state
+        if postings is None:
+            return None
+        if mode == TagMode.ALL:
+            if any(name not in postings.by_tag for name in tag_names):
+                return Bitmap()
+            return Bitmap.intersection([postings.by_tag[name] for name in tag_names])
+        return Bitmap.union(postings.by_tag[name] for name in tag_names if name in postings.by_tag)
+
+
+tag_index = TagIndex()
@@ -0,0 +1,69 @@
+import time
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Type
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+from app.metrics import current_request
+
+
+@lru_cache(maxsize=None)
+def _adapter(type_: Any) -> TypeAdapter:
+    return TypeAdapter(type_)
+
+
+def encode_json(type_: Any, value: Any) -> bytes:
+    """Serialize a value, e.g. ORM objects, through a response model to JSON bytes."""
+    started = time.perf_counter()
+    adapter = _adapter(type_)
+    body = adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+    request = current_request()
+    if request is not None:
+        request.serialize_seconds += time.perf_counter() - started
+    return body
+
+
+def share_nested(
+    objects: Iterable[Any],
+    model: Type[BaseModel],
+    field: str
+) -> List[Dict[str, Any]]:
+    """Read objects into dicts of `model`'s fields, validating `field` once per distinct value.
+
+    Meant for a nested object that many items share, such as the company of a page of
+    jobs: it is validated, email and enum checks included, once instead of per item.
+    """
+    adapter = _adapter(model.model_fields[field].annotation)
+    names = [name for name in model.model_fields if name != field]
+    shared: Dict[int, Any] = {}
+    rows = []
+    for obj in objects:
+        row = {name: getattr(obj, name) for name in names}
+        value = getattr(obj, field)
+        if id(value) not in shared:
+            shared[id(value)] = adapter.validate_python(value, from_attributes=True)
+        row[field] = shared[id(value)]
+        rows.append(row)
+    return rows
+
+
+class ModelResponse(Response):
+    """JSON response encoded in one pass through a response model.
+
+    For a returned value FastAPI validates it against `response_model`, converts the
+    result to plain data with jsonable_encoder and encodes that with the json module.
+    Returning a ModelResponse bypasses all three: the value is validated once and
+    dumped straight to JSON bytes by pydantic-core. Routes keep their response_model,
+    so the OpenAPI schema does not change.
+    """
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        type_: Any,
+        content: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None
+    ):
+        super().__init__(encode_json(type_, content), status_code=status_code, headers=headers)
@@ -2,5 +2,10 @@ from .company_service import CompanyService
 from .user_service import UserService
 from .job_service import JobService
 from .tag_service import TagService
+from .location_service import LocationService
+from .saved_search_service import SavedSearchService
 
-__all__ = ["CompanyService", "UserService", "JobService", "TagService"] 
\ No newline at end of file
+__all__ = [
+    "CompanyService", "UserService", "JobService", "TagService", "LocationService",
+    "SavedSearchService",
+]
\ No newline at end of file
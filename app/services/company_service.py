@@ -1,23 +1,80 @@
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from fastapi import HTTPException, status
 
-from app.models import Company
+from app.models import Company, Job
 from app.schemas import CompanyCreate, CompanyUpdate
-from app.auth.security import get_password_hash, verify_password
+from app.cache import COMPANY_LISTS, company_dependency, invalidate_after_commit
+from app.auth.cache import principal_cache
+from app.auth.hashing import password_hasher
+from app.db.pagination import keyset_before, next_page_cursor
+from app.search import job_read_model, suggest_index
+
+
+# Company columns listed in the directory; never the password hash
+_DIRECTORY_COLUMNS = (
+    Company.id, Company.email, Company.company_name, Company.description, Company.website,
+    Company.location, Company.is_active, Company.is_verified, Company.created_at,
+    Company.updated_at,
+)
+
+
+def _newest_first(query, model):
+    return query.order_by(model.created_at.desc(), model.id.desc())
 
 
 class CompanyService:
     @staticmethod
-    async def get_all_companies(db: AsyncSession) -> List[Company]:
-        """Get all companies."""
-        result = await db.execute(
-            select(Company)
-            .options(selectinload(Company.jobs))
-        )
-        return result.scalars().all()
+    async def get_companies(
+        db: AsyncSession,
+        name_prefix: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Get one page of the company directory, newest first, and the next cursor.
+
+        Pages by cursor when `cursor` is given (an empty string starts from the newest
+        company), otherwise by offset with no cursor returned. Each company carries its
+        active job count and latest active job time, aggregated in one grouped query.
+        """
+        query = _newest_first(select(*_DIRECTORY_COLUMNS), Company)
+        if name_prefix:
+            query = query.where(
+                func.lower(Company.company_name).startswith(name_prefix.lower(), autoescape=True)
+            )
+
+        next_cursor = None
+        if cursor is not None:
+            if cursor:
+                query = query.where(keyset_before(Company.created_at, Company.id, cursor))
+            rows = (await db.execute(query.limit(limit + 1))).all()
+            next_cursor = next_page_cursor(rows, limit)
+            rows = rows[:limit]
+        else:
+            rows = (await db.execute(query.offset(skip).limit(limit))).all()
+
+        job_stats = {}
+        if rows:
+            result = await db.execute(
+                select(Job.company_id, func.count(Job.id), func.max(Job.created_at))
+                .where(Job.company_id.in_([row.id for row in rows]), Job.is_active.is_(True))
+                .group_by(Job.company_id)
+            )
+            job_stats = {company_id: (count, latest) for company_id, count, latest in result}
+
+        companies = []
+        for row in rows:
+            active_job_count, latest_job_at = job_stats.get(row.id, (0, None))
+            companies.append({
+                **row._mapping,
+                "active_job_count": active_job_count,
+                "latest_job_at": latest_job_at,
+            })
+        return companies, next_cursor
 
     @staticmethod
     async def create_company(db: AsyncSession, company_data: CompanyCreate) -> Company:
@@ -33,7 +90,7 @@ class CompanyService:
             )
         
         # Create company
-        hashed_password = get_password_hash(company_data.password)
+        hashed_password = await password_hasher.hash(company_data.password)
         company = Company(
             email=company_data.email,
             company_name=company_data.company_name,
@@ -44,8 +101,13 @@ class CompanyService:
         )
         
         db.add(company)
+        invalidate_after_commit(db, COMPANY_LISTS)
         await db.commit()
         await db.refresh(company)
+        # A new company has no jobs; mark the collection loaded so it never lazy-loads
+        set_committed_value(company, "jobs", [])
+        job_read_model.upsert_company(company)
+        suggest_index.upsert_company(company)
         return company
     
     @staticmethod
@@ -56,7 +118,7 @@ class CompanyService:
         )
         company = result.scalar_one_or_none()
         
-        if not company or not verify_password(password, company.hashed_password):
+        if not company or not await password_hasher.verify(password, company.hashed_password):
             return None
         
         return company
@@ -71,6 +133,27 @@ class CompanyService:
         )
         return result.scalar_one_or_none()
     
+    @staticmethod
+    async def get_company_with_jobs_page(
+        db: AsyncSession,
+        company_id: int,
+        cursor: Optional[str] = None,
+        limit: int = 100
+    ) -> Optional[Tuple[Company, Optional[str]]]:
+        """Get a company with one page of its jobs, newest first, and the next jobs cursor."""
+        result = await db.execute(select(Company).where(Company.id == company_id))
+        company = result.scalar_one_or_none()
+        if company is None:
+            return None
+
+        query = _newest_first(select(Job), Job).where(Job.company_id == company_id)
+        if cursor:
+            query = query.where(keyset_before(Job.created_at, Job.id, cursor))
+        jobs = (await db.execute(query.limit(limit + 1))).scalars().all()
+        # Attach just this page as the loaded collection CompanyOut serializes
+        set_committed_value(company, "jobs", jobs[:limit])
+        return company, next_page_cursor(jobs, limit)
+
     @staticmethod
     async def get_company_by_email(db: AsyncSession, email: str) -> Optional[Company]:
         """Get company by email."""
@@ -91,6 +174,12 @@ class CompanyService:
         for field, value in update_data.items():
             setattr(company, field, value)
         
+        invalidate_after_commit(db, COMPANY_LISTS, company_dependency(company.id))
         await db.commit()
         await db.refresh(company)
+        # CompanyOut lists the company's jobs, which cannot be lazy-loaded here
+        await db.refresh(company, ["jobs"])
+        principal_cache.invalidate("company", company.email)
+        job_read_model.upsert_company(company)
+        suggest_index.upsert_company(company)
         return company 
\ No newline at end of file
@@ -1,13 +1,104 @@
-from typing import List, Optional
+import logging
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+)
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import (
+    Integer, String, select, insert, and_, or_, case, cast, func, literal, union_all
+)
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.sql import ColumnElement, Select
 from fastapi import HTTPException, status
 
-from app.models import Job, Tag, Company
+from app.models import Job, Tag, Company, Location, job_tags_table
 from app.models.job import JobType, JobLevel
-from app.schemas import JobCreate, JobUpdate, JobFilter
-from .tag_service import TagService
+from app.cache import (
+    JOB_LISTS, COMPANY_LISTS, company_dependency, invalidate_after_commit, job_dependency
+)
+from app.config import settings
+from app.schemas import (
+    JobCreate, JobUpdate, JobFilter, JobFacets, SalaryHistogram, JobIngestResult, TagMode
+)
+from app.schemas.job import FacetCount, JobIngestStatus, SalaryBucketCount
+from app.db.pagination import keyset_before, next_page_cursor
+from app.search import job_read_model, suggest_index
+from app.search.percolator import JobFields, job_fields
+from app.search.places import parse_location
+from app.search.salary import salary_bucket_bounds
+from app.search.suggest import JobTerms, job_terms
+from app.tasks import enqueue
+from .location_service import LocationService
+from .saved_search_service import SavedSearchService
+from .tag_service import TagService, normalize_tag_names
+
+logger = logging.getLogger(__name__)
+
+# A job's advertised salary range; a single bound means exactly that amount. These match
+# the expressions of the ix_jobs_active_salary index.
+_SALARY_LOW = func.coalesce(Job.salary_min, Job.salary_max)
+_SALARY_HIGH = func.coalesce(Job.salary_max, Job.salary_min)
+
+
+def _with_relationships(query: Select) -> Select:
+    """Eager-load everything JobOut serializes: tags and the company, without its jobs."""
+    return query.options(selectinload(Job.tags), selectinload(Job.company))
+
+
+def _newest_first(query: Select) -> Select:
+    """Order by creation time with the primary key as a stable tie-breaker."""
+    return query.order_by(Job.created_at.desc(), Job.id.desc())
+
+
+def _job_write_dependencies(company_id: int, job_id: Optional[int] = None) -> List[str]:
+    """Cached responses a job write can change: lists, its company, and the job itself."""
+    dependencies = [JOB_LISTS, COMPANY_LISTS, company_dependency(company_id)]
+    if job_id is not None:
+        dependencies.append(job_dependency(job_id))
+    return dependencies
+
+
+# Job columns a summary returns as stored; description, tags and company are derived
+_SUMMARY_COLUMNS = (
+    "id", "title", "location", "job_type", "job_level", "salary_min", "salary_max",
+    "is_active", "company_id", "created_at",
+)
+
+
+def _new_job_fields(job_data: JobCreate, tag_names: Iterable[str]) -> JobFields:
+    """Fields a saved search matches in a job about to be created, which starts active."""
+    return JobFields(
+        frozenset(tag_names), job_data.job_type, job_data.job_level, job_data.location,
+        job_data.salary_min, job_data.salary_max,
+    )
+
+
+def _truncate(description: str) -> str:
+    length = settings.job_summary_description_length
+    if len(description) <= length:
+        return description
+    return description[:length].rstrip() + "\u2026"
+
+
+def _summary(
+    job: Any,
+    fields: Sequence[str],
+    tag_names: List[str],
+    company_name: Optional[str]
+) -> Dict[str, Any]:
+    """Project a job row or read model document onto the requested JobSummaryOut fields."""
+    summary: Dict[str, Any] = {}
+    for field in fields:
+        if field == "description":
+            summary[field] = _truncate(job.description)
+        elif field == "tags":
+            summary[field] = tag_names
+        elif field == "company":
+            summary[field] = {"id": job.company_id, "company_name": company_name}
+        else:
+            summary[field] = getattr(job, field)
+    return summary
 
 
 class JobService:
@@ -23,6 +114,7 @@ class JobService:
             title=job_data.title,
             description=job_data.description,
             location=job_data.location,
+            location_id=await LocationService.get_or_create_location_id(db, job_data.location),
             job_type=job_data.job_type,
             job_level=job_data.job_level,
             salary_min=job_data.salary_min,
@@ -31,29 +123,184 @@ class JobService:
         )
         
         # Handle tags
+        tags = []
         if job_data.tag_names:
             tags = await TagService.get_or_create_tags(db, job_data.tag_names)
             job.tags = tags
         
         db.add(job)
+        await db.flush()
+        SavedSearchService.queue_alerts(
+            db, [(job.id, None, _new_job_fields(job_data, (tag.name for tag in tags)))]
+        )
+        invalidate_after_commit(db, *_job_write_dependencies(company_id))
         await db.commit()
         await db.refresh(job)
         
         # Load relationships
         result = await db.execute(
-            select(Job)
-            .options(selectinload(Job.tags), selectinload(Job.company))
-            .where(Job.id == job.id)
+            _with_relationships(select(Job)).where(Job.id == job.id)
         )
-        return result.scalar_one()
+        job = result.scalar_one()
+        TagService.index_job_tags(job)
+        job_read_model.upsert_job(job)
+        suggest_index.change_job(None, job_terms(job))
+        return job
     
+    @staticmethod
+    async def ingest_jobs(
+        db: AsyncSession,
+        lines: AsyncIterable[Optional[bytes]],
+        company_id: int
+    ) -> AsyncIterator[JobIngestResult]:
+        """Create jobs from NDJSON lines, yielding one result per non-blank line, in order.
+
+        A None line stands for one that was too long to read. Valid rows are written
+        and committed in batches, so memory use does not grow with the upload. Large
+        uploads queue a refresh of planner statistics once they are done.
+        """
+        batch: List[Tuple[int, Union[JobCreate, JobIngestResult]]] = []
+        line_number = 0
+        created = 0
+        async for line in lines:
+            line_number += 1
+            if line is None:
+                batch.append((line_number, JobIngestResult(
+                    line=line_number,
+                    status=JobIngestStatus.ERROR,
+                    errors=[{"loc": [], "msg": "Line is too long", "type": "line_too_long"}]
+                )))
+            elif line.strip():
+                try:
+                    batch.append((line_number, JobCreate.model_validate_json(line)))
+                except ValidationError as exc:
+                    errors = [
+                        {"loc": list(error["loc"]), "msg": error["msg"], "type": error["type"]}
+                        for error in exc.errors()
+                    ]
+                    batch.append((line_number, JobIngestResult(
+                        line=line_number, status=JobIngestStatus.ERROR, errors=errors
+                    )))
+
+            if len(batch) >= settings.bulk_ingest_batch_size:
+                for result in await JobService._ingest_batch(db, batch, company_id):
+                    created += result.status == JobIngestStatus.CREATED
+                    yield result
+                batch = []
+
+        for result in await JobService._ingest_batch(db, batch, company_id):
+            created += result.status == JobIngestStatus.CREATED
+            yield result
+
+        if created >= settings.bulk_ingest_analyze_threshold:
+            enqueue(db, "jobs.analyze", {"company_id": company_id, "created": created})
+            await db.commit()
+
+    @staticmethod
+    async def _ingest_batch(
+        db: AsyncSession,
+        batch: List[Tuple[int, Union[JobCreate, JobIngestResult]]],
+        company_id: int
+    ) -> List[JobIngestResult]:
+        """Write the valid rows of a batch in one transaction and report every row."""
+        jobs = [(line, item) for line, item in batch if isinstance(item, JobCreate)]
+        job_ids: Dict[int, int] = {}
+        if jobs:
+            try:
+                created = await JobService.create_jobs(
+                    db, [job_data for _, job_data in jobs], company_id
+                )
+                job_ids = dict(zip((line for line, _ in jobs), created))
+            except SQLAlchemyError:
+                logger.exception("Failed to write a batch of %d jobs", len(jobs))
+                await db.rollback()
+
+        results = []
+        for line, item in batch:
+            if isinstance(item, JobIngestResult):
+                results.append(item)
+            elif line in job_ids:
+                results.append(JobIngestResult(
+                    line=line, status=JobIngestStatus.CREATED, id=job_ids[line]
+                ))
+            else:
+                results.append(JobIngestResult(
+                    line=line,
+                    status=JobIngestStatus.ERROR,
+                    errors=[{"loc": [], "msg": "Could not save job", "type": "database_error"}]
+                ))
+        return results
+
+    @staticmethod
+    async def create_jobs(
+        db: AsyncSession,
+        jobs: List[JobCreate],
+        company_id: int
+    ) -> List[int]:
+        """Create many job postings in one transaction, returning their ids in order.
+
+        Jobs and their tag associations are written with multi-row INSERTs, without
+        loading the new rows back unless the read model needs them.
+        """
+        location_ids = await LocationService.get_or_create_location_ids(
+            db, (job_data.location for job_data in jobs)
+        )
+        rows = []
+        for job_data in jobs:
+            place = parse_location(job_data.location)
+            rows.append({
+                **job_data.model_dump(exclude={"tag_names"}),
+                "company_id": company_id,
+                "location_id": location_ids[place.key] if place else None,
+            })
+        result = await db.execute(
+            insert(Job).returning(Job.id, sort_by_parameter_order=True), rows
+        )
+        job_ids = list(result.scalars())
+
+        tag_names = [normalize_tag_names(job_data.tag_names) for job_data in jobs]
+        tag_ids = await TagService.get_or_create_tag_ids(
+            db, [name for names in tag_names for name in names]
+        )
+        job_tags = [
+            {"job_id": job_id, "tag_id": tag_ids[name]}
+            for job_id, names in zip(job_ids, tag_names)
+            for name in names
+        ]
+        if job_tags:
+            await db.execute(insert(job_tags_table), job_tags)
+
+        SavedSearchService.queue_alerts(db, [
+            (job_id, None, _new_job_fields(job_data, names))
+            for job_id, job_data, names in zip(job_ids, jobs, tag_names)
+        ])
+        invalidate_after_commit(db, *_job_write_dependencies(company_id))
+        await db.commit()
+
+        TagService.cache_tag_ids(tag_ids)
+        for job_id, names in zip(job_ids, tag_names):
+            TagService.index_job_tag_names(job_id, names)
+        for job_data, names in zip(jobs, tag_names):
+            suggest_index.change_job(
+                None, JobTerms(job_data.title, company_id, job_data.location, tuple(names))
+            )
+        if job_read_model.active:
+            result = await db.execute(
+                select(Job)
+                .options(selectinload(Job.tags), selectinload(Job.company))
+                .where(Job.id.in_(job_ids))
+            )
+            for job in result.scalars():
+                job_read_model.upsert_job(job)
+            db.expunge_all()
+
+        return job_ids
+
     @staticmethod
     async def get_job_by_id(db: AsyncSession, job_id: int) -> Optional[Job]:
         """Get job by ID with relationships loaded."""
         result = await db.execute(
-            select(Job)
-            .options(selectinload(Job.tags), selectinload(Job.company))
-            .where(Job.id == job_id)
+            _with_relationships(select(Job)).where(Job.id == job_id)
         )
         return result.scalar_one_or_none()
     
@@ -71,27 +318,44 @@ class JobService:
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to update this job"
             )
+        before = job_terms(job)
+        fields_before = job_fields(job)
         
         # Update fields
         update_data = job_data.dict(exclude_unset=True, exclude={"tag_names"})
+        salary_min = update_data.get("salary_min", job.salary_min)
+        salary_max = update_data.get("salary_max", job.salary_max)
+        if salary_min is not None and salary_max is not None and salary_min > salary_max:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="salary_min cannot be greater than salary_max"
+            )
         for field, value in update_data.items():
             setattr(job, field, value)
+        if "location" in update_data:
+            job.location_id = await LocationService.get_or_create_location_id(
+                db, job.location
+            )
         
         # Handle tags if provided
         if job_data.tag_names is not None:
             tags = await TagService.get_or_create_tags(db, job_data.tag_names)
             job.tags = tags
         
+        SavedSearchService.queue_alerts(db, [(job.id, fields_before, job_fields(job))])
+        invalidate_after_commit(db, *_job_write_dependencies(job.company_id, job.id))
         await db.commit()
         await db.refresh(job)
         
         # Load relationships
         result = await db.execute(
-            select(Job)
-            .options(selectinload(Job.tags), selectinload(Job.company))
-            .where(Job.id == job.id)
+            _with_relationships(select(Job)).where(Job.id == job.id)
         )
-        return result.scalar_one()
+        job = result.scalar_one()
+        TagService.index_job_tags(job)
+        job_read_model.upsert_job(job)
+        suggest_index.change_job(before, job_terms(job))
+        return job
     
     @staticmethod
     async def delete_job(db: AsyncSession, job: Job, company_id: int) -> bool:
@@ -102,42 +366,162 @@ class JobService:
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not authorized to delete this job"
             )
+        before = job_terms(job)
         
         await db.delete(job)
+        invalidate_after_commit(db, *_job_write_dependencies(job.company_id, job.id))
         await db.commit()
+        TagService.unindex_job_tags(job.id)
+        job_read_model.remove_job(job.id)
+        suggest_index.change_job(before, None)
         return True
     
     @staticmethod
-    async def get_jobs_with_filters(
-        db: AsyncSession, 
-        filters: JobFilter
-    ) -> List[Job]:
-        """Get jobs with advanced filtering."""
-        query = select(Job).options(selectinload(Job.tags), selectinload(Job.company))
-        conditions = [Job.is_active == filters.is_active]
+    def _tag_condition(tag_names: List[str], mode: TagMode):
+        """Match jobs by tag, via the bitmap index when it yields a short id list."""
+        job_ids = TagService.match_job_ids(tag_names, mode)
+        if job_ids is not None and len(job_ids) <= settings.tag_index_max_query_ids:
+            return Job.id.in_(list(job_ids))
+        if mode == TagMode.ALL:
+            return and_(*(Job.tags.any(Tag.name == name) for name in tag_names))
+        return Job.tags.any(Tag.name.in_(tag_names))
+
+    @staticmethod
+    def _filter_conditions(filters: JobFilter) -> Dict[str, ColumnElement]:
+        """SQL condition for each filtered dimension, keyed like the facet dimensions."""
+        conditions: Dict[str, ColumnElement] = {}
         
-        if filters.tags:
-            tag_names = [tag.strip().lower() for tag in filters.tags.split(",") if tag.strip()]
-            if tag_names:
-                query = query.join(Job.tags)
-                conditions.append(Tag.name.in_(tag_names))
+        tag_names = filters.tag_names()
+        if tag_names:
+            conditions["tags"] = JobService._tag_condition(tag_names, filters.tag_mode)
         
         if filters.location:
-            conditions.append(Job.location.ilike(f"%{filters.location}%"))
+            conditions["location"] = LocationService.job_condition(
+                filters.location, filters.location_match
+            )
         
         if filters.job_type:
-            conditions.append(Job.job_type == filters.job_type)
+            conditions["job_type"] = Job.job_type == filters.job_type
         
         if filters.job_level:
-            conditions.append(Job.job_level == filters.job_level)
-        
-        if conditions:
-            query = query.where(and_(*conditions))
+            conditions["job_level"] = Job.job_level == filters.job_level
         
-        query = query.order_by(Job.created_at.desc()).offset(filters.skip).limit(filters.limit)
+        # Ranges overlapping the requested one; jobs without a salary never match
+        bounds = []
+        if filters.salary_min is not None:
+            bounds.append(_SALARY_HIGH >= filters.salary_min)
+        if filters.salary_max is not None:
+            bounds.append(_SALARY_LOW <= filters.salary_max)
+        if bounds:
+            conditions["salary"] = and_(*bounds)
+
+        return conditions
+
+    @staticmethod
+    def _filtered_query(filters: JobFilter) -> Select:
+        """Build the filtered, newest-first job query shared by offset and cursor paging."""
+        conditions = JobService._filter_conditions(filters).values()
+        return _newest_first(_with_relationships(select(Job))).where(
+            Job.is_active == filters.is_active, *conditions
+        )
+
+    @staticmethod
+    async def get_jobs_with_filters(
+        db: AsyncSession,
+        filters: JobFilter
+    ) -> List[Job]:
+        """Get jobs with advanced filtering, from the read model when it can answer."""
+        jobs = job_read_model.query(filters)
+        if jobs is not None:
+            return jobs
+
+        query = JobService._filtered_query(filters).offset(filters.skip).limit(filters.limit)
         result = await db.execute(query)
-        return result.scalars().unique().all()
+        return result.scalars().all()
+
+    @staticmethod
+    async def get_jobs_page(
+        db: AsyncSession,
+        filters: JobFilter
+    ) -> Tuple[List[Job], Optional[str]]:
+        """Get one keyset-paginated page of filtered jobs and the cursor for the next one."""
+        page = job_read_model.query_page(filters)
+        if page is not None:
+            return page
+
+        query = JobService._filtered_query(filters)
+        if filters.cursor:
+            query = query.where(keyset_before(Job.created_at, Job.id, filters.cursor))
+
+        result = await db.execute(query.limit(filters.limit + 1))
+        jobs = result.scalars().all()
+        return jobs[:filters.limit], next_page_cursor(jobs, filters.limit)
     
+    @staticmethod
+    async def get_job_summaries(
+        db: AsyncSession,
+        filters: JobFilter,
+        fields: Sequence[str]
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Get filtered jobs as summaries holding only `fields`, and the next page's cursor.
+
+        Pages by cursor when `filters.cursor` is set (an empty string starts from the
+        newest job), otherwise by offset with no cursor returned. The SQL fallback
+        selects just the requested columns, cutting the description short in the query.
+        """
+        paged = filters.cursor is not None
+        page = job_read_model.query_page(filters) if paged else job_read_model.query(filters)
+        if page is not None:
+            documents, next_cursor = page if paged else (page, None)
+            return [
+                _summary(
+                    document, fields, [tag.name for tag in document.tags],
+                    document.company.company_name
+                )
+                for document in documents
+            ], next_cursor
+
+        columns = {"id": Job.id, "created_at": Job.created_at, "company_id": Job.company_id}
+        columns.update(
+            (field, getattr(Job, field)) for field in fields if field in _SUMMARY_COLUMNS
+        )
+        if "description" in fields:
+            length = settings.job_summary_description_length + 1
+            columns["description"] = func.substr(Job.description, 1, length).label("description")
+        conditions = JobService._filter_conditions(filters).values()
+        query = _newest_first(select(*columns.values())).where(
+            Job.is_active == filters.is_active, *conditions
+        )
+        if "company" in fields:
+            query = query.add_columns(Company.company_name).join(
+                Company, Company.id == Job.company_id
+            )
+
+        next_cursor = None
+        if paged:
+            if filters.cursor:
+                query = query.where(keyset_before(Job.created_at, Job.id, filters.cursor))
+            rows = (await db.execute(query.limit(filters.limit + 1))).all()
+            next_cursor = next_page_cursor(rows, filters.limit)
+            rows = rows[:filters.limit]
+        else:
+            rows = (await db.execute(query.offset(filters.skip).limit(filters.limit))).all()
+
+        tag_names: Dict[int, List[str]] = {}
+        if "tags" in fields and rows:
+            result = await db.execute(
+                select(job_tags_table.c.job_id, Tag.name)
+                .join(Tag, Tag.id == job_tags_table.c.tag_id)
+                .where(job_tags_table.c.job_id.in_([row.id for row in rows]))
+            )
+            for job_id, name in result:
+                tag_names.setdefault(job_id, []).append(name)
+
+        return [
+            _summary(row, fields, tag_names.get(row.id, []), getattr(row, "company_name", None))
+            for row in rows
+        ], next_cursor
+
     @staticmethod
     async def get_company_jobs(
         db: AsyncSession, 
@@ -147,11 +531,211 @@ class JobService:
     ) -> List[Job]:
         """Get all jobs for a specific company."""
         result = await db.execute(
-            select(Job)
-            .options(selectinload(Job.tags))
+            _newest_first(_with_relationships(select(Job)))
             .where(Job.company_id == company_id)
-            .order_by(Job.created_at.desc())
             .offset(skip)
             .limit(limit)
         )
-        return result.scalars().all() 
\ No newline at end of file
+        return result.scalars().all()
+
+    @staticmethod
+    async def get_company_jobs_page(
+        db: AsyncSession,
+        company_id: int,
+        cursor: Optional[str] = None,
+        limit: int = 100
+    ) -> Tuple[List[Job], Optional[str]]:
+        """Get one keyset-paginated page of a company's jobs and the next cursor."""
+        query = _newest_first(_with_relationships(select(Job))).where(Job.company_id == company_id)
+        if cursor:
+            query = query.where(keyset_before(Job.created_at, Job.id, cursor))
+
+        result = await db.execute(query.limit(limit + 1))
+        jobs = result.scalars().all()
+        return jobs[:limit], next_page_cursor(jobs, limit)
+
+    @staticmethod
+    async def export_jobs(
+        db: AsyncSession,
+        filters: JobFilter,
+        company_id: Optional[int] = None,
+        limit: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream the filtered jobs, newest first, as flat rows of JSON-ready values.
+
+        Rows come from a server-side cursor in batches of `export_batch_size`, so
+        memory use does not depend on the number of jobs exported. `limit` caps the
+        number of rows.
+        """
+        conditions = JobService._filter_conditions(filters).values()
+        query = (
+            _newest_first(select(Job))
+            .options(selectinload(Job.tags), joinedload(Job.company))
+            .where(Job.is_active == filters.is_active, *conditions)
+            .execution_options(yield_per=settings.export_batch_size)
+        )
+        if company_id is not None:
+            query = query.where(Job.company_id == company_id)
+        if limit is not None:
+            query = query.limit(limit)
+
+        jobs = await db.stream_scalars(query)
+        async for job in jobs:
+            yield {
+                "id": job.id,
+                "title": job.title,
+                "description": job.description,
+                "location": job.location,
+                "job_type": job.job_type.value,
+                "job_level": job.job_level.value,
+                "salary_min": job.salary_min,
+                "salary_max": job.salary_max,
+                "is_active": job.is_active,
+                "company_id": job.company_id,
+                "company_name": job.company.company_name,
+                "tags": [tag.name for tag in job.tags],
+                "created_at": job.created_at.isoformat(),
+                "updated_at": job.updated_at.isoformat(),
+            }
+
+    @staticmethod
+    async def get_job_facets(db: AsyncSession, filters: JobFilter, limit: int = 10) -> JobFacets:
+        """Count matching jobs per facet value, each facet ignoring its own filter."""
+        facets = job_read_model.facets(filters, limit)
+        if facets is None:
+            facets = await JobService._sql_facets(db, filters, limit)
+
+        return JobFacets(
+            total=facets["total"],
+            job_type=[
+                FacetCount(value=job_type.value, count=facets["job_type"].get(job_type, 0))
+                for job_type in JobType
+            ],
+            job_level=[
+                FacetCount(value=job_level.value, count=facets["job_level"].get(job_level, 0))
+                for job_level in JobLevel
+            ],
+            tags=[FacetCount(value=name, count=count) for name, count in facets["tags"]],
+            locations=[
+                FacetCount(value=location, count=count) for location, count in facets["locations"]
+            ],
+            salary=JobService._salary_buckets(facets["salary"]),
+        )
+
+    @staticmethod
+    def _salary_bucket_counts() -> List[ColumnElement]:
+        """One aggregate per salary bucket, counting the jobs whose range overlaps it."""
+        counts = []
+        for bucket in range(settings.salary_bucket_count):
+            lower, upper = salary_bucket_bounds(bucket)
+            overlaps = _SALARY_HIGH >= lower
+            if upper is not None:
+                overlaps = and_(overlaps, _SALARY_LOW < upper)
+            counts.append(func.coalesce(func.sum(case((overlaps, 1), else_=0)), 0))
+        return counts
+
+    @staticmethod
+    async def get_salary_histogram(db: AsyncSession, filters: JobFilter) -> SalaryHistogram:
+        """Count the jobs matching every filter per salary bucket."""
+        histogram = job_read_model.salary_histogram(filters)
+        if histogram is None:
+            conditions = JobService._filter_conditions(filters).values()
+            total, with_salary, *buckets = (await db.execute(
+                select(func.count(Job.id), func.count(_SALARY_LOW),
+                       *JobService._salary_bucket_counts())
+                .where(Job.is_active == filters.is_active, *conditions)
+            )).one()
+            histogram = {
+                "total": total, "with_salary": with_salary, "buckets": dict(enumerate(buckets))
+            }
+
+        return SalaryHistogram(
+            total=histogram["total"],
+            with_salary=histogram["with_salary"],
+            bucket_size=settings.salary_bucket_size,
+            buckets=JobService._salary_buckets(histogram["buckets"]),
+        )
+
+    @staticmethod
+    def _salary_buckets(counts: Dict[int, int]) -> List[SalaryBucketCount]:
+        return [
+            SalaryBucketCount(
+                min=salary_bucket_bounds(bucket)[0],
+                max=salary_bucket_bounds(bucket)[1],
+                count=counts.get(bucket, 0)
+            )
+            for bucket in range(settings.salary_bucket_count)
+        ]
+
+    @staticmethod
+    def _salary_bucket_table():
+        """The salary buckets as rows of (bucket, lower, upper), to join jobs against."""
+        return union_all(*(
+            select(
+                literal(bucket).label("bucket"),
+                literal(lower).label("lower"),
+                literal(upper, Integer).label("upper"),
+            )
+            for bucket, (lower, upper) in (
+                (bucket, salary_bucket_bounds(bucket))
+                for bucket in range(settings.salary_bucket_count)
+            )
+        )).subquery()
+
+    @staticmethod
+    async def _sql_facets(db: AsyncSession, filters: JobFilter, limit: int) -> Dict[str, Any]:
+        """Facet counts straight from SQL, every dimension grouped in one UNION ALL."""
+        conditions = JobService._filter_conditions(filters)
+
+        def matching(excluded: Optional[str] = None) -> ColumnElement:
+            others = [condition for name, condition in conditions.items() if name != excluded]
+            return and_(Job.is_active == filters.is_active, *others)
+
+        def grouped(column, excluded: str, join: Tuple = (), top: bool = False) -> Select:
+            count = func.count(Job.id.distinct())
+            query = select(
+                literal(excluded).label("dimension"),
+                cast(column, String).label("value"),
+                count.label("count"),
+            ).select_from(Job)
+            if join:
+                query = query.join(*join)
+            query = query.where(matching(excluded), column.isnot(None)).group_by(column)
+            if top:
+                # Not every backend orders and limits a member of a compound select directly
+                query = select(query.order_by(count.desc(), column).limit(limit).subquery())
+            return query
+
+        buckets = JobService._salary_bucket_table()
+        overlaps = and_(
+            _SALARY_HIGH >= buckets.c.lower,
+            or_(buckets.c.upper.is_(None), _SALARY_LOW < buckets.c.upper),
+        )
+        rows = (await db.execute(union_all(
+            select(literal("total"), literal(None, String), func.count(Job.id)).where(matching()),
+            grouped(Job.job_type, "job_type"),
+            grouped(Job.job_level, "job_level"),
+            grouped(Tag.name, "tags", (Job.tags,), top=True),
+            grouped(Location.name, "location", (Location, Location.id == Job.location_id),
+                    top=True),
+            grouped(buckets.c.bucket, "salary", (buckets, overlaps)),
+        ))).all()
+
+        groups: Dict[str, List[Tuple[str, int]]] = {}
+        for dimension, value, count in rows:
+            groups.setdefault(dimension, []).append((value, count))
+
+        def ranked(dimension: str) -> List[Tuple[str, int]]:
+            return sorted(groups.get(dimension, []), key=lambda row: (-row[1], row[0]))
+
+        return {
+            "total": groups["total"][0][1],
+            # Enum columns hold member names
+            "job_type": {JobType[value]: count for value, count in groups.get("job_type", [])},
+            "job_level": {
+                JobLevel[value]: count for value, count in groups.get("job_level", [])
+            },
+            "tags": ranked("tags"),
+            "locations": ranked("location"),
+            "salary": {int(value): count for value, count in groups.get("salary", [])},
+        }
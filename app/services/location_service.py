@@ -0,0 +1,112 @@
+from typing import Dict, Iterable, List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, insert, and_, or_, true
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql import ColumnElement
+
+from app.models import Job, Location
+from app.schemas import LocationMatch
+from app.search.places import Place, parse_location
+from .tag_service import _UPSERT_INSERTS
+
+
+def _place_row(place: Place) -> dict:
+    return {
+        "name": place.name, "key": place.key,
+        "city": place.city, "region": place.region, "country": place.country,
+    }
+
+
+class LocationService:
+    @staticmethod
+    async def get_or_create_location_id(
+        db: AsyncSession,
+        location: Optional[str]
+    ) -> Optional[int]:
+        """Get or create the canonical location of free-text location, or None if blank."""
+        ids = await LocationService.get_or_create_location_ids(db, [location])
+        place = parse_location(location)
+        return ids[place.key] if place else None
+
+    @staticmethod
+    async def get_or_create_location_ids(
+        db: AsyncSession,
+        locations: Iterable[Optional[str]]
+    ) -> Dict[str, int]:
+        """Get or create canonical locations, returning their ids by key.
+
+        Nothing is committed; new locations are part of the caller's transaction.
+        """
+        places = {place.key: place for place in map(parse_location, locations) if place}
+        if not places:
+            return {}
+
+        ids = await LocationService._get_location_ids(db, list(places))
+        missing = [place for key, place in places.items() if key not in ids]
+        if missing:
+            ids.update(await LocationService._insert_locations(db, missing))
+        return ids
+
+    @staticmethod
+    async def _get_location_ids(db: AsyncSession, keys: List[str]) -> Dict[str, int]:
+        result = await db.execute(
+            select(Location.key, Location.id).where(Location.key.in_(keys))
+        )
+        return dict(result.all())
+
+    @staticmethod
+    async def _insert_locations(db: AsyncSession, places: List[Place]) -> Dict[str, int]:
+        """Insert the places, tolerating ones that already exist, and return all ids."""
+        rows = [_place_row(place) for place in places]
+        ids: Dict[str, int] = {}
+        upsert_insert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+        if upsert_insert is not None:
+            result = await db.execute(
+                upsert_insert(Location).values(rows)
+                .on_conflict_do_nothing(index_elements=[Location.key])
+                .returning(Location.key, Location.id)
+            )
+            ids.update(result.all())
+        else:
+            for row in rows:
+                try:
+                    async with db.begin_nested():
+                        await db.execute(insert(Location).values(row))
+                except IntegrityError:
+                    continue
+
+        # Locations a concurrent request inserted first are not returned by the insert itself
+        raced = [place.key for place in places if place.key not in ids]
+        if raced:
+            ids.update(await LocationService._get_location_ids(db, raced))
+        return ids
+
+    @staticmethod
+    def place_condition(term: Place) -> ColumnElement:
+        """Locations that are, or lie within, the searched place; see Place.matches."""
+        conditions = [Location.key == term.key]
+        if term.country is None:
+            conditions += [
+                Location.city == term.city,
+                Location.region == term.city,
+                Location.country == term.city,
+            ]
+        elif term.region is None:
+            conditions.append(and_(
+                Location.country == term.country,
+                or_(Location.city == term.city, Location.region == term.city),
+            ))
+        return or_(*conditions)
+
+    @staticmethod
+    def job_condition(location: str, match: LocationMatch) -> ColumnElement:
+        """Match jobs by place through the location index, or by raw text when asked to."""
+        if match == LocationMatch.CONTAINS:
+            return Job.location.ilike(f"%{location}%")
+        term = parse_location(location)
+        if term is None:
+            # Only separators and whitespace: no place to restrict to
+            return true()
+        return Job.location_id.in_(
+            select(Location.id).where(LocationService.place_condition(term))
+        )
@@ -0,0 +1,136 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, func
+from fastapi import HTTPException, status
+
+from app.config import settings
+from app.models import SavedSearch, SearchAlert, User
+from app.schemas import SavedSearchCreate
+from app.search import saved_search_percolator
+from app.search.percolator import JobFields
+from app.tasks import enqueue
+from .tag_service import normalize_tag_names
+
+# Task recording the alerts of jobs matched by saved searches; see app.tasks.handlers
+ALERT_TASK = "saved_searches.alert"
+
+
+class SavedSearchService:
+    @staticmethod
+    async def create_saved_search(
+        db: AsyncSession,
+        user: User,
+        search_data: SavedSearchCreate
+    ) -> SavedSearch:
+        """Save a job filter for a user, up to the per-user limit."""
+        saved = await db.scalar(
+            select(func.count(SavedSearch.id)).where(SavedSearch.user_id == user.id)
+        )
+        if saved >= settings.saved_searches_per_user_max:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"At most {settings.saved_searches_per_user_max} saved searches per user"
+            )
+
+        location = (search_data.location or "").strip() or None
+        search = SavedSearch(
+            user_id=user.id,
+            name=search_data.name,
+            tags=normalize_tag_names(search_data.tags),
+            tag_mode=search_data.tag_mode.value,
+            location=location,
+            location_match=search_data.location_match.value,
+            job_type=search_data.job_type,
+            job_level=search_data.job_level,
+            salary_min=search_data.salary_min,
+            salary_max=search_data.salary_max
+        )
+
+        db.add(search)
+        await db.commit()
+        await db.refresh(search)
+        saved_search_percolator.upsert_search(search)
+        return search
+
+    @staticmethod
+    async def get_user_saved_searches(db: AsyncSession, user: User) -> List[SavedSearch]:
+        """Get a user's saved searches, oldest first."""
+        result = await db.execute(
+            select(SavedSearch).where(SavedSearch.user_id == user.id).order_by(SavedSearch.id)
+        )
+        return list(result.scalars())
+
+    @staticmethod
+    async def get_saved_search(db: AsyncSession, search_id: int, user: User) -> SavedSearch:
+        """Get one of a user's saved searches."""
+        search = await db.get(SavedSearch, search_id)
+        if search is None or search.user_id != user.id:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Saved search not found"
+            )
+        return search
+
+    @staticmethod
+    async def delete_saved_search(db: AsyncSession, search: SavedSearch) -> None:
+        """Delete a saved search along with its alerts."""
+        search_id = search.id
+        await db.execute(
+            delete(SearchAlert).where(SearchAlert.saved_search_id == search_id)
+        )
+        await db.delete(search)
+        await db.commit()
+        saved_search_percolator.remove_search(search_id)
+
+    @staticmethod
+    async def get_user_alerts(
+        db: AsyncSession,
+        user: User,
+        saved_search_id: Optional[int] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[SearchAlert]:
+        """Get the jobs matched by a user's saved searches, newest alert first."""
+        query = (
+            select(SearchAlert)
+            .join(SavedSearch, SavedSearch.id == SearchAlert.saved_search_id)
+            .where(SavedSearch.user_id == user.id)
+        )
+        if saved_search_id is not None:
+            query = query.where(SearchAlert.saved_search_id == saved_search_id)
+        result = await db.execute(
+            query.order_by(SearchAlert.id.desc()).offset(skip).limit(limit)
+        )
+        return list(result.scalars())
+
+    @staticmethod
+    def queue_alerts(
+        db: AsyncSession,
+        changes: Iterable[Tuple[int, Optional[JobFields], Optional[JobFields]]]
+    ) -> None:
+        """Queue alerts for the saved searches that job writes newly match.
+
+        `changes` holds each written job's id with its fields before and after the
+        write. Matching happens here, against the percolator; jobs written before it
+        has loaded are matched by the alert task instead. With the percolator disabled
+        no alerts are sent. Nothing is committed: the task is queued as part of the
+        caller's transaction, so it exists exactly when the job writes do.
+        """
+        if not saved_search_percolator.active:
+            return
+
+        matches: List[Tuple[int, List[int]]] = []
+        unmatched: List[int] = []
+        for job_id, before, after in changes:
+            new_matches = saved_search_percolator.new_matches(before, after)
+            if new_matches is None:
+                unmatched.append(job_id)
+            elif new_matches:
+                matches.append((job_id, sorted(new_matches)))
+        if not matches and not unmatched:
+            return
+
+        payload: Dict[str, Any] = {"matches": matches}
+        if unmatched:
+            payload["job_ids"] = unmatched
+        enqueue(db, ALERT_TASK, payload)
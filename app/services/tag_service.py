@@ -1,9 +1,57 @@
-from typing import List, Optional
+from collections import OrderedDict
+from typing import Dict, List, Mapping, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import make_transient_to_detached
 
-from app.models import Tag
-from app.schemas import TagCreate
+from app.cache import TAG_LISTS, invalidate_after_commit
+from app.config import settings
+from app.models import Job, Tag
+from app.schemas import TagCreate, TagMode
+from app.search import Bitmap, tag_index
+
+
+# INSERT ... ON CONFLICT DO NOTHING constructs for the dialects the app runs on
+_UPSERT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+class TagIdCache:
+    """Bounded, least-recently-used map of tag name to tag id.
+
+    Only ids of committed tags are added, and tags are never deleted, so a cached
+    id can always be associated with a job without looking the tag up first.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._ids: OrderedDict[str, int] = OrderedDict()
+
+    def get(self, name: str) -> Optional[int]:
+        tag_id = self._ids.get(name)
+        if tag_id is not None:
+            self._ids.move_to_end(name)
+        return tag_id
+
+    def update(self, tag_ids: Mapping[str, int]) -> None:
+        for name, tag_id in tag_ids.items():
+            self._ids[name] = tag_id
+            self._ids.move_to_end(name)
+        while len(self._ids) > self.max_size:
+            self._ids.popitem(last=False)
+
+    def clear(self) -> None:
+        self._ids.clear()
+
+
+tag_id_cache = TagIdCache(settings.tag_id_cache_size)
+
+
+def normalize_tag_names(tag_names: List[str]) -> List[str]:
+    """Lowercase and strip names, dropping blanks and duplicates but keeping order."""
+    names = (tag_name.strip().lower() for tag_name in tag_names)
+    return list(dict.fromkeys(name for name in names if name))
 
 
 class TagService:
@@ -20,6 +68,7 @@ class TagService:
             # Create new tag
             tag = Tag(name=tag_name.lower())
             db.add(tag)
+            invalidate_after_commit(db, TAG_LISTS)
             await db.commit()
             await db.refresh(tag)
         
@@ -27,14 +76,80 @@ class TagService:
     
     @staticmethod
     async def get_or_create_tags(db: AsyncSession, tag_names: List[str]) -> List[Tag]:
-        """Get or create multiple tags."""
+        """Get or create multiple tags.
+
+        Names are resolved in one query, skipping names in the tag id cache, and the
+        missing ones are inserted in one statement that ignores names a concurrent
+        request inserted first. Nothing is committed; new tags are part of the
+        caller's transaction.
+        """
+        names = normalize_tag_names(tag_names)
+        ids = await TagService.get_or_create_tag_ids(db, names)
+
         tags = []
-        for tag_name in tag_names:
-            if tag_name.strip():  # Skip empty strings
-                tag = await TagService.get_or_create_tag(db, tag_name.strip())
-                tags.append(tag)
+        for name in names:
+            tag = Tag(id=ids[name], name=name)
+            make_transient_to_detached(tag)
+            tags.append(await db.merge(tag, load=False))
         return tags
+
+    @staticmethod
+    async def get_or_create_tag_ids(db: AsyncSession, tag_names: List[str]) -> Dict[str, int]:
+        """Get or create tags by normalized name, returning their ids by name."""
+        names = list(dict.fromkeys(tag_names))
+        ids: Dict[str, int] = {}
+        for name in names:
+            tag_id = tag_id_cache.get(name)
+            if tag_id is not None:
+                ids[name] = tag_id
+
+        missing = [name for name in names if name not in ids]
+        if missing:
+            ids.update(await TagService._get_tag_ids(db, missing))
+
+        missing = [name for name in names if name not in ids]
+        if missing:
+            ids.update(await TagService._insert_tags(db, missing))
+
+        return ids
     
+    @staticmethod
+    async def _get_tag_ids(db: AsyncSession, tag_names: List[str]) -> Dict[str, int]:
+        """Get ids of the existing tags among the given names."""
+        result = await db.execute(select(Tag.name, Tag.id).where(Tag.name.in_(tag_names)))
+        return dict(result.all())
+
+    @staticmethod
+    async def _insert_tags(db: AsyncSession, tag_names: List[str]) -> Dict[str, int]:
+        """Insert the named tags, tolerating ones that already exist, and return all ids."""
+        rows = [{"name": name} for name in tag_names]
+        ids: Dict[str, int] = {}
+        upsert_insert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+        if upsert_insert is not None:
+            result = await db.execute(
+                upsert_insert(Tag).values(rows)
+                .on_conflict_do_nothing(index_elements=[Tag.name])
+                .returning(Tag.name, Tag.id)
+            )
+            ids.update(result.all())
+            if ids:
+                invalidate_after_commit(db, TAG_LISTS)
+        else:
+            # No upsert construct for this dialect: one savepoint per tag instead
+            for row in rows:
+                try:
+                    async with db.begin_nested():
+                        await db.execute(insert(Tag).values(row))
+                except IntegrityError:
+                    continue
+                invalidate_after_commit(db, TAG_LISTS)
+
+        # Tags a concurrent request inserted first are not returned by the insert itself
+        raced = [name for name in tag_names if name not in ids]
+        if raced:
+            ids.update(await TagService._get_tag_ids(db, raced))
+        return ids
+
     @staticmethod
     async def get_all_tags(db: AsyncSession) -> List[Tag]:
         """Get all tags."""
@@ -47,4 +162,30 @@ class TagService:
         result = await db.execute(
             select(Tag).where(Tag.name == tag_name.lower())
         )
-        return result.scalar_one_or_none() 
\ No newline at end of file
+        return result.scalar_one_or_none()
+
+    @staticmethod
+    def match_job_ids(tag_names: List[str], mode: TagMode) -> Optional[Bitmap]:
+        """Get ids of jobs carrying any/all of the tags, or None while the index is cold."""
+        return tag_index.match(tag_names, mode)
+
+    @staticmethod
+    def index_job_tags(job: Job) -> None:
+        """Record a committed job's current tags in the tag index and tag id cache."""
+        TagService.cache_tag_ids({tag.name: tag.id for tag in job.tags})
+        TagService.index_job_tag_names(job.id, [tag.name for tag in job.tags])
+
+    @staticmethod
+    def index_job_tag_names(job_id: int, tag_names: List[str]) -> None:
+        """Record a committed job's current tags, given by name, in the tag index."""
+        tag_index.index_job(job_id, tag_names)
+
+    @staticmethod
+    def cache_tag_ids(tag_ids: Mapping[str, int]) -> None:
+        """Remember ids of committed tags so later lookups can skip the database."""
+        tag_id_cache.update(tag_ids)
+
+    @staticmethod
+    def unindex_job_tags(job_id: int) -> None:
+        """Drop a deleted job from the tag index."""
+        tag_index.remove_job(job_id)
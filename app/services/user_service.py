@@ -5,7 +5,8 @@ from fastapi import HTTPException, status
 
 from app.models import User
 from app.schemas import UserCreate, UserUpdate
-from app.auth.security import get_password_hash, verify_password
+from app.auth.cache import principal_cache
+from app.auth.hashing import password_hasher
 
 
 class UserService:
@@ -23,7 +24,7 @@ class UserService:
             )
         
         # Create user
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await password_hasher.hash(user_data.password)
         user = User(
             email=user_data.email,
             full_name=user_data.full_name,
@@ -43,7 +44,7 @@ class UserService:
         )
         user = result.scalar_one_or_none()
         
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not await password_hasher.verify(password, user.hashed_password):
             return None
         
         return user
@@ -78,4 +79,5 @@ class UserService:
         
         await db.commit()
         await db.refresh(user)
-        return user 
\ No newline at end of file
+        principal_cache.invalidate("user", user.email)
+        return user
@@ -0,0 +1,9 @@
+from .registry import TaskType, task, task_types
+from .queue import enqueue
+from .worker import TaskWorker, run_worker, task_worker
+# Imported for its side effect of registering the app's task types
+from . import handlers
+
+__all__ = [
+    "TaskType", "task", "task_types", "enqueue", "TaskWorker", "run_worker", "task_worker",
+]
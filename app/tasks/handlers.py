@@ -0,0 +1,63 @@
+from typing import Any, Dict, List, Set, Tuple
+
+from sqlalchemy import insert, literal, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models import Job, SavedSearch, SearchAlert
+from app.search.percolator import job_fields, match_saved_searches
+from .registry import task
+
+# Tables whose statistics steer the job listing plans; see alembic/versions/0002 to 0004
+JOB_QUERY_TABLES = ("jobs", "job_tags", "locations")
+
+# Saved search ids bound per alert INSERT, well under the drivers' parameter limits
+ALERT_BATCH_SIZE = 5000
+
+
+@task("jobs.analyze")
+async def analyze_job_tables(db: AsyncSession, payload: Dict[str, Any]) -> None:
+    """Refresh planner statistics after a bulk upload changed the jobs tables a lot."""
+    for table in JOB_QUERY_TABLES:
+        await db.execute(text(f"ANALYZE {table}"))
+    await db.commit()
+
+
+@task("saved_searches.alert", concurrency=2)
+async def record_search_alerts(db: AsyncSession, payload: Dict[str, Any]) -> None:
+    """Record the saved searches jobs matched as alerts, at most once per search and job.
+
+    The payload holds `matches`, pairs of a job id and the ids of the searches it
+    matched, and `job_ids` of jobs written before the percolator had loaded, which are
+    matched here. Searches and jobs deleted in the meantime are skipped.
+    """
+    matches: List[Tuple[int, Set[int]]] = [
+        (job_id, set(search_ids)) for job_id, search_ids in payload.get("matches", [])
+    ]
+    if payload.get("job_ids"):
+        result = await db.execute(
+            select(Job).options(selectinload(Job.tags)).where(Job.id.in_(payload["job_ids"]))
+        )
+        jobs = [(job.id, job_fields(job)) for job in result.scalars()]
+        jobs = [(job_id, fields) for job_id, fields in jobs if fields is not None]
+        matched = await match_saved_searches(db, (fields for _, fields in jobs))
+        matches.extend((job_id, search_ids) for (job_id, _), search_ids in zip(jobs, matched))
+
+    for job_id, search_ids in matches:
+        ordered = sorted(search_ids)
+        job_exists = select(Job.id).where(Job.id == job_id).exists()
+        for start in range(0, len(ordered), ALERT_BATCH_SIZE):
+            batch = ordered[start:start + ALERT_BATCH_SIZE]
+            alerted = (
+                select(SearchAlert.id)
+                .where(SearchAlert.saved_search_id == SavedSearch.id, SearchAlert.job_id == job_id)
+                .exists()
+            )
+            await db.execute(
+                insert(SearchAlert).from_select(
+                    ["saved_search_id", "job_id"],
+                    select(SavedSearch.id, literal(job_id))
+                    .where(SavedSearch.id.in_(batch), job_exists, ~alerted)
+                )
+            )
+    await db.commit()
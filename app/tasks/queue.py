@@ -0,0 +1,178 @@
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from sqlalchemy import and_, delete, event, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models import Task
+from app.models.task import TaskStatus
+from .registry import task_types
+
+_WAKE_KEY = "wake_task_workers"
+# Called after a transaction that queued tasks commits; set by the worker in this process
+wake_listeners: List[Callable[[], None]] = []
+
+
+def utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def enqueue(
+    db: AsyncSession,
+    name: str,
+    payload: Optional[Dict[str, Any]] = None,
+    delay_seconds: float = 0
+) -> Task:
+    """Queue a task as part of the caller's transaction.
+
+    Workers see the task once `db` commits, and the worker in this process is woken
+    then; a rolled back transaction queues nothing. The payload must be JSON-serializable.
+    """
+    task_type = task_types.get(name)
+    if task_type is None:
+        raise ValueError(f"Unknown task type {name!r}")
+    task = Task(
+        name=name,
+        payload=payload or {},
+        status=TaskStatus.PENDING,
+        attempts=0,
+        max_attempts=task_type.max_attempts,
+        run_at=utcnow() + timedelta(seconds=delay_seconds),
+    )
+    db.add(task)
+    db.info[_WAKE_KEY] = True
+    return task
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_after_commit(session: Session) -> None:
+    if session.info.pop(_WAKE_KEY, False):
+        for listener in wake_listeners:
+            listener()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back(session: Session) -> None:
+    session.info.pop(_WAKE_KEY, None)
+
+
+def retry_delay(attempts: int) -> float:
+    """Seconds to wait before retrying a task that has failed `attempts` times.
+
+    Delays double with every attempt up to the maximum, and are jittered so tasks that
+    failed together do not all retry together.
+    """
+    delay = min(
+        settings.task_retry_base_seconds * 2 ** (attempts - 1), settings.task_retry_max_seconds
+    )
+    return delay * random.uniform(0.5, 1.0)
+
+
+def _claimable(now: datetime):
+    """Due pending tasks, and running ones whose worker let the lease lapse."""
+    return or_(
+        and_(Task.status == TaskStatus.PENDING, Task.run_at <= now),
+        and_(Task.status == TaskStatus.RUNNING, Task.locked_until < now),
+    )
+
+
+async def claim_tasks(db: AsyncSession, limits: Mapping[str, int], worker_id: str) -> List[Task]:
+    """Lease up to limits[name] due tasks of each named type to a worker and commit.
+
+    On PostgreSQL candidates are locked with FOR UPDATE SKIP LOCKED, so concurrent
+    workers claim disjoint tasks without waiting on each other. SQLite has no row
+    locks, but runs each UPDATE under its database-wide write lock, so the same
+    statement cannot hand one task to two workers there either.
+    """
+    now = utcnow()
+    claimed: List[Task] = []
+    for name, limit in limits.items():
+        if limit <= 0:
+            continue
+        candidates = (
+            select(Task.id)
+            .where(Task.name == name, _claimable(now))
+            .order_by(Task.run_at, Task.id)
+            .limit(limit)
+        )
+        if db.get_bind().dialect.name == "postgresql":
+            candidates = candidates.with_for_update(skip_locked=True)
+        result = await db.execute(
+            update(Task)
+            .where(Task.id.in_(candidates.scalar_subquery()))
+            .values(
+                status=TaskStatus.RUNNING,
+                attempts=Task.attempts + 1,
+                locked_by=worker_id,
+                locked_until=now + timedelta(seconds=settings.task_lease_seconds),
+            )
+            .returning(Task)
+            .execution_options(synchronize_session=False)
+        )
+        claimed.extend(result.scalars())
+    await db.commit()
+    return claimed
+
+
+def _owned(task: Task, worker_id: str):
+    # A worker whose lease lapsed and was taken over must not overwrite the new attempt
+    return and_(
+        Task.id == task.id,
+        Task.status == TaskStatus.RUNNING,
+        Task.locked_by == worker_id,
+        Task.attempts == task.attempts,
+    )
+
+
+async def complete_task(db: AsyncSession, task: Task, worker_id: str) -> None:
+    await db.execute(
+        update(Task).where(_owned(task, worker_id))
+        .values(status=TaskStatus.DONE, locked_by=None, locked_until=None, last_error=None)
+    )
+    await db.commit()
+
+
+async def fail_task(db: AsyncSession, task: Task, worker_id: str, error: str) -> bool:
+    """Record a failed attempt; returns whether the task will be retried."""
+    retry = task.attempts < task.max_attempts
+    values: Dict[str, Any] = {"locked_by": None, "locked_until": None, "last_error": error}
+    if retry:
+        values.update(
+            status=TaskStatus.PENDING,
+            run_at=utcnow() + timedelta(seconds=retry_delay(task.attempts)),
+        )
+    else:
+        values.update(status=TaskStatus.FAILED)
+    await db.execute(update(Task).where(_owned(task, worker_id)).values(**values))
+    await db.commit()
+    return retry
+
+
+async def release_tasks(db: AsyncSession, worker_id: str) -> int:
+    """Return a stopping worker's unfinished tasks to the queue without using an attempt."""
+    result = await db.execute(
+        update(Task)
+        .where(Task.status == TaskStatus.RUNNING, Task.locked_by == worker_id)
+        .values(
+            status=TaskStatus.PENDING,
+            attempts=Task.attempts - 1,
+            run_at=utcnow(),
+            locked_by=None,
+            locked_until=None,
+        )
+    )
+    await db.commit()
+    return result.rowcount
+
+
+async def purge_done_tasks(db: AsyncSession) -> int:
+    """Delete completed tasks older than the retention period."""
+    cutoff = utcnow() - timedelta(seconds=settings.task_done_retention_seconds)
+    result = await db.execute(
+        delete(Task).where(Task.status == TaskStatus.DONE, Task.updated_at < cutoff)
+    )
+    await db.commit()
+    return result.rowcount
@@ -0,0 +1,40 @@
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+
+TaskFunction = Callable[[AsyncSession, Dict[str, Any]], Awaitable[None]]
+
+
+class TaskType:
+    """A named kind of task: the coroutine that runs it and how it may be run."""
+
+    def __init__(self, name: str, function: TaskFunction, concurrency: int, max_attempts: int):
+        self.name = name
+        self.function = function
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+
+
+task_types: Dict[str, TaskType] = {}
+
+
+def task(
+    name: str,
+    concurrency: int = 1,
+    max_attempts: Optional[int] = None
+) -> Callable[[TaskFunction], TaskFunction]:
+    """Register a coroutine `function(db, payload)` as the task type `name`.
+
+    At most `concurrency` tasks of the type run at once in each worker. The coroutine
+    gets its own session and must commit what it writes; raising retries the task.
+    """
+    def register(function: TaskFunction) -> TaskFunction:
+        if name in task_types:
+            raise ValueError(f"Task type {name!r} is already registered")
+        task_types[name] = TaskType(
+            name, function, concurrency, max_attempts or settings.task_max_attempts
+        )
+        return function
+    return register
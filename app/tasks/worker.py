@@ -0,0 +1,191 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+import traceback
+from collections import Counter
+from typing import Callable, Dict, Optional, Set
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models import Task
+from .queue import (
+    claim_tasks, complete_task, fail_task, purge_done_tasks, release_tasks, wake_listeners
+)
+from .registry import task_types
+
+logger = logging.getLogger(__name__)
+
+# How often a worker deletes old completed tasks
+PURGE_INTERVAL_SECONDS = 600
+
+
+class TaskWorker:
+    """Pool of asyncio tasks running queued tasks, inside the API process or on its own.
+
+    The worker claims due tasks whenever it has free slots, overall and per task type,
+    and otherwise sleeps until a transaction in this process queues a task or the poll
+    interval passes, so tasks queued by other processes are picked up too.
+    """
+
+    def __init__(self, concurrency: Optional[int] = None):
+        self.concurrency = concurrency or settings.task_worker_concurrency
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{id(self):x}"
+        self.completed = 0
+        self.failed = 0
+        self._running: Counter = Counter()
+        self._in_flight: Set[asyncio.Task[None]] = set()
+        self._wake: Optional[asyncio.Event] = None
+        self._loop_task: Optional[asyncio.Task[None]] = None
+        self._stopping = False
+        self._purged_at = 0.0
+
+    def wake(self) -> None:
+        if self._wake is not None:
+            self._wake.set()
+
+    def _free_slots(self) -> Dict[str, int]:
+        capacity = self.concurrency - sum(self._running.values())
+        return {
+            name: min(task_type.concurrency - self._running[name], capacity)
+            for name, task_type in task_types.items()
+            if capacity > 0 and task_type.concurrency > self._running[name]
+        }
+
+    async def _run_task(
+        self,
+        session_maker: Callable[[], AsyncSession],
+        task: Task
+    ) -> None:
+        try:
+            try:
+                async with session_maker() as db:
+                    await asyncio.wait_for(
+                        task_types[task.name].function(db, task.payload),
+                        # Give up before the lease lapses and another worker starts over
+                        timeout=settings.task_lease_seconds * 0.9,
+                    )
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                error = traceback.format_exc(limit=20)
+                async with session_maker() as db:
+                    retry = await fail_task(db, task, self.worker_id, error)
+                self.failed += 1
+                logger.warning(
+                    "Task %s %d failed on attempt %d/%d%s", task.name, task.id, task.attempts,
+                    task.max_attempts, "; will retry" if retry else "", exc_info=True
+                )
+                return
+            async with session_maker() as db:
+                await complete_task(db, task, self.worker_id)
+            self.completed += 1
+        finally:
+            self._running[task.name] -= 1
+            self.wake()
+
+    def _spawn(self, session_maker: Callable[[], AsyncSession], task: Task) -> None:
+        self._running[task.name] += 1
+        running = asyncio.create_task(self._run_task(session_maker, task))
+        self._in_flight.add(running)
+        running.add_done_callback(self._in_flight.discard)
+
+    async def run_once(self, session_maker: Callable[[], AsyncSession]) -> int:
+        """Claim and start as many due tasks as there are free slots; returns how many."""
+        slots = self._free_slots()
+        if not slots:
+            return 0
+        async with session_maker() as db:
+            tasks = await claim_tasks(db, slots, self.worker_id)
+        for task in tasks:
+            self._spawn(session_maker, task)
+        return len(tasks)
+
+    async def _purge(self, session_maker: Callable[[], AsyncSession]) -> None:
+        if time.monotonic() - self._purged_at < PURGE_INTERVAL_SECONDS:
+            return
+        self._purged_at = time.monotonic()
+        async with session_maker() as db:
+            purged = await purge_done_tasks(db)
+        if purged:
+            logger.info("Deleted %d completed tasks", purged)
+
+    async def run(self, session_maker: Callable[[], AsyncSession]) -> None:
+        """Run tasks until stopped or cancelled."""
+        self._wake = asyncio.Event()
+        wake_listeners.append(self.wake)
+        try:
+            while not self._stopping:
+                self._wake.clear()
+                try:
+                    await self._purge(session_maker)
+                    claimed = await self.run_once(session_maker)
+                except Exception:
+                    logger.exception("Failed to claim tasks")
+                    claimed = 0
+                if claimed and self._free_slots():
+                    # There may be more due tasks than were claimed
+                    continue
+                try:
+                    await asyncio.wait_for(
+                        self._wake.wait(), timeout=settings.task_poll_interval_seconds
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            wake_listeners.remove(self.wake)
+            self._wake = None
+
+    async def drain(self, session_maker: Callable[[], AsyncSession]) -> None:
+        """Run tasks until none are due and none are running; for scripts and tests."""
+        while True:
+            claimed = await self.run_once(session_maker)
+            if self._in_flight:
+                await asyncio.wait(set(self._in_flight))
+            elif not claimed:
+                return
+
+    def start(self, session_maker: Callable[[], AsyncSession]) -> None:
+        """Run in the background of the current event loop."""
+        self._stopping = False
+        self._loop_task = asyncio.create_task(self.run(session_maker))
+
+    async def stop(
+        self,
+        session_maker: Callable[[], AsyncSession],
+        grace_seconds: float = 10
+    ) -> None:
+        """Stop claiming, give running tasks a grace period, then requeue the rest."""
+        if self._loop_task is not None:
+            # Let a claim in progress finish, so its tasks are started or released below
+            self._stopping = True
+            self.wake()
+            await self._loop_task
+            self._loop_task = None
+        if self._in_flight:
+            _, unfinished = await asyncio.wait(set(self._in_flight), timeout=grace_seconds)
+            for running in unfinished:
+                running.cancel()
+            if unfinished:
+                await asyncio.wait(unfinished)
+                async with session_maker() as db:
+                    released = await release_tasks(db, self.worker_id)
+                logger.info("Requeued %d unfinished tasks", released)
+
+
+task_worker = TaskWorker()
+
+
+async def run_worker(session_maker: Callable[[], AsyncSession]) -> None:
+    """Run a standalone worker until interrupted, as `python run.py worker` does."""
+    worker = TaskWorker()
+    logger.info(
+        "Task worker %s running %s", worker.worker_id, ", ".join(sorted(task_types)) or "nothing"
+    )
+    worker.start(session_maker)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await worker.stop(session_maker)
@@ -3,17 +3,6 @@ import { Link } from 'react-router-dom';
 import { Building2, MapPin, Globe, Mail } from 'lucide-react';
 import api from '../services/api';
 
-interface Job {
-  id: number;
-  title: string;
-  location: string;
-  job_type: string;
-  job_level: string;
-  is_active: boolean;
-  created_at: string;
-  updated_at: string;
-}
-
 interface Company {
   id: number;
   company_name: string;
@@ -21,7 +10,8 @@ interface Company {
   website: string;
   location: string;
   email: string;
-  jobs: Job[];
+  active_job_count: number;
+  latest_job_at: string | null;
 }
 
 const Companies: React.FC = () => {
@@ -45,10 +35,6 @@ const Companies: React.FC = () => {
     fetchCompanies();
   }, []);
 
-  const getActiveJobsCount = (jobs: Job[]) => {
-    return jobs ? jobs.filter(job => job.is_active).length : 0;
-  };
-
   if (loading) {
     return (
       <div className="flex justify-center items-center min-h-[60vh]">
@@ -96,7 +82,7 @@ const Companies: React.FC = () => {
                     {company.company_name}
                   </h3>
                   <p className="text-sm text-gray-500">
-                    {getActiveJobsCount(company.jobs)} open positions
+                    {company.active_job_count} open positions
                   </p>
                 </div>
               </div>
@@ -1,3 +1,5 @@
+import { SavedSearch, SavedSearchInput, SearchAlert, Suggestions } from '../types';
+
 const API_BASE_URL = (import.meta as any).env?.VITE_API_URL || 'http://localhost:8000';
 
 // Create a simple fetch wrapper with authentication
@@ -42,6 +44,10 @@ class ApiService {
         throw new Error(errorData?.detail || `HTTP error! status: ${response.status}`);
       }
 
+      if (response.status === 204) {
+        return undefined as T;
+      }
+
       return await response.json();
     } catch (error) {
       throw error instanceof Error ? error : new Error('Network error');
@@ -138,6 +144,33 @@ class ApiService {
     return this.request<{ id: number; name: string; created_at: string; updated_at: string }[]>('/tags/');
   }
 
+  // Typeahead suggestions for the search bar
+  async getSuggestions(q: string, limit = 5) {
+    const searchParams = new URLSearchParams({ q, limit: limit.toString() });
+    return this.request<Suggestions>(`/suggest?${searchParams.toString()}`);
+  }
+
+  // Saved searches and the jobs they matched (job seekers only)
+  async getSavedSearches() {
+    return this.request<SavedSearch[]>('/saved-searches');
+  }
+
+  async createSavedSearch(search: SavedSearchInput) {
+    return this.request<SavedSearch>('/saved-searches', {
+      method: 'POST',
+      body: JSON.stringify(search),
+    });
+  }
+
+  async deleteSavedSearch(id: number) {
+    return this.request<void>(`/saved-searches/${id}`, { method: 'DELETE' });
+  }
+
+  async getSearchAlerts(savedSearchId?: number) {
+    const query = savedSearchId === undefined ? '' : `?saved_search_id=${savedSearchId}`;
+    return this.request<SearchAlert[]>(`/saved-searches/alerts${query}`);
+  }
+
   // Health check
   async healthCheck() {
     return this.request<{ status: string }>('/health');
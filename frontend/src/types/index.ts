@@ -53,4 +53,40 @@ export interface Filter {
     min: number;
     max: number;
   };
-}
\ No newline at end of file
+}
+export interface Suggestion {
+  value: string;
+  count: number;
+}
+
+export interface Suggestions {
+  titles: Suggestion[];
+  tags: Suggestion[];
+  companies: (Suggestion & { id: number })[];
+  locations: Suggestion[];
+}
+
+export interface SavedSearchInput {
+  name: string;
+  tags?: string[];
+  tag_mode?: 'any' | 'all';
+  location?: string | null;
+  location_match?: 'place' | 'contains';
+  job_type?: string | null;
+  job_level?: string | null;
+  salary_min?: number | null;
+  salary_max?: number | null;
+}
+
+export interface SavedSearch extends Required<SavedSearchInput> {
+  id: number;
+  created_at: string;
+  updated_at: string;
+}
+
+export interface SearchAlert {
+  id: number;
+  saved_search_id: number;
+  job_id: number;
+  created_at: string;
+}
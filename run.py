@@ -1,15 +1,32 @@
 #!/usr/bin/env python3
 """
 Startup script for Async Job Board API
+
+    python run.py           # serve the API
+    python run.py worker    # run queued background tasks without serving the API
 """
+import asyncio
+import logging
+import sys
+
 import uvicorn
 from app.config import settings
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "app.main:app",
-        host="0.0.0.0",
-        port=8000,
-        reload=settings.debug,
-        reload_dirs=["app"] if settings.debug else None,
-    ) 
\ No newline at end of file
+    if sys.argv[1:] == ["worker"]:
+        from app.db import async_session_maker
+        from app.tasks import run_worker
+
+        logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+        try:
+            asyncio.run(run_worker(async_session_maker))
+        except KeyboardInterrupt:
+            pass
+    else:
+        uvicorn.run(
+            "app.main:app",
+            host="0.0.0.0",
+            port=8000,
+            reload=settings.debug,
+            reload_dirs=["app"] if settings.debug else None,
+        )
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of matching one new job against a million saved searches: the
+percolator's posting lookups versus checking every saved search in turn.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+
+# Add the parent directory to the path so we can import the app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.job import JobLevel, JobType
+from app.search.percolator import JobFields, _Postings, _Query
+from app.search.places import parse_location
+
+TAGS = [f"tag{i}" for i in range(300)]
+# Popularity of tags falls off like on a real board: a few are on most searches
+TAG_WEIGHTS = [1 / (rank + 1) for rank in range(len(TAGS))]
+LOCATIONS = [
+    "Kenya", "Nairobi, Kenya", "Mombasa, Kenya", "Uganda", "Kampala, Uganda", "Lagos, Nigeria",
+    "Nigeria", "Remote",
+]
+
+
+def random_search(rng: random.Random, search_id: int) -> _Query:
+    tag_count = rng.choice([0, 1, 1, 2, 2, 3])
+    return _Query(SimpleNamespace(
+        id=search_id,
+        tags=list(dict.fromkeys(rng.choices(TAGS, TAG_WEIGHTS, k=tag_count))),
+        tag_mode=rng.choice(["any", "all"]),
+        location=rng.choice([None, None, None, *LOCATIONS]),
+        location_match="place",
+        job_type=rng.choice([None, None, *JobType]),
+        job_level=rng.choice([None, None, *JobLevel]),
+        salary_min=rng.choice([None, None, None, None, 50000, 100000]),
+        salary_max=None,
+    ))
+
+
+def random_job(rng: random.Random) -> JobFields:
+    return JobFields(
+        frozenset(rng.choices(TAGS, TAG_WEIGHTS, k=rng.randint(1, 5))),
+        rng.choice(list(JobType)), rng.choice(list(JobLevel)), rng.choice(LOCATIONS),
+        rng.choice([None, 60000, 120000]), None,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--searches", type=int, default=1_000_000)
+    parser.add_argument("--jobs", type=int, default=1000)
+    args = parser.parse_args()
+    rng = random.Random(42)
+
+    queries = [random_search(rng, search_id) for search_id in range(args.searches)]
+    started = time.perf_counter()
+    postings = _Postings()
+    for query in queries:
+        postings.add(query)
+    print(f"{args.searches} saved searches filed in {time.perf_counter() - started:.1f} s")
+
+    timings, matches = [], []
+    for _ in range(args.jobs):
+        fields = random_job(rng)
+        started = time.perf_counter()
+        matched = postings.match(fields)
+        timings.append((time.perf_counter() - started) * 1000)
+        matches.append(len(matched))
+    timings.sort()
+    print(f"Posting lookups over {args.jobs} jobs, "
+          f"{statistics.mean(matches):.0f} matches per job on average")
+    print(f"  mean {statistics.mean(timings):.2f} ms, p50 {timings[len(timings) // 2]:.2f} ms, "
+          f"p99 {timings[len(timings) * 99 // 100]:.2f} ms, max {timings[-1]:.2f} ms")
+
+    fields = random_job(rng)
+    place = parse_location(fields.location)
+    started = time.perf_counter()
+    scanned = {query.id for query in queries if query.matches(fields, place)}
+    scan_ms = (time.perf_counter() - started) * 1000
+    assert scanned == postings.match(fields), "posting lookups and full scan differ"
+    print(f"Checking every saved search for one job: {scan_ms:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of response serialization for a page of jobs: FastAPI's default
+path for a returned value versus ModelResponse with each company validated once.
+"""
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from typing import List
+
+# Add the parent directory to the path so we can import the app
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.models import Company, Job, Tag
+from app.models.job import JobLevel, JobType
+from app.schemas import JobOut
+from app.serialization import ModelResponse, share_nested
+
+PAGE_SIZE = 100
+JOBS_PER_COMPANY = 20
+ROUNDS = 50
+
+
+def build_page() -> List[Job]:
+    """A page of detached jobs shaped like a GET /jobs/ result, companies and tags loaded."""
+    now = datetime.now(timezone.utc)
+    tags = [Tag(id=i, name=f"tag{i}", created_at=now, updated_at=now) for i in range(10)]
+    jobs = []
+    for i in range(PAGE_SIZE):
+        if i % JOBS_PER_COMPANY == 0:
+            company = Company(
+                id=i, email=f"company{i}@example.com", company_name=f"Company {i}",
+                description="We build things. " * 20, website="https://example.com",
+                location="Nairobi, Kenya", is_active=True, is_verified=True,
+                created_at=now, updated_at=now,
+            )
+        jobs.append(Job(
+            id=i, title=f"Engineer {i}", description="Build and run services. " * 40,
+            location="Nairobi, Kenya", job_type=JobType.HYBRID, job_level=JobLevel.SENIOR,
+            salary_min=100000, salary_max=150000, is_active=True, company_id=company.id,
+            created_at=now, updated_at=now, tags=tags[i % 7:i % 7 + 3], company=company,
+        ))
+    return jobs
+
+
+async def default_path(field, jobs: List[Job]) -> bytes:
+    content = await serialize_response(field=field, response_content=jobs, is_coroutine=True)
+    return JSONResponse(content).body
+
+
+def model_response_path(jobs: List[Job]) -> bytes:
+    return ModelResponse(List[JobOut], share_nested(jobs, JobOut, "company")).body
+
+
+async def main():
+    jobs = build_page()
+    field = create_response_field(name="Response_get_jobs", type_=List[JobOut])
+    old = await default_path(field, jobs)
+    new = model_response_path(jobs)
+    assert json.loads(old) == json.loads(new), "serializations differ"
+
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        await default_path(field, jobs)
+    old_ms = (time.perf_counter() - started) * 1000 / ROUNDS
+
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        model_response_path(jobs)
+    new_ms = (time.perf_counter() - started) * 1000 / ROUNDS
+
+    print(f"{PAGE_SIZE}-job page, {len(new)} bytes, mean of {ROUNDS} rounds")
+    print(f"  FastAPI response_model: {old_ms:.2f} ms")
+    print(f"  ModelResponse:          {new_ms:.2f} ms ({old_ms / new_ms:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,386 @@
+#!/usr/bin/env python3
+"""
+End-to-end load benchmark: generate a job board dataset at one or more scales, drive
+the ASGI app in-process with concurrent clients over a traffic mix, and write
+throughput and per-endpoint latency percentiles to a JSON file.
+
+    python scripts/load_benchmark.py --scales 10000,100000 --mix mixed --duration 30
+    python scripts/load_benchmark.py --scales 1000000 \\
+        --database-url "postgresql+asyncpg://localhost/jobs_bench_{scale}"
+    python scripts/load_benchmark.py --scales 10000 --baseline old.json
+
+Each scale runs in its own process, against its own database: `{scale}` in the
+database URL is replaced by the scale. A database is generated once, marked with its
+scale and seed, and reused after deleting the jobs posted by earlier runs. Pointing
+the benchmark at a database it did not generate is an error, and nothing is deleted.
+Results are written with sorted keys so that runs can be diffed between commits.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Add the parent directory to the path so we can import the app
+sys.path.append(ROOT)
+
+DEFAULT_DATABASE_URL = "sqlite+aiosqlite:///" + os.path.join(
+    ROOT, "benchmark-data", "jobs-{scale}.db"
+)
+
+# Table recording the scale and seed a database was generated with; only databases
+# holding it are reused
+DATASET_MARKER = "benchmark_dataset"
+
+# Traffic mixes: scenario name -> weight
+MIXES = {
+    "browse": {"browse": 50, "browse_next_page": 10, "facets": 10, "job_detail": 30},
+    "mixed": {
+        "browse": 35, "browse_next_page": 5, "facets": 5, "job_detail": 25,
+        "company_dashboard": 15, "login": 5, "post_job": 10,
+    },
+    "write": {"post_job": 50, "login": 10, "job_detail": 20, "company_dashboard": 20},
+    # Public listings while bcrypt logins saturate the password hashing executor
+    "login_storm": {"browse": 40, "login": 60},
+}
+
+
+# Dataset generation
+
+async def generate_dataset(engine: Any, scale: int, seed: int) -> Dict[str, Any]:
+    """Seed an empty database with `scale` jobs, or reuse one seeded earlier."""
+    from sqlalchemy import delete, func, inspect, select, text
+    from app.db.seed import seed_database
+    from app.models import Job, job_tags_table
+
+    async with engine.begin() as conn:
+        tables = await conn.run_sync(lambda sync: inspect(sync).get_table_names())
+        if "jobs" in tables:
+            # Check that the benchmark generated this dataset before deleting anything
+            if DATASET_MARKER not in tables:
+                raise SystemExit(
+                    f"{engine.url} holds data the benchmark did not generate; "
+                    "use an empty database per scale"
+                )
+            marker = (await conn.execute(text(f"SELECT scale, seed FROM {DATASET_MARKER}"))).one()
+            if tuple(marker) != (scale, seed):
+                raise SystemExit(
+                    f"{engine.url} was generated with scale {marker[0]} and seed {marker[1]}; "
+                    "use an empty database per scale"
+                )
+            # Jobs posted by an earlier run come after the seeded ones; drop them
+            posted = select(Job.id).where(Job.id > scale)
+            await conn.execute(delete(job_tags_table).where(job_tags_table.c.job_id.in_(posted)))
+            await conn.execute(delete(Job).where(Job.id > scale))
+            existing = (await conn.execute(select(func.count(Job.id)))).scalar_one()
+            if existing == scale:
+                return await dataset_summary(conn)
+            raise SystemExit(
+                f"{engine.url} holds {existing} of its {scale} seeded jobs; "
+                "use an empty database per scale"
+            )
+
+    started = time.perf_counter()
+    counts = await seed_database(engine, scale, seed=seed)
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            f"CREATE TABLE {DATASET_MARKER} (scale INTEGER NOT NULL, seed INTEGER NOT NULL)"
+        ))
+        await conn.execute(
+            text(f"INSERT INTO {DATASET_MARKER} (scale, seed) VALUES (:scale, :seed)"),
+            {"scale": scale, "seed": seed},
+        )
+    print(f"Seeded {scale} jobs in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return counts
+
+
+async def dataset_summary(conn: Any) -> Dict[str, Any]:
+    from sqlalchemy import func, select
+    from app.models import Company, Job, Tag, User
+
+    counts = {}
+    for name, model in (("jobs", Job), ("companies", Company), ("tags", Tag), ("users", User)):
+        counts[name] = (await conn.execute(select(func.count(model.id)))).scalar_one()
+    return counts
+
+
+# Traffic
+
+class Client:
+    """One simulated client with its own RNG."""
+
+    def __init__(self, http: Any, rng: random.Random, dataset: Dict[str, Any]):
+        self.http = http
+        self.rng = rng
+        self.dataset = dataset
+
+    def company(self) -> Tuple[int, Dict[str, str]]:
+        from app.auth.security import create_access_token
+        from app.db.seed import company_email
+
+        company_id = self.rng.randrange(self.dataset["companies"]) + 1
+        token = create_access_token({
+            "sub": company_email(company_id), "user_type": "company", "id": company_id,
+        })
+        return company_id, {"Authorization": f"Bearer {token}"}
+
+    def filters(self) -> Dict[str, Any]:
+        from app.db.seed import LOCATIONS, ROLES
+
+        params: Dict[str, Any] = {"limit": 20}
+        if self.rng.random() < 0.5:
+            # Searches name a role's leading skills, like the postings do
+            _, _, skills = self.rng.choice(ROLES)
+            params["tags"] = ",".join(skills[:self.rng.randint(1, 2)])
+        if self.rng.random() < 0.3:
+            params["location"] = self.rng.choice(LOCATIONS)[0].split(",")[0]
+        if self.rng.random() < 0.3:
+            params["job_type"] = self.rng.choice(["remote", "hybrid", "onsite"])
+        if self.rng.random() < 0.2:
+            params["job_level"] = self.rng.choice(["entry", "mid", "senior", "lead"])
+        return params
+
+    async def browse(self) -> Any:
+        return await self.http.get("/jobs/", params={**self.filters(), "view": "summary"})
+
+    async def browse_next_page(self) -> Any:
+        params = {**self.filters(), "view": "summary", "cursor": ""}
+        first = await self.http.get("/jobs/", params=params)
+        cursor = first.json().get("next_cursor") if first.status_code == 200 else None
+        if not cursor:
+            return first
+        return await self.http.get("/jobs/", params={**params, "cursor": cursor})
+
+    async def facets(self) -> Any:
+        return await self.http.get("/jobs/facets", params=self.filters())
+
+    async def job_detail(self) -> Any:
+        return await self.http.get(f"/jobs/{self.rng.randrange(self.dataset['jobs']) + 1}")
+
+    async def company_dashboard(self) -> Any:
+        _, headers = self.company()
+        return await self.http.get("/jobs/company/my-jobs", params={"limit": 20}, headers=headers)
+
+    async def login(self) -> Any:
+        from app.db.seed import SEED_PASSWORD, user_email
+
+        user_id = self.rng.randrange(self.dataset["users"]) + 1
+        return await self.http.post(
+            "/auth/user/login", data={"username": user_email(user_id), "password": SEED_PASSWORD}
+        )
+
+    async def post_job(self) -> Any:
+        from app.db.seed import LOCATIONS, TAG_NAMES
+
+        _, headers = self.company()
+        job = {
+            "title": "Benchmark Engineer", "description": "Posted during a benchmark run.",
+            "location": self.rng.choice(LOCATIONS)[0],
+            "tag_names": self.rng.sample(TAG_NAMES, 3),
+        }
+        return await self.http.post("/jobs/", json=job, headers=headers)
+
+
+def percentile(ordered: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+def summarize(latencies: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+    ordered = sorted(latencies)
+    if not ordered:
+        return {"requests": 0, "errors": errors}
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "throughput_rps": round(len(ordered) / elapsed, 2),
+        "mean_ms": round(1000 * sum(ordered) / len(ordered), 3),
+        "p50_ms": round(1000 * percentile(ordered, 0.50), 3),
+        "p95_ms": round(1000 * percentile(ordered, 0.95), 3),
+        "p99_ms": round(1000 * percentile(ordered, 0.99), 3),
+        "max_ms": round(1000 * ordered[-1], 3),
+    }
+
+
+async def drive(
+    dataset: Dict[str, Any],
+    mix: Dict[str, int],
+    concurrency: int,
+    duration: float,
+    warmup: float,
+    seed: int
+) -> Dict[str, Any]:
+    """Run `concurrency` clients against the app for `duration` seconds after a warmup."""
+    import httpx
+    from app.main import app
+
+    latencies: Dict[str, List[float]] = {name: [] for name in mix}
+    errors: Dict[str, int] = dict.fromkeys(mix, 0)
+    names, weights = list(mix), list(mix.values())
+    measuring_from = time.perf_counter() + warmup
+    deadline = measuring_from + duration
+
+    async def client_loop(worker: int) -> None:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+            client = Client(http, random.Random(seed * 1000 + worker), dataset)
+            while True:
+                name = client.rng.choices(names, weights)[0]
+                scenario: Callable[[], Any] = getattr(client, name)
+                started = time.perf_counter()
+                if started >= deadline:
+                    return
+                response = await scenario()
+                finished = time.perf_counter()
+                if started < measuring_from:
+                    continue
+                latencies[name].append(finished - started)
+                if response.status_code >= 400:
+                    errors[name] += 1
+
+    async with app.router.lifespan_context(app):
+        await asyncio.gather(*(client_loop(worker) for worker in range(concurrency)))
+
+    all_latencies = [value for values in latencies.values() for value in values]
+    return {
+        "endpoints": {
+            name: summarize(latencies[name], errors[name], duration) for name in names
+        },
+        "total": summarize(all_latencies, sum(errors.values()), duration),
+    }
+
+
+async def run_scale(args: argparse.Namespace) -> Dict[str, Any]:
+    from app.config import settings
+    from app.db import engine
+
+    dataset = await generate_dataset(engine, args.scale, args.seed)
+    results = await drive(
+        dataset, MIXES[args.mix], args.concurrency, args.duration, args.warmup, args.seed
+    )
+    return {
+        "dataset": dataset,
+        "settings": {
+            "read_model_enabled": settings.read_model_enabled,
+            "response_cache_enabled": settings.response_cache_enabled,
+            "tag_index_enabled": settings.tag_index_enabled,
+            "db_pool_size": settings.db_pool_size,
+        },
+        **results,
+    }
+
+
+# Orchestration
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+            text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_comparison(results: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    """Print throughput and p99 changes against a previous results file."""
+    for scale, current in results["scales"].items():
+        previous = baseline.get("scales", {}).get(scale)
+        if previous is None:
+            continue
+        print(f"scale {scale}")
+        for name, stats in {**current["endpoints"], "total": current["total"]}.items():
+            before = previous["endpoints"].get(name) if name != "total" else previous["total"]
+            if not before or not stats.get("requests") or not before.get("requests"):
+                continue
+            rps_change = 100 * (stats["throughput_rps"] / before["throughput_rps"] - 1)
+            p99_change = 100 * (stats["p99_ms"] / before["p99_ms"] - 1)
+            print(
+                f"  {name:<18} {stats['throughput_rps']:>9.1f} rps ({rps_change:+.1f}%)"
+                f"  p99 {stats['p99_ms']:>9.2f} ms ({p99_change:+.1f}%)"
+            )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--scales", default="10000",
+                        help="Comma-separated job counts, e.g. 10000,100000,1000000")
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL,
+                        help="Database per scale; {scale} is replaced by the job count")
+    parser.add_argument("--mix", choices=sorted(MIXES), default="mixed")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=30, help="Measured seconds per scale")
+    parser.add_argument("--warmup", type=float, default=5, help="Unmeasured seconds first")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--env", action="append", default=[], metavar="KEY=VALUE",
+                        help="Extra app settings, e.g. READ_MODEL_ENABLED=True")
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--baseline", help="Previous results file to compare against")
+    parser.add_argument("--scale", type=int, help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.scale is not None:
+        # Child process: settings are read from the environment on import
+        logging.basicConfig(format="%(message)s")
+        logging.getLogger("app.db.seed").setLevel(logging.INFO)
+        print(json.dumps(asyncio.run(run_scale(args))))
+        return
+
+    results: Dict[str, Any] = {
+        "meta": {
+            "commit": git_commit(),
+            "mix": args.mix,
+            "concurrency": args.concurrency,
+            "duration_seconds": args.duration,
+            "python": platform.python_version(),
+            "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        },
+        "scales": {},
+    }
+    for scale in (int(value) for value in args.scales.split(",")):
+        database_url = args.database_url.format(scale=scale)
+        if database_url.startswith("sqlite"):
+            os.makedirs(os.path.dirname(database_url.split("///", 1)[1]) or ".", exist_ok=True)
+        env = {
+            **os.environ,
+            "DATABASE_URL": database_url,
+            "SECRET_KEY": os.environ.get("SECRET_KEY", "benchmark-secret"),
+            "DEBUG": "False",
+        }
+        env.update(setting.split("=", 1) for setting in args.env)
+        command = [
+            sys.executable, os.path.abspath(__file__), "--scale", str(scale),
+            "--mix", args.mix, "--concurrency", str(args.concurrency),
+            "--duration", str(args.duration), "--warmup", str(args.warmup),
+            "--seed", str(args.seed),
+        ]
+        print(f"Running scale {scale} against {database_url}", file=sys.stderr)
+        completed = subprocess.run(command, env=env, stdout=subprocess.PIPE, text=True)
+        if completed.returncode != 0:
+            raise SystemExit(f"Scale {scale} failed with exit status {completed.returncode}")
+        results["scales"][str(scale)] = json.loads(completed.stdout.strip().splitlines()[-1])
+        results["scales"][str(scale)]["database"] = database_url.split(":", 1)[0]
+
+    with open(args.output, "w") as output:
+        json.dump(results, output, indent=2, sort_keys=True)
+        output.write("\n")
+    print(f"Wrote {args.output}", file=sys.stderr)
+
+    if args.baseline:
+        with open(args.baseline) as baseline:
+            print_comparison(results, json.load(baseline))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,17 @@
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
-from app.db.database import get_db
+from app.db import get_db, get_read_db
 from app.models import Base
+from app.auth import principal_cache
+from app.cache import response_cache
+from app.search import job_read_model, saved_search_percolator, suggest_index, tag_index
+from app.services.tag_service import tag_id_cache
 
 # Test database URL (SQLite in-memory for testing)
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
@@ -24,6 +29,25 @@ TestSessionLocal = async_sessionmaker(
 )
 
 
+class StatementCounter:
+    """Count SQL statements executed against the test engine."""
+
+    def __init__(self):
+        self.count = 0
+        self.statements = []
+
+    def __enter__(self):
+        event.listen(test_engine.sync_engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(test_engine.sync_engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, *args):
+        self.count += 1
+        self.statements.append(statement)
+
+
 async def get_test_db():
     """Override database dependency for testing."""
     async with TestSessionLocal() as session:
@@ -42,13 +66,36 @@ async def db_session():
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
+    job_read_model.reset()
+    tag_index.reset()
+    suggest_index.reset()
+    saved_search_percolator.reset()
+    tag_id_cache.clear()
+    response_cache.clear()
+    principal_cache.clear()
+
 
 @pytest_asyncio.fixture
 async def client(db_session):
     """Create test client with database override."""
     app.dependency_overrides[get_db] = get_test_db
+    app.dependency_overrides[get_read_db] = get_test_db
     
     async with AsyncClient(app=app, base_url="http://test") as ac:
         yield ac
     
-    app.dependency_overrides.clear() 
\ No newline at end of file
+    app.dependency_overrides.clear()
+
+@pytest_asyncio.fixture
+async def company_headers(client):
+    """Register a company and return bearer auth headers for it."""
+    await client.post("/companies/register", json={
+        "email": "hiring@company.com",
+        "company_name": "Hiring Company",
+        "password": "testpassword123"
+    })
+    response = await client.post("/auth/company/login", data={
+        "username": "hiring@company.com",
+        "password": "testpassword123"
+    })
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
@@ -0,0 +1,135 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+from httpx import AsyncClient
+
+from app.auth import password_hasher, principal_cache
+from app.config import settings
+from tests.conftest import StatementCounter
+
+
+async def count_statements(client: AsyncClient, path: str, headers: dict) -> int:
+    with StatementCounter() as counter:
+        response = await client.get(path, headers=headers)
+    assert response.status_code == 200
+    return counter.count
+
+
+@pytest.mark.asyncio
+async def test_principal_is_cached(client: AsyncClient, company_headers: dict):
+    """Test that only the first authenticated request loads the company."""
+    first = await count_statements(client, "/jobs/company/my-jobs", company_headers)
+    second = await count_statements(client, "/jobs/company/my-jobs", company_headers)
+    assert second == first - 1
+
+
+@pytest.mark.asyncio
+async def test_update_invalidates_principal(client: AsyncClient, company_headers: dict):
+    """Test that a company sees its own update on the next request."""
+    await client.get("/companies/me", headers=company_headers)
+    response = await client.put(
+        "/companies/me", json={"company_name": "Renamed"}, headers=company_headers
+    )
+    assert response.status_code == 200
+
+    response = await client.get("/companies/me", headers=company_headers)
+    assert response.json()["company_name"] == "Renamed"
+
+
+@pytest.mark.asyncio
+async def test_trusted_token_claims(client: AsyncClient, company_headers: dict, monkeypatch):
+    """Test that read-only company routes can skip loading the company entirely."""
+    monkeypatch.setattr(settings, "auth_trust_token_claims", True)
+    response = await client.post(
+        "/jobs/", json={"title": "Engineer", "description": "Build things"},
+        headers=company_headers
+    )
+    job_id = response.json()["id"]
+
+    principal_cache.clear()
+    trusted = await count_statements(client, "/jobs/company/my-jobs", company_headers)
+    response = await client.get("/jobs/company/my-jobs", headers=company_headers)
+    assert [job["id"] for job in response.json()] == [job_id]
+
+    monkeypatch.setattr(settings, "auth_trust_token_claims", False)
+    principal_cache.clear()
+    loaded = await count_statements(client, "/jobs/company/my-jobs", company_headers)
+    assert trusted == loaded - 1
+
+    monkeypatch.setattr(settings, "auth_trust_token_claims", True)
+
+    await client.post("/users/register", json={
+        "email": "user@example.com",
+        "full_name": "Test User",
+        "password": "testpassword123"
+    })
+    response = await client.post("/auth/user/login", data={
+        "username": "user@example.com",
+        "password": "testpassword123"
+    })
+    user_headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    response = await client.get("/jobs/company/my-jobs", headers=user_headers)
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_cancelled_hashing_holds_its_slot_until_the_work_finishes(monkeypatch):
+    """Test that a cancelled caller's slot is freed by the executor, not by the caller."""
+    monkeypatch.setattr(password_hasher, "max_pending", 1)
+    release = threading.Event()
+    waiting = asyncio.create_task(password_hasher._run(release.wait))
+    await asyncio.sleep(0)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+
+    assert password_hasher.pending == 1
+    with pytest.raises(HTTPException) as exc_info:
+        await password_hasher.hash("testpassword123")
+    assert exc_info.value.status_code == 503
+
+    release.set()
+    for _ in range(100):
+        if password_hasher.pending == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert password_hasher.pending == 0
+    assert await password_hasher.verify(
+        "testpassword123", await password_hasher.hash("testpassword123")
+    )
+
+
+@pytest.mark.asyncio
+async def test_password_hashing_metrics(client: AsyncClient, monkeypatch):
+    """Test that hashing times are on /metrics, and the stats endpoint needs the admin token."""
+    await password_hasher.hash("testpassword123")
+
+    response = await client.get("/metrics")
+    for name in ("password_hash_wait_seconds_count", "password_hash_compute_seconds_count"):
+        count = next(line for line in response.text.splitlines() if line.startswith(name))
+        assert float(count.split()[1]) >= 1
+    assert "password_hash_pending 0.0" in response.text
+
+    assert (await client.get("/health/password-hashing")).status_code == 404
+    monkeypatch.setattr(settings, "admin_token", "admin-secret")
+    response = await client.get(
+        "/health/password-hashing", headers={"X-Admin-Token": "admin-secret"}
+    )
+    assert response.json()["completed"] >= 1
+
+
+@pytest.mark.asyncio
+async def test_password_hashing_fails_fast_when_saturated(monkeypatch):
+    """Test that calls beyond the pending limit are rejected instead of queued."""
+    monkeypatch.setattr(password_hasher, "max_pending", 2)
+    rejected = password_hasher.rejected
+
+    results = await asyncio.gather(
+        *[password_hasher.hash("testpassword123") for _ in range(4)], return_exceptions=True
+    )
+
+    errors = [result for result in results if isinstance(result, HTTPException)]
+    assert len(errors) == 2 and errors[0].status_code == 503
+    assert password_hasher.rejected == rejected + 2
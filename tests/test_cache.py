@@ -0,0 +1,135 @@
+import pytest
+from httpx import AsyncClient
+
+from app.cache import ResponseCache, response_cache
+from app.config import settings
+from tests.conftest import StatementCounter
+
+
+async def register_company(client: AsyncClient, email: str, name: str) -> dict:
+    await client.post("/companies/register", json={
+        "email": email,
+        "company_name": name,
+        "password": "testpassword123"
+    })
+    response = await client.post("/auth/company/login", data={
+        "username": email,
+        "password": "testpassword123"
+    })
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.mark.asyncio
+async def test_public_reads_are_cached(client: AsyncClient, company_headers: dict, monkeypatch):
+    """Test that repeated public reads are served without touching the database."""
+    response = await client.post(
+        "/jobs/", json={"title": "Engineer", "description": "Build things", "tag_names": ["go"]},
+        headers=company_headers
+    )
+    job_id = response.json()["id"]
+    paths = ["/jobs/", "/jobs/?tags=GO,", f"/jobs/{job_id}", "/companies/", "/tags/"]
+    first = [await client.get(path) for path in paths]
+
+    hits = response_cache.hits
+    with StatementCounter() as counter:
+        second = [await client.get(path) for path in paths]
+
+    assert counter.count == 0
+    assert response_cache.hits == hits + len(paths)
+    assert [response.json() for response in second] == [response.json() for response in first]
+    assert all(response.headers["etag"] for response in second)
+
+    assert (await client.get("/health/cache")).status_code == 404
+    monkeypatch.setattr(settings, "admin_token", "admin-secret")
+    stats = (await client.get("/health/cache", headers={"X-Admin-Token": "admin-secret"})).json()
+    assert stats["hits"] >= len(paths) and stats["misses"] >= len(paths)
+
+
+@pytest.mark.asyncio
+async def test_if_none_match_returns_304(client: AsyncClient):
+    """Test conditional requests against the ETag."""
+    response = await client.get("/companies/")
+    etag = response.headers["etag"]
+
+    response = await client.get("/companies/", headers={"If-None-Match": f'"other", {etag}'})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    response = await client.get("/companies/", headers={"If-None-Match": '"other"'})
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_precisely(client: AsyncClient, company_headers: dict):
+    """Test that a write drops the responses built from the changed data, and only those."""
+    other_headers = await register_company(client, "other@company.com", "Other Company")
+    job = {"title": "Engineer", "description": "Build things"}
+    own = (await client.post("/jobs/", json=job, headers=company_headers)).json()
+    other = (await client.post("/jobs/", json=job, headers=other_headers)).json()
+
+    for path in [f"/jobs/{own['id']}", f"/jobs/{other['id']}", "/jobs/", "/tags/"]:
+        await client.get(path)
+
+    await client.put(
+        f"/jobs/{own['id']}", json={"title": "Senior Engineer", "tag_names": ["rust"]},
+        headers=company_headers
+    )
+
+    with StatementCounter() as counter:
+        response = await client.get(f"/jobs/{other['id']}")
+    assert counter.count == 0
+    assert response.json()["title"] == "Engineer"
+
+    response = await client.get(f"/jobs/{own['id']}")
+    assert response.json()["title"] == "Senior Engineer"
+    response = await client.get("/jobs/")
+    assert {job["title"] for job in response.json()} == {"Engineer", "Senior Engineer"}
+    response = await client.get("/tags/")
+    assert [tag["name"] for tag in response.json()] == ["rust"]
+
+    await client.put("/companies/me", json={"company_name": "Renamed"}, headers=other_headers)
+    response = await client.get(f"/jobs/{other['id']}")
+    assert response.json()["company"]["company_name"] == "Renamed"
+
+
+def test_cache_bounds(monkeypatch):
+    """Test LRU eviction by entry count and size, and expiry after the TTL."""
+    cache = ResponseCache(max_entries=2, max_bytes=10, ttl_seconds=60)
+    cache.put("a", b"aaaa", {"x"}, cache.generation)
+    cache.put("b", b"bbbb", {"x"}, cache.generation)
+    assert cache.get("a") is not None
+    cache.put("c", b"cccc", {"y"}, cache.generation)
+    assert cache.get("b") is None and cache.get("a") is not None
+    cache.put("d", b"dddddddd", {"y"}, cache.generation)
+    assert cache.stats()["entries"] == 1 and cache.evictions == 3
+
+    cache.invalidate("y")
+    assert cache.get("d") is None and cache.invalidations == 1
+
+    # Responses computed while a write happened are not stored
+    generation = cache.generation
+    cache.invalidate("x")
+    cache.put("e", b"e", {"x"}, generation)
+    assert cache.get("e") is None
+
+    cache.put("f", b"f", set(), cache.generation)
+    monkeypatch.setattr("app.cache.response.time.monotonic", lambda: float("inf"))
+    assert cache.get("f") is None
+
+
+def test_cache_holds_off_settling_data(monkeypatch):
+    """Test that settling puts skip data invalidated within the last settle_seconds."""
+    now = [100.0]
+    monkeypatch.setattr("app.cache.response.time.monotonic", lambda: now[0])
+    cache = ResponseCache(max_entries=10, max_bytes=100, ttl_seconds=60, settle_seconds=5)
+    cache.invalidate("x")
+    cache.put("a", b"a", {"x"}, cache.generation, settling=True)
+    cache.put("b", b"b", {"x"}, cache.generation)
+    cache.put("c", b"c", {"y"}, cache.generation, settling=True)
+    assert cache.get("a") is None
+    assert cache.get("b") is not None and cache.get("c") is not None
+
+    now[0] += 5
+    cache.put("a", b"a", {"x"}, cache.generation, settling=True)
+    assert cache.get("a") is not None
@@ -0,0 +1,91 @@
+import pytest
+from httpx import AsyncClient
+
+from tests.conftest import StatementCounter
+
+
+async def register_company(client: AsyncClient, email: str, name: str) -> dict:
+    await client.post("/companies/register", json={
+        "email": email,
+        "company_name": name,
+        "password": "testpassword123"
+    })
+    response = await client.post("/auth/company/login", data={
+        "username": email,
+        "password": "testpassword123"
+    })
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.mark.asyncio
+async def test_company_directory(client: AsyncClient, company_headers: dict):
+    """Test that the directory lists companies with job aggregates and no job list."""
+    await register_company(client, "acme@company.com", "Acme Corp")
+    job = {"title": "Engineer", "description": "Build things"}
+    for _ in range(2):
+        await client.post("/jobs/", json=job, headers=company_headers)
+    response = await client.post("/jobs/", json=job, headers=company_headers)
+    await client.put(
+        f"/jobs/{response.json()['id']}", json={"is_active": False}, headers=company_headers
+    )
+
+    with StatementCounter() as counter:
+        response = await client.get("/companies/")
+    assert response.status_code == 200
+    assert counter.count == 2
+
+    acme, hiring = response.json()
+    assert acme["company_name"] == "Acme Corp"
+    assert acme["active_job_count"] == 0 and acme["latest_job_at"] is None
+    assert hiring["active_job_count"] == 2 and hiring["latest_job_at"]
+    assert "jobs" not in hiring and "hashed_password" not in hiring
+
+    response = await client.get("/companies/", params={"name": "ACME"})
+    assert [company["company_name"] for company in response.json()] == ["Acme Corp"]
+    response = await client.get("/companies/", params={"name": "%"})
+    assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_company_directory_cursor_pages(client: AsyncClient):
+    """Test that cursor pages cover every company exactly once, newest first."""
+    for i in range(5):
+        await register_company(client, f"company{i}@company.com", f"Company {i}")
+
+    seen, cursor = [], ""
+    while cursor is not None:
+        response = await client.get("/companies/", params={"limit": 2, "cursor": cursor})
+        page = response.json()
+        seen.extend(company["company_name"] for company in page["items"])
+        cursor = page["next_cursor"]
+
+    assert seen == [f"Company {i}" for i in reversed(range(5))]
+
+
+@pytest.mark.asyncio
+async def test_company_detail_pages_jobs(client: AsyncClient, company_headers: dict):
+    """Test that a company's jobs are listed on its detail page, one page at a time."""
+    ids = []
+    for i in range(3):
+        response = await client.post(
+            "/jobs/", json={"title": f"Job {i}", "description": "Build things"},
+            headers=company_headers
+        )
+        ids.append(response.json()["id"])
+    company_id = response.json()["company_id"]
+
+    response = await client.get(f"/companies/{company_id}", params={"jobs_limit": 2})
+    assert response.status_code == 200
+    company = response.json()
+    assert [job["id"] for job in company["jobs"]] == [ids[2], ids[1]]
+
+    response = await client.get(
+        f"/companies/{company_id}",
+        params={"jobs_limit": 2, "jobs_cursor": company["jobs_next_cursor"]}
+    )
+    company = response.json()
+    assert [job["id"] for job in company["jobs"]] == [ids[0]]
+    assert company["jobs_next_cursor"] is None
+
+    response = await client.get("/companies/9999")
+    assert response.status_code == 404
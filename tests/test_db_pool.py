@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import exc, text
+
+from app.config import settings
+from app.db import build_engine, pool_stats
+from app.db.pool import TimedAsyncQueuePool
+from app.metrics import start_request
+
+
+@pytest.fixture
+def small_pool_engine(tmp_path, monkeypatch):
+    """A file-backed SQLite engine whose queue pool holds a single connection."""
+    monkeypatch.setattr(settings, "db_pool_size", 1)
+    monkeypatch.setattr(settings, "db_max_overflow", 0)
+    monkeypatch.setattr(settings, "db_pool_timeout", 0.2)
+    monkeypatch.setattr(settings, "debug", False)
+    return build_engine(f"sqlite+aiosqlite:///{tmp_path / 'pool.db'}")
+
+
+@pytest.mark.asyncio
+async def test_pool_settings_and_live_counts(small_pool_engine):
+    """Test that pool settings apply and the counts reflect checked-out connections."""
+    assert isinstance(small_pool_engine.pool, TimedAsyncQueuePool)
+
+    async with small_pool_engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        stats = pool_stats(small_pool_engine.pool)
+        assert stats["size"] == 1 and stats["checked_out"] == 1 and stats["idle"] == 0
+
+        with pytest.raises(exc.TimeoutError):
+            async with small_pool_engine.connect() as other:
+                await other.execute(text("SELECT 1"))
+
+    stats = pool_stats(small_pool_engine.pool)
+    assert stats["checked_out"] == 0 and stats["idle"] == 1
+    assert stats["timeouts"] == 1 and stats["checkouts"] == 1
+    await small_pool_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pool_wait_is_measured_per_request(small_pool_engine):
+    """Test that time spent queueing for a connection is attributed to the waiting request."""
+    held = asyncio.Event()
+
+    async def holder():
+        async with small_pool_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+            held.set()
+            await asyncio.sleep(0.1)
+
+    async def waiter():
+        await held.wait()
+        request = start_request()
+        async with small_pool_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        return request.pool_wait
+
+    _, waited = await asyncio.gather(holder(), waiter())
+
+    assert waited >= 0.05
+    assert pool_stats(small_pool_engine.pool)["wait_ms_max"] >= 50
+    await small_pool_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pool_endpoint_and_server_timing(client: AsyncClient, monkeypatch):
+    """Test the pool status endpoint and the per-request timing header."""
+    assert (await client.get("/internal/db-pool")).status_code == 404
+    monkeypatch.setattr(settings, "admin_token", "admin-secret")
+    response = await client.get("/internal/db-pool", headers={"X-Admin-Token": "wrong"})
+    assert response.status_code == 403
+
+    response = await client.get("/internal/db-pool", headers={"X-Admin-Token": "admin-secret"})
+    assert response.status_code == 200
+    assert "pool" in response.json()
+
+    timing = response.headers["server-timing"]
+    assert timing.startswith("db-pool;dur=") and ", app;dur=" in timing
@@ -0,0 +1,92 @@
+import logging
+
+import pytest
+from httpx import AsyncClient
+
+from app.config import settings
+from app.db.diagnostics import capture_queries, statement_shape
+from app.main import app
+from app.middleware import QueryDebugMiddleware
+from app.services import JobService
+from tests.conftest import TestSessionLocal
+
+
+async def post_jobs(client: AsyncClient, headers: dict, count: int) -> list:
+    ids = []
+    for i in range(count):
+        job = {"title": f"Job {i}", "description": "Build things", "tag_names": [f"tag{i}"]}
+        response = await client.post("/jobs/", json=job, headers=headers)
+        ids.append(response.json()["id"])
+    return ids
+
+
+def test_statement_shape_ignores_in_list_length():
+    """Test that expanded IN lists of different lengths share one shape."""
+    assert statement_shape("SELECT * FROM jobs\n WHERE id IN (?, ?, ?)") == statement_shape(
+        "SELECT * FROM jobs WHERE id IN (?)"
+    ) == "SELECT * FROM jobs WHERE id IN (...)"
+    assert statement_shape("SELECT 1 WHERE id IN ($1, $2)") == "SELECT 1 WHERE id IN (...)"
+
+
+@pytest.mark.asyncio
+async def test_query_budget_flags_repeated_statements(client: AsyncClient, company_headers: dict):
+    """Test that a per-row query loop fails its budget with the stack that issued it."""
+    ids = await post_jobs(client, company_headers, 3)
+
+    async with TestSessionLocal() as db:
+        with capture_queries() as log:
+            for job_id in ids:
+                await JobService.get_job_by_id(db, job_id)
+
+    with pytest.raises(AssertionError) as failure:
+        log.assert_budget(max_statements=20, max_repeats=2)
+    assert "3x SELECT" in str(failure.value)
+    assert "job_service.py" in str(failure.value)
+
+
+@pytest.mark.asyncio
+async def test_endpoint_query_budgets(
+    client: AsyncClient, company_headers: dict, monkeypatch
+):
+    """Test that listing endpoints run a fixed number of statements, however many rows."""
+    ids = await post_jobs(client, company_headers, 10)
+    company_id = (await client.get(f"/jobs/{ids[0]}")).json()["company_id"]
+    # Skip the response cache so every request reaches the database
+    monkeypatch.setattr(settings, "response_cache_enabled", False)
+
+    budgets = {
+        "/jobs/": 4,
+        "/jobs/?view=summary": 2,
+        "/companies/": 2,
+        f"/companies/{company_id}": 2,
+        "/jobs/company/my-jobs": 5,
+    }
+    for path, budget in budgets.items():
+        with capture_queries() as log:
+            response = await client.get(path, headers=company_headers)
+        assert response.status_code == 200
+        log.assert_budget(budget, max_repeats=1)
+
+
+@pytest.mark.asyncio
+async def test_slow_query_log_with_plan(client: AsyncClient, monkeypatch, caplog):
+    """Test that statements over the threshold are logged with parameters and a plan."""
+    monkeypatch.setattr(settings, "slow_query_threshold_ms", 1e-6)
+    monkeypatch.setattr(settings, "query_debug", True)
+
+    with caplog.at_level(logging.WARNING, logger="app.db.diagnostics"):
+        response = await client.get("/jobs/", params={"location": "Nairobi"})
+    assert response.status_code == 200
+
+    messages = [record.getMessage() for record in caplog.records]
+    slow = [message for message in messages if "FROM jobs" in message]
+    assert slow and "Slow query" in slow[0]
+    assert "'nairobi'" in slow[0] and "Plan:" in slow[0]
+
+
+@pytest.mark.asyncio
+async def test_query_debug_middleware_reports_count(client: AsyncClient):
+    """Test the per-request statement count header of the debug middleware."""
+    async with AsyncClient(app=QueryDebugMiddleware(app), base_url="http://test") as debug_client:
+        response = await debug_client.get("/companies/")
+    assert int(response.headers["x-query-count"]) >= 1
@@ -0,0 +1,268 @@
+import csv
+import io
+import json
+from typing import List
+
+import pytest
+from httpx import AsyncClient
+
+from app.config import settings
+from app.schemas import JobOut
+from app.serialization import encode_json, share_nested
+from app.services import JobService
+from tests.conftest import StatementCounter, TestSessionLocal
+
+
+async def create_jobs(client: AsyncClient, headers: dict, count: int, **fields) -> list:
+    """Post `count` jobs and return their ids in creation order."""
+    ids = []
+    for i in range(count):
+        job = {"title": f"Job {i}", "description": "Build things", **fields}
+        response = await client.post("/jobs/", json=job, headers=headers)
+        assert response.status_code == 201
+        ids.append(response.json()["id"])
+    return ids
+
+
+@pytest.mark.asyncio
+async def test_cursor_pagination_walks_all_jobs(client: AsyncClient, company_headers: dict):
+    """Test that cursor pages cover every job exactly once, newest first."""
+    ids = await create_jobs(client, company_headers, 7)
+
+    seen, cursor = [], ""
+    while cursor is not None:
+        response = await client.get("/jobs/", params={"limit": 3, "cursor": cursor})
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page["items"]) <= 3
+        seen.extend(job["id"] for job in page["items"])
+        cursor = page["next_cursor"]
+
+    # Jobs created within the same second are tie-broken by id
+    assert seen == sorted(ids, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_offset_pagination_still_returns_list(client: AsyncClient, company_headers: dict):
+    """Test that clients without a cursor keep getting a plain list."""
+    ids = await create_jobs(client, company_headers, 3)
+
+    response = await client.get("/jobs/", params={"skip": 1, "limit": 1})
+    assert response.status_code == 200
+    assert [job["id"] for job in response.json()] == [ids[1]]
+
+
+@pytest.mark.asyncio
+async def test_company_jobs_cursor_pagination(client: AsyncClient, company_headers: dict):
+    """Test cursor pagination of the company's own jobs."""
+    ids = await create_jobs(client, company_headers, 3)
+
+    response = await client.get(
+        "/jobs/company/my-jobs", params={"limit": 2, "cursor": ""}, headers=company_headers
+    )
+    page = response.json()
+    assert [job["id"] for job in page["items"]] == [ids[2], ids[1]]
+
+    response = await client.get(
+        "/jobs/company/my-jobs",
+        params={"limit": 2, "cursor": page["next_cursor"]},
+        headers=company_headers
+    )
+    page = response.json()
+    assert [job["id"] for job in page["items"]] == [ids[0]]
+    assert page["next_cursor"] is None
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_is_rejected(client: AsyncClient):
+    """Test that a malformed cursor returns 400."""
+    response = await client.get("/jobs/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_bulk_job_upload(client: AsyncClient, company_headers: dict, monkeypatch):
+    """Test NDJSON uploads: per-line results in order, batched writes, tags attached."""
+    monkeypatch.setattr(settings, "bulk_ingest_batch_size", 2)
+    monkeypatch.setattr(settings, "bulk_ingest_max_line_bytes", 200)
+    rows = [
+        {"title": "Backend", "description": "Build APIs", "tag_names": ["Python", "go"]},
+        "{not json",
+        {"title": "Frontend", "description": "Build UIs", "job_type": "remote"},
+        "",
+        {"title": "", "description": "Missing a title"},
+        {"title": "Data", "description": "x" * 300},
+        {"title": "Platform", "description": "Run things", "tag_names": ["go"]},
+    ]
+    body = "\n".join(row if isinstance(row, str) else json.dumps(row) for row in rows)
+
+    async def chunks():
+        # Split mid-line to exercise line reassembly
+        for start in range(0, len(body), 37):
+            yield body[start:start + 37].encode()
+
+    response = await client.post("/jobs/bulk", content=chunks(), headers=company_headers)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    results = [json.loads(line) for line in response.text.splitlines()]
+
+    assert [(result["line"], result["status"]) for result in results] == [
+        (1, "created"), (2, "error"), (3, "created"), (5, "error"), (6, "error"), (7, "created")
+    ]
+    assert results[1]["errors"][0]["type"] == "json_invalid"
+    assert results[3]["errors"][0]["loc"] == ["title"]
+    assert results[4]["errors"][0]["type"] == "line_too_long"
+
+    response = await client.get("/jobs/", params={"tags": "go"})
+    jobs = {job["id"]: job for job in response.json()}
+    assert set(jobs) == {results[0]["id"], results[5]["id"]}
+    assert sorted(tag["name"] for tag in jobs[results[0]["id"]]["tags"]) == ["go", "python"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_job_upload_requires_company(client: AsyncClient):
+    """Test that anonymous uploads are rejected."""
+    response = await client.post("/jobs/bulk", content=b'{"title": "x", "description": "y"}')
+    assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_export_jobs(client: AsyncClient, company_headers: dict, monkeypatch):
+    """Test CSV and NDJSON exports, with the listing filters applied."""
+    monkeypatch.setattr(settings, "export_batch_size", 2)
+    ids = await create_jobs(client, company_headers, 3, tag_names=["python", "go"])
+    await create_jobs(client, company_headers, 2, job_type="remote")
+
+    response = await client.get(
+        "/jobs/export", params={"format": "csv", "tags": "python"}, headers=company_headers
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [int(row["id"]) for row in rows] == sorted(ids, reverse=True)
+    assert rows[0]["tags"] == "python,go"
+    assert rows[0]["company_name"] == "Hiring Company"
+
+    response = await client.get(
+        "/jobs/export", params={"format": "ndjson", "job_type": "remote"}, headers=company_headers
+    )
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == 2
+    assert {row["job_type"] for row in rows} == {"remote"}
+
+
+@pytest.mark.asyncio
+async def test_export_company_jobs(client: AsyncClient, company_headers: dict):
+    """Test that the company export only contains the company's own jobs."""
+    own = await create_jobs(client, company_headers, 2)
+    await client.post("/companies/register", json={
+        "email": "other@company.com",
+        "company_name": "Other Company",
+        "password": "testpassword123"
+    })
+    response = await client.post("/auth/company/login", data={
+        "username": "other@company.com",
+        "password": "testpassword123"
+    })
+    other_headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    await create_jobs(client, other_headers, 3)
+
+    response = await client.get(
+        "/jobs/company/my-jobs/export", params={"format": "ndjson"}, headers=company_headers
+    )
+    assert sorted(json.loads(line)["id"] for line in response.text.splitlines()) == own
+
+    response = await client.get("/jobs/export", params={"format": "ndjson"}, headers=other_headers)
+    assert len(response.text.splitlines()) == 5
+
+
+@pytest.mark.asyncio
+async def test_export_access(client: AsyncClient, company_headers: dict, monkeypatch):
+    """Test that exports need a sign-in, and only the export token lifts their limits."""
+    monkeypatch.setattr(settings, "export_max_rows", 2)
+    monkeypatch.setattr(settings, "export_token", "export-secret")
+    ids = await create_jobs(client, company_headers, 3)
+    response = await client.put(
+        f"/jobs/{ids[0]}", json={"is_active": False}, headers=company_headers
+    )
+    assert response.status_code == 200
+
+    async def exported(params: dict, headers: dict) -> List[int]:
+        response = await client.get(
+            "/jobs/export", params={"format": "ndjson", **params}, headers=headers
+        )
+        assert response.status_code == 200
+        return [json.loads(line)["id"] for line in response.text.splitlines()]
+
+    assert (await client.get("/jobs/export")).status_code == 401
+    response = await client.get("/jobs/export", headers={"X-Export-Token": "guess"})
+    assert response.status_code == 403
+
+    assert await exported({}, company_headers) == [ids[2], ids[1]]
+    assert await exported({"is_active": "false"}, company_headers) == [ids[2], ids[1]]
+
+    token = {"X-Export-Token": "export-secret"}
+    assert await exported({}, token) == [ids[2], ids[1]]
+    assert await exported({"is_active": "false"}, token) == [ids[0]]
+    monkeypatch.setattr(settings, "export_max_rows", 1)
+    assert len(await exported({}, token)) == 2
+
+
+@pytest.mark.asyncio
+async def test_summary_view(client: AsyncClient, company_headers: dict):
+    """Test that summaries truncate descriptions and embed only the company's name."""
+    job = {
+        "title": "Backend", "description": "x" * 5000, "tag_names": ["python", "sql"]
+    }
+    for _ in range(5):
+        response = await client.post("/jobs/", json=job, headers=company_headers)
+        assert response.status_code == 201
+
+    full = await client.get("/jobs/")
+    summary = await client.get("/jobs/", params={"view": "summary"})
+    assert summary.status_code == 200
+
+    item = summary.json()[0]
+    assert len(item["description"]) == settings.job_summary_description_length + 1
+    assert sorted(item["tags"]) == ["python", "sql"]
+    assert item["company"] == {"id": item["company_id"], "company_name": "Hiring Company"}
+    assert len(summary.content) * 10 < len(full.content)
+
+
+@pytest.mark.asyncio
+async def test_sparse_fieldsets(client: AsyncClient, company_headers: dict):
+    """Test that fields= returns and loads only the requested fields."""
+    ids = await create_jobs(client, company_headers, 3)
+
+    with StatementCounter() as counter:
+        response = await client.get(
+            "/jobs/", params={"fields": "id,title", "cursor": "", "limit": 2}
+        )
+    assert response.status_code == 200
+    page = response.json()
+    assert page["items"] == [
+        {"id": ids[2], "title": "Job 2"}, {"id": ids[1], "title": "Job 1"}
+    ]
+    assert page["next_cursor"]
+    assert not any("description" in statement for statement in counter.statements)
+
+    response = await client.get("/jobs/", params={"fields": "id,salary"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Unknown fields: salary"
+
+
+@pytest.mark.asyncio
+async def test_shared_company_serialization(client: AsyncClient, company_headers: dict):
+    """Test that validating a page's shared company once serializes like validating per job."""
+    ids = await create_jobs(client, company_headers, 3, tag_names=["python"])
+    company_id = (await client.get(f"/jobs/{ids[0]}")).json()["company_id"]
+
+    async with TestSessionLocal() as db:
+        jobs = await JobService.get_company_jobs(db, company_id)
+        rows = share_nested(jobs, JobOut, "company")
+        assert len({id(row["company"]) for row in rows}) == 1
+        assert encode_json(List[JobOut], rows) == encode_json(List[JobOut], jobs)
+
+    response = await client.get("/jobs/company/my-jobs", headers=company_headers)
+    assert response.content == encode_json(List[JobOut], rows)
@@ -0,0 +1,79 @@
+import re
+
+import pytest
+from httpx import AsyncClient
+
+from app.metrics import Histogram
+
+
+def sample(text: str, name: str, **labels) -> float:
+    """Value of the sample with exactly these labels in Prometheus text output."""
+    rendered = ",".join(f'{key}="{value}"' for key, value in labels.items())
+    series = f"{name}{{{rendered}}}" if labels else name
+    match = re.search(rf"^{re.escape(series)} (\S+)$", text, re.MULTILINE)
+    return float(match.group(1)) if match else 0.0
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint(client: AsyncClient, company_headers: dict):
+    """Test per-route request, latency and database metrics in Prometheus format."""
+    response = await client.post(
+        "/jobs/", json={"title": "Engineer", "description": "Build things"},
+        headers=company_headers
+    )
+    job_id = response.json()["id"]
+    before = (await client.get("/metrics")).text
+
+    await client.get(f"/jobs/{job_id}")
+    await client.get("/jobs/999999")
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    after = response.text
+
+    route = {"method": "GET", "route": "/jobs/{job_id}"}
+    for status in ("200", "404"):
+        assert sample(after, "http_requests_total", **route, status=status) == sample(
+            before, "http_requests_total", **route, status=status
+        ) + 1
+    count = sample(after, "http_request_duration_seconds_count", **route)
+    assert count == sample(before, "http_request_duration_seconds_count", **route) + 2
+    assert sample(after, "http_request_duration_seconds_bucket", **route, le="+Inf") == count
+    assert sample(after, "http_request_db_statements_total", **route) > sample(
+        before, "http_request_db_statements_total", **route
+    )
+    assert sample(after, "http_request_serialization_seconds_total", **route) > 0
+    # /metrics is itself still being served while it renders
+    assert sample(after, "http_requests_in_flight") == 1
+
+
+@pytest.mark.asyncio
+async def test_server_timing_separates_db_and_serialization(
+    client: AsyncClient, company_headers: dict
+):
+    """Test that the timing header reports database and serialization time separately."""
+    await client.post(
+        "/jobs/", json={"title": "Engineer", "description": "Build things"},
+        headers=company_headers
+    )
+
+    timing = (await client.get("/jobs/")).headers["server-timing"]
+    durations = dict(re.findall(r"([\w-]+);dur=([\d.]+)", timing))
+    assert set(durations) == {"db-pool", "db", "serialize", "app"}
+    assert float(durations["db"]) > 0 and float(durations["serialize"]) > 0
+
+
+def test_histogram_buckets_are_cumulative():
+    """Test the histogram exposition of bucket counts, sum and count."""
+    histogram = Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    labels = (("route", "/"),)
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(labels, value)
+
+    assert histogram.render()[2:] == [
+        'latency_seconds_bucket{route="/",le="0.1"} 2',
+        'latency_seconds_bucket{route="/",le="1.0"} 3',
+        'latency_seconds_bucket{route="/",le="+Inf"} 4',
+        'latency_seconds_sum{route="/"} 3.65',
+        'latency_seconds_count{route="/"} 4',
+    ]
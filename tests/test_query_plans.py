@@ -0,0 +1,107 @@
+import pytest
+from sqlalchemy import create_engine, func, select
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+
+from app.config import settings
+from app.db.diagnostics import capture_queries
+from app.db.seed import seed_database
+from app.models import Base, Job
+from app.models.job import JobLevel, JobType
+from app.schemas import JobFilter, JobSummaryOut
+from app.services import JobService
+from tests.conftest import TestSessionLocal, test_engine
+
+# Enough rows that the planner prefers an index to scanning the table when one applies
+SCALE = 20_000
+
+
+async def seed_and_analyze():
+    await seed_database(test_engine, SCALE, seed=1)
+    async with test_engine.begin() as conn:
+        await conn.exec_driver_sql("ANALYZE")
+
+
+@pytest.mark.asyncio
+async def test_job_queries_use_indexes(db_session):
+    """Test that no JobService listing query scans the whole jobs table."""
+    await seed_and_analyze()
+    async with TestSessionLocal() as db:
+        jobs = await JobService.get_jobs_with_filters(db, JobFilter(limit=20))
+        with capture_queries(explain=True) as log:
+            await JobService.get_job_by_id(db, jobs[0].id)
+            for filters in (
+                JobFilter(limit=20),
+                JobFilter(skip=200, limit=20),
+                JobFilter(tags="python,react", limit=20),
+                JobFilter(tags="python,sql", tag_mode="all", limit=20),
+                JobFilter(location="Mombasa", limit=20),
+                JobFilter(location="kenya", job_type=JobType.HYBRID, limit=20),
+                JobFilter(job_type=JobType.REMOTE, job_level=JobLevel.SENIOR, limit=20),
+                JobFilter(salary_min=500000, limit=20),
+                JobFilter(salary_min=100000, salary_max=120000, limit=20),
+            ):
+                await JobService.get_jobs_with_filters(db, filters)
+            _, cursor = await JobService.get_jobs_page(db, JobFilter(cursor="", limit=20))
+            await JobService.get_jobs_page(db, JobFilter(cursor=cursor, limit=20))
+            await JobService.get_job_summaries(
+                db, JobFilter(cursor=cursor, limit=20), list(JobSummaryOut.model_fields)
+            )
+            await JobService.get_company_jobs(db, jobs[0].company_id, limit=20)
+            _, cursor = await JobService.get_company_jobs_page(db, jobs[0].company_id, "", 20)
+            await JobService.get_company_jobs_page(db, jobs[0].company_id, cursor, 20)
+
+    assert len(log.plans) > 10
+    log.assert_no_full_scans("jobs")
+
+
+@pytest.mark.asyncio
+async def test_full_scans_are_reported(db_session):
+    """Test that a query filtering on an unindexed column is reported as a full scan."""
+    await seed_and_analyze()
+    async with TestSessionLocal() as db:
+        with capture_queries(explain=True) as log:
+            await db.execute(select(Job.id).where(Job.description == "missing"))
+
+    assert len(log.full_scans("jobs")) == 1
+    with pytest.raises(AssertionError):
+        log.assert_no_full_scans("jobs")
+
+
+# SQLite does not reflect expression indexes, so the comparison skips the salary index
+@pytest.mark.filterwarnings("ignore:Skipped unsupported reflection of expression-based index")
+def test_migrations_match_models(tmp_path, monkeypatch):
+    """Test that upgrading an empty database to head yields the models' schema."""
+    path = tmp_path / "migrated.db"
+    monkeypatch.setattr(settings, "database_url", f"sqlite+aiosqlite:///{path}")
+    config = Config()
+    config.set_main_option("script_location", "alembic")
+    command.upgrade(config, "head")
+
+    engine = create_engine(f"sqlite:///{path}")
+    with engine.connect() as conn:
+        assert compare_metadata(MigrationContext.configure(conn), Base.metadata) == []
+    engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_company_lookups_use_the_composite_index(db_session):
+    """Test that lookups by jobs.company_id use ix_jobs_company_created.
+
+    Migration 0002 dropped ix_jobs_company_id, which the company foreign key lookups
+    used, because the composite index leads with company_id.
+    """
+    await seed_and_analyze()
+    async with TestSessionLocal() as db:
+        company_id = (await db.execute(select(Job.company_id).limit(1))).scalar_one()
+        with capture_queries(explain=True) as log:
+            await db.execute(select(Job.id).where(Job.company_id == company_id))
+            await db.execute(select(func.count(Job.id)).where(Job.company_id == company_id))
+            # What deleting a company runs to cascade to its jobs
+            await db.execute(select(Job).where(Job.company_id == company_id).order_by(Job.id))
+
+    assert len(log.plans) == 3
+    for _, plan in log.plans:
+        assert "ix_jobs_company_created" in plan
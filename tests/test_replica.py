@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.cache import response_cache
+from app.config import settings
+from app.db import build_engine, database
+from app.db.routing import LAST_WRITE_COOKIE, LAST_WRITE_HEADER, READ_ONLY_KEY
+from app.main import app
+from app.models import Base, Tag
+
+
+@pytest_asyncio.fixture
+async def replica_client(db_session, tmp_path, monkeypatch):
+    """Client whose primary and replica are two SQLite files that never replicate."""
+    engines = []
+    for name in ("primary", "replica"):
+        engine = build_engine(f"sqlite+aiosqlite:///{tmp_path / name}.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        engines.append(engine)
+    primary, replica = (
+        async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        for engine in engines
+    )
+    monkeypatch.setattr(database, "async_session_maker", primary)
+    monkeypatch.setattr(database, "read_session_maker", replica)
+    monkeypatch.setattr(settings, "database_read_url", str(engines[1].url))
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        yield client
+    for engine in engines:
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_reads_go_to_replica_except_after_writes(replica_client: AsyncClient, monkeypatch):
+    """Test that a client reads its own writes from the primary for the configured window."""
+    await replica_client.post("/companies/register", json={
+        "email": "hiring@company.com",
+        "company_name": "Hiring Company",
+        "password": "testpassword123"
+    })
+    response = await replica_client.post("/auth/company/login", data={
+        "username": "hiring@company.com",
+        "password": "testpassword123"
+    })
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    monkeypatch.setattr(settings, "read_your_writes_seconds", 0.5)
+
+    response = await replica_client.post(
+        "/jobs/", json={"title": "Engineer", "description": "Build things"}, headers=headers
+    )
+    job_id = response.json()["id"]
+    marker = response.headers[LAST_WRITE_HEADER]
+    assert replica_client.cookies[LAST_WRITE_COOKIE] == marker
+
+    # The replica has not caught up: reads without the marker do not see the job yet,
+    # and the stale list is not cached for after it has
+    replica_client.cookies.clear()
+    assert (await replica_client.get(f"/jobs/{job_id}", headers=headers)).status_code == 404
+    assert (await replica_client.get("/jobs/")).json() == []
+    assert response_cache.stats()["entries"] == 0
+    forged = {LAST_WRITE_HEADER: marker[:-1] + ("0" if marker[-1] != "0" else "1")}
+    assert (await replica_client.get(f"/jobs/{job_id}", headers=forged)).status_code == 404
+
+    # The writer does, by cookie or header, in this worker or any other
+    assert (await replica_client.get(
+        f"/jobs/{job_id}", headers={LAST_WRITE_HEADER: marker}
+    )).status_code == 200
+    replica_client.cookies.set(LAST_WRITE_COOKIE, marker)
+    assert len((await replica_client.get("/jobs/")).json()) == 1
+
+    # Once the window closes the writer is back on the replica
+    await asyncio.sleep(0.6)
+    assert (await replica_client.get(f"/jobs/{job_id}")).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_read_sessions_refuse_writes(replica_client: AsyncClient):
+    """Test that a session handed out for reads cannot flush changes."""
+    async with database.read_session_maker() as session:
+        session.info[READ_ONLY_KEY] = True
+        session.add(Tag(name="python"))
+        with pytest.raises(RuntimeError):
+            await session.flush()
@@ -0,0 +1,232 @@
+import random
+from types import SimpleNamespace
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+
+from app.config import settings
+from app.models import Task
+from app.models.job import JobLevel, JobType
+from app.search import saved_search_percolator
+from app.search.percolator import JobFields, _Conditions, _Postings, _Query
+from app.search.places import parse_location
+from app.tasks import TaskWorker, enqueue
+from tests.conftest import TestSessionLocal
+from tests.test_search import post_job
+
+SEARCHES = [
+    {"name": "python", "tags": ["Python"]},
+    {"name": "python remote senior", "tags": ["python"], "job_type": "remote",
+     "job_level": "senior"},
+    {"name": "python and django", "tags": ["python", "django"], "tag_mode": "all"},
+    {"name": "react or vue", "tags": ["react", "vue"]},
+    {"name": "kenya", "location": "Kenya"},
+    {"name": "nairobi contains", "location": "nairobi", "location_match": "contains"},
+    {"name": "well paid", "salary_min": 100000},
+    {"name": "hybrid up to 80k", "job_type": "hybrid", "salary_max": 80000},
+    {"name": "everything"},
+]
+
+
+async def user_headers(client: AsyncClient, email: str = "seeker@example.com") -> dict:
+    await client.post("/users/register", json={
+        "email": email, "full_name": "Job Seeker", "password": "testpassword123"
+    })
+    response = await client.post("/auth/user/login", data={
+        "username": email, "password": "testpassword123"
+    })
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def alerted_jobs(client: AsyncClient, headers: dict) -> dict:
+    await TaskWorker().drain(TestSessionLocal)
+    response = await client.get("/saved-searches/alerts", headers=headers)
+    assert response.status_code == 200
+    alerts = {}
+    for alert in response.json():
+        alerts.setdefault(alert["saved_search_id"], set()).add(alert["job_id"])
+    return alerts
+
+
+@pytest.mark.asyncio
+async def test_alerts_match_job_filters(client: AsyncClient, company_headers: dict):
+    """Test that posted jobs alert exactly the saved searches whose filter lists them."""
+    headers = await user_headers(client)
+    await saved_search_percolator.load(TestSessionLocal)
+    searches = []
+    for search in SEARCHES:
+        response = await client.post("/saved-searches", json=search, headers=headers)
+        assert response.status_code == 201
+        searches.append(response.json())
+    assert searches[0]["tags"] == ["python"]
+
+    await post_job(client, company_headers, "Backend", tag_names=["python", "django"],
+                   job_type="remote", job_level="senior", location="Westlands, Nairobi, Kenya",
+                   salary_min=90000, salary_max=120000)
+    await post_job(client, company_headers, "Frontend", tag_names=["vue"], job_type="hybrid",
+                   location="Kampala, Uganda", salary_max=70000)
+    await post_job(client, company_headers, "Data", tag_names=["python", "pandas"],
+                   location="Nairobi, Kenya")
+    await post_job(client, company_headers, "Office", job_level="lead")
+    body = "\n".join([
+        '{"title": "Bulk", "description": "Build things", "tag_names": ["react", "python"]}',
+        '{"title": "Bulk", "description": "Build things", "location": "Mombasa, Kenya"}',
+    ])
+    response = await client.post("/jobs/bulk", content=body.encode(), headers=company_headers)
+    assert response.status_code == 200
+
+    alerts = await alerted_jobs(client, headers)
+    for search in searches:
+        params = {
+            key: ",".join(value) if key == "tags" else value
+            for key, value in search.items()
+            if key in ("tags", "tag_mode", "location", "location_match", "job_type",
+                       "job_level", "salary_min", "salary_max") and value
+        }
+        listed = await client.get("/jobs/", params=params)
+        expected = {job["id"] for job in listed.json()}
+        assert alerts.get(search["id"], set()) == expected, search["name"]
+
+
+@pytest.mark.asyncio
+async def test_updates_alert_new_matches_once(client: AsyncClient, company_headers: dict):
+    """Test that a job update alerts only searches it newly matches, and deletes stop alerts."""
+    headers = await user_headers(client)
+    await saved_search_percolator.load(TestSessionLocal)
+    remote = (await client.post("/saved-searches", json={
+        "name": "remote go", "tags": ["go"], "job_type": "remote"
+    }, headers=headers)).json()
+    go = (await client.post("/saved-searches", json={
+        "name": "go", "tags": ["go"]
+    }, headers=headers)).json()
+
+    job = await post_job(client, company_headers, "Go Engineer", tag_names=["go"])
+    assert await alerted_jobs(client, headers) == {go["id"]: {job["id"]}}
+
+    async def update(**fields):
+        response = await client.put(f"/jobs/{job['id']}", json=fields, headers=company_headers)
+        assert response.status_code == 200
+
+    await update(job_type="remote")
+    await update(description="Still remote")
+    async with TestSessionLocal() as db:
+        queued = (await db.execute(select(Task.payload))).scalars().all()
+    assert [payload["matches"] for payload in queued[1:]] == [[[job["id"], [remote["id"]]]]]
+    await update(is_active=False)
+    await update(is_active=True)
+    assert await alerted_jobs(client, headers) == {
+        go["id"]: {job["id"]}, remote["id"]: {job["id"]}
+    }
+
+    response = await client.delete(f"/saved-searches/{go['id']}", headers=headers)
+    assert response.status_code == 204
+    await post_job(client, company_headers, "Go Engineer", tag_names=["go"])
+    assert await alerted_jobs(client, headers) == {remote["id"]: {job["id"]}}
+
+
+@pytest.mark.asyncio
+async def test_jobs_written_while_loading_are_matched_in_sql(
+    client: AsyncClient, company_headers: dict
+):
+    """Test that the alert task matches jobs the percolator could not, and skips others."""
+    headers = await user_headers(client)
+    await client.post("/saved-searches", json={
+        "name": "senior", "job_level": "senior", "location": "Kenya"
+    }, headers=headers)
+    senior = await post_job(client, company_headers, "Lead", job_level="senior",
+                            location="Nairobi, Kenya")
+    await post_job(client, company_headers, "Junior", job_level="entry", location="Kenya")
+    # Without the percolator no alerts are queued
+    assert await alerted_jobs(client, headers) == {}
+
+    async with TestSessionLocal() as db:
+        enqueue(db, "saved_searches.alert", {"matches": [], "job_ids": [senior["id"], 1, 2]})
+        await db.commit()
+    alerts = await alerted_jobs(client, headers)
+    assert list(alerts.values()) == [{senior["id"]}]
+
+
+@pytest.mark.asyncio
+async def test_saved_searches_are_per_user(
+    client: AsyncClient, company_headers: dict, monkeypatch
+):
+    """Test ownership, the per-user limit, and that companies cannot save searches."""
+    monkeypatch.setattr(settings, "saved_searches_per_user_max", 1)
+    headers = await user_headers(client)
+    other = await user_headers(client, "other@example.com")
+    created = await client.post("/saved-searches", json={"name": "any"}, headers=headers)
+    assert created.status_code == 201
+    response = await client.post("/saved-searches", json={"name": "more"}, headers=headers)
+    assert response.status_code == 400
+
+    assert (await client.get("/saved-searches", headers=other)).json() == []
+    response = await client.delete(f"/saved-searches/{created.json()['id']}", headers=other)
+    assert response.status_code == 404
+    response = await client.get("/saved-searches", headers=company_headers)
+    assert response.status_code == 403
+
+
+def test_postings_match_like_a_full_scan():
+    """Test that posting lookups find the same searches as checking every search."""
+    rng = random.Random(7)
+    tags = ["python", "go", "react", "sql", "rust"]
+    locations = [
+        None, "Kenya", "Nairobi, Kenya", "Kampala, Uganda", "Mombasa, Kenya", "nairobi",
+        "Nakuru, Rift Valley, Kenya", "Rift Valley, Kenya", "Westlands, Nairobi, Kenya",
+    ]
+    postings = _Postings()
+    queries = []
+    for search_id in range(2000):
+        query = _Query(SimpleNamespace(
+            id=search_id,
+            tags=rng.sample(tags, rng.choice([0, 0, 1, 1, 2, 3])),
+            tag_mode=rng.choice(["any", "all"]),
+            location=rng.choice(locations),
+            location_match=rng.choice(["place", "place", "contains"]),
+            job_type=rng.choice([None, *JobType]),
+            job_level=rng.choice([None, None, *JobLevel]),
+            salary_min=rng.choice([None, None, 50000, 120000, 600000]),
+            salary_max=rng.choice([None, None, 150000, 40000]),
+        ))
+        postings.add(query)
+        queries.append(query)
+    for query in queries[::3]:
+        postings.remove(query.id)
+    remaining = [query for query in queries if query.id % 3]
+
+    for _ in range(200):
+        fields = JobFields(
+            frozenset(rng.sample(tags, rng.randint(0, 3))), rng.choice(list(JobType)),
+            rng.choice(list(JobLevel)), rng.choice(locations),
+            rng.choice([None, 40000, 100000]), rng.choice([None, 30000, 200000, 900000]),
+        )
+        place = parse_location(fields.location)
+        expected = {query.id for query in remaining if query.matches(fields, place)}
+        assert postings.match(fields) == expected
+
+
+def test_open_searches_are_filed_by_place_and_salary(monkeypatch):
+    """Test that searches without tags, type or level are not all checked against each job."""
+    def search(search_id: int, **fields) -> _Query:
+        return _Query(SimpleNamespace(**{
+            "id": search_id, "tags": [], "tag_mode": "any", "location": None,
+            "location_match": "place", "job_type": None, "job_level": None,
+            "salary_min": None, "salary_max": None, **fields,
+        }))
+
+    postings = _Postings()
+    for i in range(1000):
+        postings.add(search(i, location=f"City {i}, Kenya"))
+        postings.add(search(1000 + i, salary_min=1000 * i))
+    postings.add(search(2000, location="Kenya"))
+
+    checked = []
+    accepts = _Conditions.accepts
+    monkeypatch.setattr(
+        _Conditions, "accepts",
+        lambda self, fields, place: checked.append(self) or accepts(self, fields, place)
+    )
+    fields = JobFields(frozenset(), JobType.REMOTE, JobLevel.MID, "City 7, Kenya", 10000, 20000)
+    assert postings.match(fields) == {7, 2000, *range(1000, 1021)}
+    assert len(checked) < 100
@@ -0,0 +1,331 @@
+import json
+
+import pytest
+from httpx import AsyncClient
+
+from app.cache import response_cache
+from app.search import Bitmap, job_read_model, tag_index
+from tests.conftest import StatementCounter, TestSessionLocal
+
+
+async def post_job(client: AsyncClient, headers: dict, title: str, **fields) -> dict:
+    job = {"title": title, "description": "Build things", **fields}
+    response = await client.post("/jobs/", json=job, headers=headers)
+    assert response.status_code == 201
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_read_model_matches_sql(client: AsyncClient, company_headers: dict):
+    """Test that the read model returns what SQL returns, without querying the database."""
+    await post_job(client, company_headers, "Backend", tag_names=["python", "django"],
+                   job_type="remote", location="Nairobi, Kenya")
+    await post_job(client, company_headers, "Frontend", tag_names=["react"], job_level="senior")
+    await post_job(client, company_headers, "Data", tag_names=["python"], job_type="remote")
+
+    queries = [
+        {}, {"tags": "python"}, {"tags": "python,react"}, {"job_type": "remote"},
+        {"location": "kenya"}, {"job_level": "senior", "tags": "python"}, {"skip": 1, "limit": 1},
+        {"tags": "python,django", "tag_mode": "all"}, {"view": "summary", "tags": "python"},
+        {"fields": "id,tags,company", "cursor": "", "limit": 2},
+    ]
+    expected = [(await client.get("/jobs/", params=params)).json() for params in queries]
+
+    await tag_index.load(TestSessionLocal)
+    await job_read_model.load(TestSessionLocal)
+    # Make the second round reach the read model instead of cached responses
+    response_cache.clear()
+    with StatementCounter() as counter:
+        actual = [(await client.get("/jobs/", params=params)).json() for params in queries]
+
+    assert actual == expected
+    assert counter.count == 0
+
+
+@pytest.mark.asyncio
+async def test_read_model_follows_writes(client: AsyncClient, company_headers: dict):
+    """Test that creates, updates and deletes are reflected incrementally."""
+    await tag_index.load(TestSessionLocal)
+    await job_read_model.load(TestSessionLocal)
+    first = await post_job(client, company_headers, "First", tag_names=["go"])
+    second = await post_job(client, company_headers, "Second", tag_names=["go"])
+
+    await client.put(f"/jobs/{first['id']}", json={"is_active": False}, headers=company_headers)
+    response = await client.get("/jobs/", params={"tags": "go"})
+    assert [job["id"] for job in response.json()] == [second["id"]]
+
+    await client.delete(f"/jobs/{second['id']}", headers=company_headers)
+    response = await client.get("/jobs/", params={"tags": "go"})
+    assert response.json() == []
+
+    # Inactive listings are not indexed, so this falls back to SQL
+    response = await client.get("/jobs/", params={"is_active": False})
+    assert [job["id"] for job in response.json()] == [first["id"]]
+
+
+@pytest.mark.asyncio
+async def test_read_model_cursor_pages(client: AsyncClient, company_headers: dict):
+    """Test cursor pagination served from the read model."""
+    ids = [(await post_job(client, company_headers, f"Job {i}"))["id"] for i in range(5)]
+    await job_read_model.load(TestSessionLocal)
+
+    seen, cursor = [], ""
+    while cursor is not None:
+        page = (await client.get("/jobs/", params={"limit": 2, "cursor": cursor})).json()
+        seen.extend(job["id"] for job in page["items"])
+        cursor = page["next_cursor"]
+    assert seen == sorted(ids, reverse=True)
+
+
+def test_bitmap_set_operations():
+    """Test bitmap algebra across sparse and dense chunks."""
+    sparse = set(range(0, 200000, 97))
+    dense = set(range(60000, 140000))
+    left, right = Bitmap(sparse), Bitmap(dense)
+
+    assert set(left & right) == sparse & dense
+    assert set(left | right) == sparse | dense
+    assert left.intersection_len(right) == len(sparse & dense)
+    assert len(Bitmap.intersection([left, right, Bitmap([97 * 700])])) == 1
+
+    # Mutations must not be hidden by the bit form cached for the sparse side
+    left.add(60001)
+    left.discard(97 * 700)
+    assert left.intersection_len(right) == len(sparse & dense)
+    assert set(left & right) == (sparse & dense) - {97 * 700} | {60001}
+
+    for value in range(60000, 139000):
+        right.discard(value)
+    assert set(right) == set(range(139000, 140000))
+    assert 139500 in right and 100 not in right
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("indexed", [False, True])
+async def test_tag_mode_all(client: AsyncClient, company_headers: dict, indexed: bool):
+    """Test any/all tag matching with and without the bitmap index."""
+    both = await post_job(client, company_headers, "Both", tag_names=["python", "django"])
+    python = await post_job(client, company_headers, "Python", tag_names=["python"])
+    await post_job(client, company_headers, "Other", tag_names=["rust"])
+    if indexed:
+        await tag_index.load(TestSessionLocal)
+
+    response = await client.get("/jobs/", params={"tags": "python,django", "tag_mode": "all"})
+    assert [job["id"] for job in response.json()] == [both["id"]]
+
+    response = await client.get("/jobs/", params={"tags": "python,django"})
+    assert [job["id"] for job in response.json()] == [python["id"], both["id"]]
+
+    response = await client.get("/jobs/", params={"tags": "python,missing", "tag_mode": "all"})
+    assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_multi_tag_pages_are_full(client: AsyncClient, company_headers: dict):
+    """Test that jobs matching several tags are not counted twice against the limit."""
+    for i in range(3):
+        await post_job(client, company_headers, f"Job {i}", tag_names=["python", "django"])
+
+    response = await client.get("/jobs/", params={"tags": "python,django", "limit": 2})
+    assert len(response.json()) == 2
+
+
+@pytest.mark.asyncio
+async def test_job_facets(client: AsyncClient, company_headers: dict):
+    """Test facet counts, each ignoring its own filter, from SQL and the read model alike."""
+    await post_job(client, company_headers, "Backend", tag_names=["python", "django"],
+                   job_type="remote", location="Nairobi", salary_min=60000, salary_max=110000)
+    await post_job(client, company_headers, "Data", tag_names=["python"], job_type="remote",
+                   location="Nairobi", salary_min=40000)
+    await post_job(client, company_headers, "Frontend", tag_names=["react"],
+                   location="Lagos", salary_max=700000)
+
+    queries = [{}, {"job_type": "remote"}, {"tags": "python", "location": "nairobi"}]
+    expected = [(await client.get("/jobs/facets", params=params)).json() for params in queries]
+
+    everything, remote, python = expected
+    assert everything["total"] == 3
+    assert everything["tags"][0] == {"value": "python", "count": 2}
+    assert [bucket["count"] for bucket in everything["salary"]][:3] == [1, 1, 1]
+    assert everything["salary"][-1] == {"min": 450000, "max": None, "count": 1}
+    assert remote["total"] == 2
+    job_types = {facet["value"]: facet["count"] for facet in remote["job_type"]}
+    assert job_types["remote"] == 2 and job_types["onsite"] == 1
+    assert python["total"] == 2
+    assert python["locations"] == [{"value": "Nairobi", "count": 2}]
+    assert {facet["value"] for facet in python["tags"]} == {"python", "django"}
+
+    await tag_index.load(TestSessionLocal)
+    await job_read_model.load(TestSessionLocal)
+    with StatementCounter() as counter:
+        actual = [(await client.get("/jobs/facets", params=params)).json() for params in queries]
+
+    assert actual == expected
+    assert counter.count == 0
+
+
+@pytest.mark.asyncio
+async def test_location_filter(client: AsyncClient, company_headers: dict):
+    """Test place and substring location matching, from SQL and the read model alike."""
+    locations = {
+        "Nairobi": "Nairobi, Kenya", "Westlands": " westlands,  nairobi , KENYA",
+        "Nakuru": "Nakuru, Rift Valley, Kenya", "Kampala": "Kampala, Uganda",
+        "Remote": "Remote", "Unknown": None,
+    }
+    titles = {
+        (await post_job(client, company_headers, title, location=location))["id"]: title
+        for title, location in locations.items()
+    }
+    queries = [
+        {"location": "Kenya"}, {"location": "nairobi"}, {"location": "Nairobi,Kenya"},
+        {"location": "Rift Valley, Kenya"}, {"location": "Remote"}, {"location": "Ken"},
+        {"location": "Ken", "location_match": "contains"},
+        {"location": "o", "location_match": "contains", "view": "summary"},
+        {"location": "uganda"}, {"location": "Kampala, Kenya"},
+    ]
+    expected = [(await client.get("/jobs/", params=params)).json() for params in queries]
+    assert [{titles[job["id"]] for job in jobs} for jobs in expected] == [
+        {"Nairobi", "Westlands", "Nakuru"}, {"Nairobi", "Westlands"}, {"Nairobi", "Westlands"},
+        {"Nakuru"}, {"Remote"}, set(), {"Nairobi", "Westlands", "Nakuru"},
+        {"Nairobi", "Westlands", "Remote"}, {"Kampala"}, set(),
+    ]
+
+    await job_read_model.load(TestSessionLocal)
+    response_cache.clear()
+    with StatementCounter() as counter:
+        actual = [(await client.get("/jobs/", params=params)).json() for params in queries]
+    assert actual == expected
+    assert counter.count == 0
+
+
+@pytest.mark.asyncio
+async def test_location_facets_count_places(client: AsyncClient, company_headers: dict):
+    """Test that location facets count canonical places, like the location filter does."""
+    for location in ["Nairobi, Kenya", " nairobi ,KENYA", "Kampala, Uganda", "  "]:
+        await post_job(client, company_headers, "Engineer", location=location)
+
+    expected = (await client.get("/jobs/facets")).json()["locations"]
+    assert expected == [
+        {"value": "Nairobi, Kenya", "count": 2}, {"value": "Kampala, Uganda", "count": 1}
+    ]
+    for facet in expected:
+        jobs = (await client.get("/jobs/", params={"location": facet["value"]})).json()
+        assert len(jobs) == facet["count"]
+
+    await tag_index.load(TestSessionLocal)
+    await job_read_model.load(TestSessionLocal)
+    response_cache.clear()
+    assert (await client.get("/jobs/facets")).json()["locations"] == expected
+
+
+async def post_salaried_jobs(client: AsyncClient, headers: dict) -> dict:
+    ranges = {
+        "Band": {"salary_min": 60000, "salary_max": 110000},
+        "Floor": {"salary_min": 40000},
+        "Ceiling": {"salary_max": 700000},
+        "Unpaid": {},
+        "Senior": {"salary_min": 120000, "salary_max": 200000},
+    }
+    return {
+        (await post_job(client, headers, title, **salary))["id"]: title
+        for title, salary in ranges.items()
+    }
+
+
+@pytest.mark.asyncio
+async def test_salary_range_filter(client: AsyncClient, company_headers: dict):
+    """Test that salary filters match overlapping ranges, from SQL and the read model alike."""
+    titles = await post_salaried_jobs(client, company_headers)
+    queries = [
+        {"salary_min": 100000}, {"salary_max": 50000},
+        {"salary_min": 100000, "salary_max": 115000}, {"salary_min": 1000000},
+        {"salary_min": 150000, "view": "summary"},
+    ]
+    expected = [(await client.get("/jobs/", params=params)).json() for params in queries]
+    assert [{titles[job["id"]] for job in jobs} for jobs in expected] == [
+        {"Band", "Ceiling", "Senior"}, {"Floor"}, {"Band"}, set(), {"Ceiling", "Senior"},
+    ]
+
+    await tag_index.load(TestSessionLocal)
+    await job_read_model.load(TestSessionLocal)
+    response_cache.clear()
+    with StatementCounter() as counter:
+        actual = [(await client.get("/jobs/", params=params)).json() for params in queries]
+    assert actual == expected
+    assert counter.count == 0
+
+    response = await client.get("/jobs/", params={"salary_min": 2, "salary_max": 1})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_inverted_salary_ranges_are_rejected(client: AsyncClient, company_headers: dict):
+    """Test that jobs cannot be posted or updated with salary_min above salary_max."""
+    job = {"title": "Inverted", "description": "Build things"}
+    response = await client.post(
+        "/jobs/", json={**job, "salary_min": 90000, "salary_max": 60000}, headers=company_headers
+    )
+    assert response.status_code == 422
+
+    created = await post_job(client, company_headers, "Band", salary_min=60000, salary_max=90000)
+    for update, status_code in [
+        ({"salary_min": 100000}, 400), ({"salary_max": 50000}, 400),
+        ({"salary_min": 100000, "salary_max": 50000}, 422),
+        ({"salary_min": 100000, "salary_max": 150000}, 200),
+    ]:
+        response = await client.put(
+            f"/jobs/{created['id']}", json=update, headers=company_headers
+        )
+        assert response.status_code == status_code, update
+
+    body = json.dumps({**job, "salary_min": 2, "salary_max": 1}).encode()
+    response = await client.post("/jobs/bulk", content=body, headers=company_headers)
+    assert json.loads(response.text.splitlines()[0])["status"] == "error"
+
+
+@pytest.mark.asyncio
+async def test_salary_histogram(client: AsyncClient, company_headers: dict):
+    """Test salary histograms with every filter applied, from SQL and the read model alike."""
+    await post_salaried_jobs(client, company_headers)
+    queries = [{}, {"salary_min": 100000}, {"is_active": False}]
+    expected = [
+        (await client.get("/jobs/salary-histogram", params=params)).json() for params in queries
+    ]
+
+    everything, paid_well, inactive = expected
+    assert (everything["total"], everything["with_salary"]) == (5, 4)
+    assert everything["bucket_size"] == 50000
+    assert [bucket["count"] for bucket in everything["buckets"]] == [1, 1, 2, 1, 1, 0, 0, 0, 0, 1]
+    assert everything["buckets"][-1] == {"min": 450000, "max": None, "count": 1}
+    assert (paid_well["total"], paid_well["with_salary"]) == (3, 3)
+    assert [bucket["count"] for bucket in paid_well["buckets"]][:3] == [0, 1, 2]
+    assert inactive["total"] == 0
+
+    await tag_index.load(TestSessionLocal)
+    await job_read_model.load(TestSessionLocal)
+    with StatementCounter() as counter:
+        actual = [
+            (await client.get("/jobs/salary-histogram", params=params)).json()
+            for params in queries[:2]
+        ]
+    assert actual == expected[:2]
+    assert counter.count == 0
+
+
+@pytest.mark.asyncio
+async def test_read_model_follows_bulk_uploads(client: AsyncClient, company_headers: dict):
+    """Test that bulk-created jobs are added to the tag index and read model."""
+    await tag_index.load(TestSessionLocal)
+    await job_read_model.load(TestSessionLocal)
+    body = "\n".join(
+        json.dumps({"title": f"Job {i}", "description": "Build things", "tag_names": ["go"]})
+        for i in range(3)
+    )
+    response = await client.post("/jobs/bulk", content=body.encode(), headers=company_headers)
+    ids = [json.loads(line)["id"] for line in response.text.splitlines()]
+
+    with StatementCounter() as counter:
+        response = await client.get("/jobs/", params={"tags": "go"})
+    assert [job["id"] for job in response.json()] == sorted(ids, reverse=True)
+    assert response.json()[0]["company"]["company_name"] == "Hiring Company"
+    assert counter.count == 0
@@ -0,0 +1,60 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+
+from app.db.seed import SEED_PASSWORD, company_email, seed_database
+from app.models import Base, Job, job_tags_table
+from tests.conftest import test_engine
+
+
+async def job_rows():
+    async with test_engine.connect() as conn:
+        rows = await conn.execute(
+            select(
+                Job.title, Job.company_id, Job.location, Job.salary_min, Job.is_active,
+                Job.created_at
+            ).order_by(Job.id)
+        )
+        return rows.all()
+
+
+@pytest.mark.asyncio
+async def test_seed_database(client: AsyncClient):
+    """Test that seeding fills an empty database with skewed, usable data."""
+    counts = await seed_database(test_engine, 400, seed=3, batch_size=150)
+    assert counts["jobs"] == 400
+    assert counts["companies"] == 20
+
+    async with test_engine.connect() as conn:
+        per_company = (await conn.execute(
+            select(func.count(Job.id)).group_by(Job.company_id).order_by(func.count().desc())
+        )).scalars().all()
+        links = (await conn.execute(select(func.count()).select_from(job_tags_table))).scalar()
+    assert sum(per_company) == 400
+    # The largest employer posts several times the median company's share
+    assert per_company[0] > 5 * per_company[len(per_company) // 2]
+    assert 400 * 2 < links < 400 * 7
+
+    response = await client.post("/auth/company/login", data={
+        "username": company_email(10),
+        "password": SEED_PASSWORD
+    })
+    assert response.status_code == 200
+    response = await client.get("/jobs/", params={"tags": "python", "limit": 5})
+    assert response.status_code == 200
+    assert all("python" in [tag["name"] for tag in job["tags"]] for job in response.json())
+
+    with pytest.raises(RuntimeError):
+        await seed_database(test_engine, 10)
+
+
+@pytest.mark.asyncio
+async def test_seed_database_is_deterministic(db_session):
+    """Test that the same seed produces the same rows."""
+    await seed_database(test_engine, 120, seed=5)
+    first = await job_rows()
+
+    async with test_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await seed_database(test_engine, 120, seed=5)
+    assert await job_rows() == first
@@ -0,0 +1,99 @@
+import pytest
+from httpx import AsyncClient
+
+from app.search import suggest_index
+from app.search.suggest import CACHE_MIN_MATCHES, CACHED_RANKING, _PrefixIndex
+from tests.conftest import StatementCounter, TestSessionLocal
+from tests.test_search import post_job
+
+
+async def suggest(client: AsyncClient, q: str, **params) -> dict:
+    response = await client.get("/suggest", params={"q": q, **params})
+    assert response.status_code == 200
+    return response.json()
+
+
+def values(suggestions: list) -> list:
+    return [(suggestion["value"], suggestion["count"]) for suggestion in suggestions]
+
+
+@pytest.mark.asyncio
+async def test_suggest_ranks_by_popularity(client: AsyncClient, company_headers: dict):
+    """Test word-prefix suggestions of every kind, most active jobs first, from memory."""
+    response = await client.get("/suggest", params={"q": "dev"})
+    assert response.status_code == 503
+
+    for location in ("Nairobi, Kenya", "Nakuru, Rift Valley, Kenya"):
+        await post_job(client, company_headers, "Backend Developer",
+                       tag_names=["python", "django"], location=location)
+    await post_job(client, company_headers, "Frontend developer", tag_names=["react"],
+                   location="Kampala, Uganda")
+    await post_job(client, company_headers, "Data Scientist", tag_names=["python", "pandas"])
+    await suggest_index.load(TestSessionLocal)
+
+    with StatementCounter() as counter:
+        dev = await suggest(client, "DEV")
+        python = await suggest(client, "py")
+        kenya = await suggest(client, "ke")
+        hiring = await suggest(client, "hir")
+        backend = await suggest(client, "backend  d", limit=1)
+    assert counter.count == 0
+
+    assert values(dev["titles"]) == [("Backend Developer", 2), ("Frontend developer", 1)]
+    assert values(python["tags"]) == [("python", 3)]
+    assert values(kenya["locations"]) == [
+        ("Kenya", 2), ("Nairobi, Kenya", 1), ("Nakuru, Rift Valley, Kenya", 1),
+        ("Rift Valley, Kenya", 1),
+    ]
+    assert hiring["companies"][0]["value"] == "Hiring Company"
+    assert hiring["companies"][0]["count"] == 4
+    assert values(backend["titles"]) == [("Backend Developer", 2)]
+    assert backend["tags"] == backend["companies"] == backend["locations"] == []
+
+
+@pytest.mark.asyncio
+async def test_suggest_follows_writes(client: AsyncClient, company_headers: dict):
+    """Test that job and company writes update suggestions incrementally."""
+    await suggest_index.load(TestSessionLocal)
+    first = await post_job(client, company_headers, "Go Engineer", tag_names=["go"])
+    await post_job(client, company_headers, "Go Engineer", tag_names=["go", "grpc"])
+    assert values((await suggest(client, "go"))["titles"]) == [("Go Engineer", 2)]
+
+    await client.put(f"/jobs/{first['id']}", json={"title": "Gopher"}, headers=company_headers)
+    go = await suggest(client, "go")
+    assert values(go["titles"]) == [("Go Engineer", 1), ("Gopher", 1)]
+
+    await client.put(f"/jobs/{first['id']}", json={"is_active": False}, headers=company_headers)
+    go = await suggest(client, "go")
+    assert values(go["titles"]) == [("Go Engineer", 1)]
+    assert values(go["tags"]) == [("go", 1)]
+
+    await client.put("/companies/me", json={"company_name": "Renamed"}, headers=company_headers)
+    assert (await suggest(client, "hir"))["companies"] == []
+    assert values((await suggest(client, "ren"))["companies"]) == [("Renamed", 1)]
+
+    response = await client.get("/jobs/", params={"tags": "grpc"})
+    await client.delete(f"/jobs/{response.json()[0]['id']}", headers=company_headers)
+    assert await suggest(client, "g") == {
+        "titles": [], "tags": [], "companies": [], "locations": []
+    }
+
+
+def test_cached_rankings_follow_demotions(monkeypatch):
+    """Test that demotions re-rank a cached prefix in place until it runs out of names."""
+    index = _PrefixIndex()
+    index.load({f"name {i}": (f"Name {i}", 100 + i) for i in range(CACHE_MIN_MATCHES)})
+    assert [name for _, name, _ in index.top("n", 3)] == ["Name 255", "Name 254", "Name 253"]
+
+    rank = index._rank
+    rescans = []
+    monkeypatch.setattr(index, "_rank", lambda prefix: rescans.append(prefix) or rank(prefix))
+    index.add("name 255", "Name 255", -150)
+    assert [name for _, name, _ in index.top("n", 3)] == ["Name 254", "Name 253", "Name 252"]
+    assert rescans == []
+
+    # Once every cached name has dropped below the best one left out, the range is walked
+    for i in range(255, 255 - CACHED_RANKING, -1):
+        index.add(f"name {i}", f"Name {i}", -index.counts[f"name {i}"] + 1)
+    assert [name for _, name, _ in index.top("n", 3)] == ["Name 215", "Name 214", "Name 213"]
+    assert rescans == ["n"]
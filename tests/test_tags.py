@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.models import Base, Tag
+from app.services import TagService
+from app.services.tag_service import tag_id_cache
+from tests.conftest import StatementCounter
+
+
+@pytest.mark.asyncio
+async def test_tags_created_concurrently(tmp_path):
+    """Test that many requests creating the same new tags end up sharing one row each."""
+    # A file database, so that each session gets its own connection and transaction
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'tags.db'}")
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async def create(names):
+        async with session_maker() as session:
+            tags = await TagService.get_or_create_tags(session, names)
+            await session.commit()
+            return {tag.name: tag.id for tag in tags}
+
+    try:
+        results = await asyncio.gather(*[
+            create(["Python", "rust ", "go", "python"] if i % 2 else ["go", "Rust", "elixir"])
+            for i in range(20)
+        ])
+        async with session_maker() as session:
+            rows = dict((await session.execute(select(Tag.name, Tag.id))).all())
+    finally:
+        await engine.dispose()
+        tag_id_cache.clear()
+
+    assert set(rows) == {"python", "rust", "go", "elixir"}
+    for result in results:
+        assert result == {name: rows[name] for name in result}
+
+
+@pytest.mark.asyncio
+async def test_job_tags_resolved_in_bulk(client: AsyncClient, company_headers: dict, db_session):
+    """Test that a job's tags cost a fixed number of statements, and none once cached."""
+    tag_names = [f"tag-{i}" for i in range(10)]
+    job = {"title": "Engineer", "description": "Build things", "tag_names": tag_names}
+    # Authenticate once so that the company is cached for both measured requests
+    await client.get("/jobs/company/my-jobs", headers=company_headers)
+
+    with StatementCounter() as first:
+        response = await client.post("/jobs/", json=job, headers=company_headers)
+    assert response.status_code == 201
+    assert sorted(tag["name"] for tag in response.json()["tags"]) == sorted(tag_names)
+
+    with StatementCounter() as second:
+        response = await client.post("/jobs/", json=job, headers=company_headers)
+    assert response.status_code == 201
+    # The tag lookup and insert are skipped once the ids are cached
+    assert second.count == first.count - 2
+
+    tag_count = await db_session.scalar(select(func.count(Tag.id)))
+    assert tag_count == 10
@@ -0,0 +1,157 @@
+import asyncio
+import json
+from datetime import timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, update
+
+from app.config import settings
+from app.models import Task
+from app.models.task import TaskStatus
+from app.tasks import TaskWorker, enqueue, task
+from app.tasks.queue import claim_tasks, complete_task, utcnow
+from tests.conftest import TestSessionLocal
+
+calls = []
+running = {"now": 0, "most": 0}
+
+
+@task("tests.record", concurrency=2)
+async def record(db, payload):
+    running["now"] += 1
+    running["most"] = max(running["most"], running["now"])
+    await asyncio.sleep(0.01)
+    running["now"] -= 1
+    calls.append(payload["n"])
+
+
+@task("tests.fail", max_attempts=2)
+async def fail(db, payload):
+    raise RuntimeError("boom")
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+    running.update(now=0, most=0)
+
+
+async def tasks_by_status():
+    async with TestSessionLocal() as db:
+        rows = await db.execute(select(Task.name, Task.status, Task.attempts).order_by(Task.id))
+        return rows.all()
+
+
+@pytest.mark.asyncio
+async def test_tasks_run_after_commit(db_session):
+    """Test that committed tasks run within their type's concurrency and rollbacks queue nothing."""
+    for n in range(5):
+        enqueue(db_session, "tests.record", {"n": n})
+    await db_session.commit()
+    enqueue(db_session, "tests.record", {"n": 99})
+    await db_session.rollback()
+    with pytest.raises(ValueError):
+        enqueue(db_session, "tests.missing")
+
+    await TaskWorker(concurrency=4).drain(TestSessionLocal)
+    assert sorted(calls) == [0, 1, 2, 3, 4]
+    assert running["most"] == 2
+    assert {status for _, status, _ in await tasks_by_status()} == {TaskStatus.DONE}
+
+
+@pytest.mark.asyncio
+async def test_failed_tasks_retry_with_backoff(db_session, monkeypatch):
+    """Test that failures are retried after a delay until attempts run out."""
+    monkeypatch.setattr(settings, "task_retry_base_seconds", 60)
+    enqueue(db_session, "tests.fail")
+    await db_session.commit()
+    worker = TaskWorker()
+
+    await worker.drain(TestSessionLocal)
+    async with TestSessionLocal() as db:
+        failed = (await db.execute(select(Task))).scalar_one()
+    assert (failed.status, failed.attempts) == (TaskStatus.PENDING, 1)
+    assert "RuntimeError: boom" in failed.last_error
+    assert timedelta(seconds=29) < failed.run_at.replace(tzinfo=None) - utcnow().replace(
+        tzinfo=None
+    ) <= timedelta(seconds=60)
+
+    # Not due yet, then due
+    await worker.drain(TestSessionLocal)
+    assert await tasks_by_status() == [("tests.fail", TaskStatus.PENDING, 1)]
+    async with TestSessionLocal() as db:
+        await db.execute(update(Task).values(run_at=utcnow()))
+        await db.commit()
+    await worker.drain(TestSessionLocal)
+    assert await tasks_by_status() == [("tests.fail", TaskStatus.FAILED, 2)]
+    assert worker.failed == 2
+
+
+@pytest.mark.asyncio
+async def test_claims_are_exclusive_until_the_lease_lapses(db_session):
+    """Test that workers claim disjoint tasks and take over lapsed leases."""
+    for n in range(3):
+        enqueue(db_session, "tests.record", {"n": n})
+    await db_session.commit()
+
+    async def claim(worker_id):
+        async with TestSessionLocal() as db:
+            return await claim_tasks(db, {"tests.record": 2}, worker_id)
+
+    first = await claim("first")
+    second = await claim("second")
+    assert len(first) == 2 and len(second) == 1
+    assert not {task.id for task in first} & {task.id for task in second}
+    assert await claim("third") == []
+
+    await db_session.execute(
+        update(Task).where(Task.id == first[0].id)
+        .values(locked_until=utcnow() - timedelta(seconds=1))
+    )
+    await db_session.commit()
+    taken_over = await claim("third")
+    assert [(task.id, task.attempts) for task in taken_over] == [(first[0].id, 2)]
+
+    # The first worker's late completion does not overwrite the new attempt
+    async with TestSessionLocal() as db:
+        await complete_task(db, first[0], "first")
+        await complete_task(db, first[1], "first")
+    statuses = [status for _, status, _ in await tasks_by_status()]
+    assert statuses.count(TaskStatus.DONE) == 1
+
+
+@pytest.mark.asyncio
+async def test_stopping_worker_requeues_unfinished_tasks(db_session):
+    """Test that a stopping worker returns tasks it could not finish."""
+    started = asyncio.Event()
+
+    @task("tests.slow")
+    async def slow(db, payload):
+        started.set()
+        await asyncio.sleep(60)
+
+    enqueue(db_session, "tests.slow")
+    await db_session.commit()
+    worker = TaskWorker()
+    worker.start(TestSessionLocal)
+    await asyncio.wait_for(started.wait(), timeout=5)
+    await worker.stop(TestSessionLocal, grace_seconds=0.01)
+    assert await tasks_by_status() == [("tests.slow", TaskStatus.PENDING, 0)]
+
+
+@pytest.mark.asyncio
+async def test_large_bulk_upload_queues_analyze(
+    client: AsyncClient, company_headers: dict, monkeypatch
+):
+    """Test that a bulk upload over the threshold queues a statistics refresh that runs."""
+    monkeypatch.setattr(settings, "bulk_ingest_analyze_threshold", 3)
+    body = "\n".join(
+        json.dumps({"title": f"Job {i}", "description": "Build things"}) for i in range(3)
+    )
+    response = await client.post("/jobs/bulk", content=body.encode(), headers=company_headers)
+    assert response.status_code == 200
+    assert await tasks_by_status() == [("jobs.analyze", TaskStatus.PENDING, 0)]
+
+    await TaskWorker().drain(TestSessionLocal)
+    assert await tasks_by_status() == [("jobs.analyze", TaskStatus.DONE, 1)]